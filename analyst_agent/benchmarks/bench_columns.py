@@ -0,0 +1,83 @@
+# bench_columns.py
+"""
+Memory and serialization cost of an analysed corpus: a list of ArticleAnalysis
+dataclasses vs the ArticleColumns store.
+
+Synthetic articles get fresh string objects per mention, as analyses coming
+out of the pipeline do. Memory is the tracemalloc size of the held corpus;
+serialization is `json.dumps` of the bundle dict built with `asdict` (the old
+`to_dict`) vs straight from the columns. Pattern output on both is checked equal.
+
+Usage (from the repo root):
+    python -m analyst_agent.benchmarks.bench_columns [--articles 20000]
+"""
+import argparse
+import json
+import random
+import time
+import tracemalloc
+from dataclasses import asdict
+from datetime import datetime, timedelta
+
+from analyst_agent.src.patterns import compute_patterns
+from analyst_agent.src.schema import AnalysisBundle, ArticleAnalysis, ArticleColumns
+
+def _article(i: int, rng: random.Random, n_entities: int, n_keywords: int) -> ArticleAnalysis:
+    published = (datetime(2023, 1, 1) + timedelta(hours=rng.randrange(24 * 540))).isoformat() + "Z"
+    orgs = [f"Entity {rng.randrange(n_entities)}" for _ in range(4)]
+    people = [f"Person {rng.randrange(n_entities)}" for _ in range(2)]
+    score = rng.uniform(-1, 1)
+    return ArticleAnalysis(
+        title=f"Article {i} about {orgs[0]}", url=f"https://example{i % 50}.com/{i}",
+        published=published, source=f"example{i % 50}.com", source_type="news",
+        summary=" ".join(f"Sentence {i}.{j} mentions {orgs[j % 4]}." for j in range(3)),
+        entities={"ORG": orgs, "PERSON": people},
+        keywords=[f"keyword {rng.randrange(n_keywords)}" for _ in range(10)],
+        sentiment_score=score, sentiment_label="positive" if score > 0.05 else "neutral",
+        topic_cluster=rng.randrange(8), source_weight=0.8, extra=None,
+        entity_sentiment={orgs[0]: rng.uniform(-1, 1)},
+    )
+
+def _held(build) -> tuple:
+    tracemalloc.start()
+    held = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return held, size
+
+def _timed(fn) -> tuple:
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the columnar article store")
+    parser.add_argument("--articles", type=int, default=20000, help="Synthetic corpus size (default: 20000)")
+    parser.add_argument("--entities", type=int, default=2000, help="Distinct entity names (default: 2000)")
+    parser.add_argument("--keywords", type=int, default=5000, help="Distinct keywords (default: 5000)")
+    args = parser.parse_args()
+    n = args.articles
+
+    def articles():
+        rng = random.Random(7)
+        return (_article(i, rng, args.entities, args.keywords) for i in range(n))
+
+    as_list, list_bytes = _held(lambda: list(articles()))
+    as_columns, column_bytes = _held(lambda: ArticleColumns().extend(articles()))
+    print(f"{n} articles")
+    print(f"  memory      list {list_bytes / n:8.0f} B/article   columns {column_bytes / n:8.0f} B/article")
+
+    meta = {"query": "bench", "summary_meta": {}, "patterns": {}, "topic_map": {}}
+    old_dict = lambda: asdict(AnalysisBundle(articles=as_list, **meta))
+    old, old_s = _timed(lambda: json.dumps(old_dict(), indent=2))
+    new, new_s = _timed(lambda: json.dumps(AnalysisBundle(articles=as_columns, **meta).to_dict(), indent=2))
+    assert old == new, "column serialization differs from asdict"
+    print(f"  serialize   asdict {old_s:8.2f}s   columns {new_s:8.2f}s")
+
+    from_list, list_s = _timed(lambda: compute_patterns(as_list))
+    from_columns, columns_s = _timed(lambda: compute_patterns(as_columns))
+    assert from_list == from_columns, "patterns differ between list and columns"
+    print(f"  patterns    list {list_s:8.2f}s   columns {columns_s:8.2f}s")
+
+if __name__ == "__main__":
+    main()
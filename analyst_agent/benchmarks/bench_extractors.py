@@ -0,0 +1,73 @@
+# bench_extractors.py
+"""
+Construction vs per-document cost of the keyword and summary extractors.
+
+Times building Rake, yake.KeywordExtractor, sumy's Tokenizer and
+LexRankSummarizer on their own, then runs the corpus twice: building fresh
+objects for every article (the old behaviour) and reusing one TextEngine.
+
+Usage (from the repo root):
+    python -m analyst_agent.benchmarks.bench_extractors path/to/research.json [--articles 100]
+"""
+import argparse
+import time
+from pathlib import Path
+
+from rake_nltk import Rake
+from sumy.nlp.tokenizers import Tokenizer
+from sumy.summarizers.lex_rank import LexRankSummarizer
+
+from analyst_agent.src.engine import TextEngine, YAKE_AVAILABLE
+from analyst_agent.src.loader import load_research
+from analyst_agent.src.normalizer import normalize_text
+
+def _construct(factory, repeat: int = 20) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        factory()
+    return (time.perf_counter() - t0) / repeat
+
+def _per_doc(texts, method: str, fresh: bool) -> float:
+    engine = TextEngine()
+    t0 = time.perf_counter()
+    for text in texts:
+        if fresh:
+            engine = TextEngine()
+        engine.keywords(text, method=method)
+        engine.summarize(text)
+    return (time.perf_counter() - t0) / len(texts)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark extractor reuse")
+    parser.add_argument("research", type=Path, help="Researcher JSON/NDJSON bundle used as the text source")
+    parser.add_argument("--articles", type=int, default=100, help="Corpus size (default: 100)")
+    args = parser.parse_args()
+
+    _, articles = load_research(args.research)
+    base = [t for t in (normalize_text(a.get("text", "")) for a in articles) if t]
+    if not base:
+        print("No article text in the bundle.")
+        return
+    texts = (base * (args.articles // len(base) + 1))[:args.articles]
+
+    print("construction cost (ms per object)")
+    rows = [
+        ("Rake()", lambda: Rake()),
+        ("Tokenizer('english')", lambda: Tokenizer("english")),
+        ("LexRankSummarizer()", lambda: LexRankSummarizer()),
+    ]
+    if YAKE_AVAILABLE:
+        import yake
+        rows.append(("yake.KeywordExtractor", lambda: yake.KeywordExtractor(lan="en", top=10)))
+    for name, factory in rows:
+        print(f"  {name:<24}{1000 * _construct(factory):>8.2f}")
+
+    print(f"per-document cost over {len(texts)} articles (ms, keywords + summary)")
+    methods = ["rake"] + (["yake"] if YAKE_AVAILABLE else [])
+    for method in methods:
+        fresh = _per_doc(texts, method, fresh=True)
+        reused = _per_doc(texts, method, fresh=False)
+        print(f"  {method}: fresh objects {1000 * fresh:8.2f}   reused engine {1000 * reused:8.2f}")
+
+if __name__ == "__main__":
+    main()
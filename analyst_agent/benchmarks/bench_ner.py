@@ -0,0 +1,55 @@
+# bench_ner.py
+"""
+NER time per bundle: full pipeline per article vs batched NER-only nlp.pipe.
+
+The corpus is the article texts of a researcher bundle (JSON or NDJSON),
+repeated until it reaches --articles documents.
+
+Usage (from the repo root):
+    python -m analyst_agent.benchmarks.bench_ner path/to/research.json [--articles 200] [--n-process 1]
+"""
+import argparse
+import time
+from pathlib import Path
+
+import spacy
+
+from analyst_agent.src.entities import (
+    SPACY_MODEL, NER_BATCH_SIZE, extract_entities_batch, _collect,
+)
+from analyst_agent.src.loader import load_research
+from analyst_agent.src.normalizer import normalize_text
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched spaCy NER")
+    parser.add_argument("research", type=Path, help="Researcher JSON/NDJSON bundle used as the text source")
+    parser.add_argument("--articles", type=int, default=200, help="Corpus size (default: 200)")
+    parser.add_argument("--batch-size", type=int, default=NER_BATCH_SIZE)
+    parser.add_argument("--n-process", type=int, default=1)
+    args = parser.parse_args()
+
+    _, articles = load_research(args.research)
+    base = [normalize_text(a.get("text", "")) for a in articles]
+    base = [t for t in base if t]
+    if not base:
+        print("No article text in the bundle.")
+        return
+    texts = (base * (args.articles // len(base) + 1))[:args.articles]
+    print(f"{len(texts)} articles, {sum(map(len, texts)) / len(texts):.0f} chars on average")
+
+    full_nlp = spacy.load(SPACY_MODEL)
+    t0 = time.perf_counter()
+    legacy = [_collect(full_nlp(t)) for t in texts]
+    legacy_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    batched = extract_entities_batch(texts, batch_size=args.batch_size, n_process=args.n_process)
+    batched_s = time.perf_counter() - t0
+
+    same = sum(a == b for a, b in zip(legacy, batched))
+    print(f"full pipeline, nlp(text) per article : {legacy_s:8.2f} s")
+    print(f"NER only, nlp.pipe (batch={args.batch_size}, n_process={args.n_process}): {batched_s:8.2f} s")
+    print(f"speed-up x{legacy_s / max(batched_s, 1e-9):.1f}; identical entity sets for {same}/{len(texts)} articles")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# bench_patterns.py
+"""
+Pattern statistics on a synthetic bundle: per-article loops vs the columnar PatternTable.
+
+The loop baseline is the previous implementation, which re-parsed every date
+for the historical trend and called np.var once per entity.
+
+Usage (from the repo root):
+    python -m analyst_agent.benchmarks.bench_patterns [--articles 50000] [--entities 2000]
+"""
+import argparse
+import random
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from analyst_agent.src.patterns import (
+    analyze_temporal_trends, build_pattern_table, calculate_historical_trend, find_divergent_entities,
+)
+from analyst_agent.src.schema import ArticleAnalysis
+
+def _synthetic(n_articles: int, n_entities: int, seed: int = 7):
+    rng = random.Random(seed)
+    names = [f"Entity {i}" for i in range(n_entities)]
+    start = datetime(2023, 1, 1)
+    articles = []
+    for i in range(n_articles):
+        published = (start + timedelta(hours=rng.randrange(24 * 540))).isoformat() + "Z"
+        articles.append(ArticleAnalysis(
+            title=f"Article {i}", url=f"https://example.com/{i}",
+            published=published if rng.random() > 0.05 else None,
+            source="example.com", source_type="news", summary="",
+            entities={"ORG": rng.sample(names, 4), "PERSON": rng.sample(names, 2)},
+            keywords=[], sentiment_score=rng.uniform(-1, 1), sentiment_label="neutral",
+            topic_cluster=None, source_weight=1.0, extra=None,
+        ))
+    return articles
+
+def _loop_temporal(articles):
+    series = defaultdict(lambda: [0, 0.0])
+    for art in articles:
+        if not art.published:
+            continue
+        try:
+            key = datetime.fromisoformat(art.published.replace("Z", "+00:00")).strftime("%Y-%m-%d")
+        except (ValueError, TypeError):
+            key = art.published[:10]
+        series[key][0] += 1
+        series[key][1] += art.sentiment_score
+    return [{"date": k, "count": c, "avg_sentiment": s / c} for k, (c, s) in sorted(series.items())]
+
+def _loop_divergence(articles, min_mentions=3):
+    scores = defaultdict(list)
+    for art in articles:
+        for ents in art.entities.values():
+            for ent in ents:
+                scores[ent.lower()].append(art.sentiment_score)
+    out = [(e, float(np.var(s))) for e, s in scores.items() if len(s) >= min_mentions]
+    return sorted([o for o in out if o[1] > 0.1], key=lambda o: o[1], reverse=True)[:5]
+
+def _loop_trend(articles):
+    counts = [t["count"] for t in _loop_temporal(articles)]
+    return np.polyfit(np.arange(len(counts)), np.array(counts), 1)[0] if len(counts) > 1 else 0.0
+
+def _timed(label: str, fn):
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+    print(f"  {label:<34}{elapsed:>8.3f}s")
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pattern statistics")
+    parser.add_argument("--articles", type=int, default=50000, help="Synthetic bundle size (default: 50000)")
+    parser.add_argument("--entities", type=int, default=2000, help="Distinct entity names (default: 2000)")
+    args = parser.parse_args()
+
+    articles = _synthetic(args.articles, args.entities)
+    print(f"{len(articles)} articles, {args.entities} entities")
+
+    print("loops")
+    loops = _timed("temporal + divergence + trend",
+                   lambda: (_loop_temporal(articles), _loop_divergence(articles), _loop_trend(articles)))
+
+    print("columnar")
+    holder = {}
+    build = _timed("build_pattern_table", lambda: holder.setdefault("t", build_pattern_table(articles)))
+    table = holder["t"]
+    stats = _timed("temporal + divergence + trend", lambda: (
+        analyze_temporal_trends(table), find_divergent_entities(table), calculate_historical_trend(table)))
+    print(f"speedup {loops / (build + stats):.1f}x")
+
+if __name__ == "__main__":
+    main()
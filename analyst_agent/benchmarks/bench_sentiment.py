@@ -0,0 +1,81 @@
+# bench_sentiment.py
+"""
+Throughput of article sentiment: VADER over the whole text (the old
+`get_sentiment`) vs the sentence-level batch engine over the shared parse.
+
+Articles are drawn from a research bundle and repeated up to --articles (10k
+by default), so repeated sentences also show the effect of the sentence memo.
+Parsing is timed separately because the analyst shares it with the summary
+and keyword extractors.
+
+Usage (from the repo root):
+    python -m analyst_agent.benchmarks.bench_sentiment path/to/research.json [--articles 10000]
+"""
+import argparse
+import time
+from pathlib import Path
+
+from analyst_agent.src.engine import get_engine
+from analyst_agent.src.loader import load_research
+from analyst_agent.src.normalizer import normalize_text
+from analyst_agent.src.sentiment import get_analyzer, get_sentiment_batch, sentence_score, sentiment_label
+
+BATCH = 256
+COLD_REPEAT = 5
+
+def _whole_text(texts):
+    sia = get_analyzer()
+    return [sentiment_label(sia.polarity_scores(t)["compound"]) for t in texts]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sentiment scoring")
+    parser.add_argument("research", type=Path, help="Researcher JSON/NDJSON bundle used as the text source")
+    parser.add_argument("--articles", type=int, default=10_000, help="Corpus size (default: 10000)")
+    args = parser.parse_args()
+
+    _, articles = load_research(args.research)
+    base = [t for t in (normalize_text(a.get("text", "")) for a in articles) if t]
+    if not base:
+        print("No article text in the bundle.")
+        return
+    texts = (base * (args.articles // len(base) + 1))[:args.articles]
+    get_analyzer()
+    engine = get_engine()
+
+    t0 = time.perf_counter()
+    _whole_text(texts)
+    whole = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    parsed = [p for i in range(0, len(texts), BATCH) for p in engine.parse_batch(texts[i:i + BATCH])]
+    parse = time.perf_counter() - t0
+
+    # Distinct articles only, memo cold: the per-sentence cost without repeats
+    k = min(len(base), len(texts))
+    cold = cold_whole = 0.0
+    for _ in range(COLD_REPEAT):
+        sentence_score.cache_clear()
+        t0 = time.perf_counter()
+        get_sentiment_batch(parsed[:k])
+        cold += time.perf_counter() - t0
+        t0 = time.perf_counter()
+        _whole_text(texts[:k])
+        cold_whole += time.perf_counter() - t0
+
+    sentence_score.cache_clear()
+    t0 = time.perf_counter()
+    for i in range(0, len(parsed), BATCH):
+        get_sentiment_batch(parsed[i:i + BATCH])
+    batch = time.perf_counter() - t0
+    memo = sentence_score.cache_info()
+
+    n = len(texts)
+    print(f"{n} articles ({len(base)} distinct)")
+    print(f"  whole-text VADER         {whole:8.2f}s  {n / whole:10.0f} articles/s")
+    print(f"  sentence batch           {batch:8.2f}s  {n / batch:10.0f} articles/s")
+    print(f"  distinct only, cold memo: whole-text {k * COLD_REPEAT / cold_whole:.0f}/s, sentence batch {k * COLD_REPEAT / cold:.0f}/s")
+    print(f"  shared parse (once)      {parse:8.2f}s")
+    print(f"  sentence memo: {memo.hits} hits, {memo.misses} misses")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# bench_startup.py
+"""
+Analyst import cost, CLI startup and one-off model load times.
+
+1. Runs `python -X importtime -c "import analyst_agent.src.analyze"` in a
+   fresh interpreter and reports the total plus the slowest top-level imports.
+2. Times `--help` and (given a research bundle) `--validate` end to end as
+   subprocesses. Neither should load a model.
+3. With --models, times the first use of each lazily loaded model in a fresh
+   interpreter: spaCy NER, VADER and the keyword/summary extractors.
+
+Usage (from the repo root):
+    python -m analyst_agent.benchmarks.bench_startup [path/to/research.json] [--top 10] [--models]
+"""
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+MODULE = "analyst_agent.src.analyze"
+
+MODEL_PROBE = """
+import time
+from analyst_agent.src.entities import get_nlp
+from analyst_agent.src.sentiment import get_analyzer
+from analyst_agent.src.engine import get_engine
+for name, load in (("spaCy NER", get_nlp), ("VADER", get_analyzer), ("extractors", lambda: get_engine().preload())):
+    t0 = time.perf_counter()
+    load()
+    print(f"{name}|{time.perf_counter() - t0}")
+"""
+
+def import_times(module: str):
+    """Return [(cumulative_us, name)] for top-level imports of `module`."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cum_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2   # nesting is indented two spaces per level
+        if depth <= 1:
+            rows.append((int(cum_us), name.strip()))
+    if proc.returncode != 0:
+        print(proc.stderr.strip().splitlines()[-1])
+    return rows
+
+def wall_time(args) -> float:
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-m", MODULE] + args, capture_output=True)
+    return time.perf_counter() - t0
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark analyst startup and model loading")
+    parser.add_argument("research", type=Path, nargs="?", help="Research bundle for the --validate timing")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list (default: 10)")
+    parser.add_argument("--models", action="store_true", help="Also time first-use loading of each model")
+    args = parser.parse_args()
+
+    rows = import_times(MODULE)
+    total = max((us for us, _ in rows), default=0)
+    print(f"import {MODULE}: {total / 1000:.1f} ms cumulative")
+    for us, name in sorted(rows, reverse=True)[1:args.top + 1]:
+        print(f"  {us / 1000:>8.1f} ms  {name}")
+
+    print(f"--help      : {1000 * wall_time(['--help']):8.1f} ms")
+    if args.research:
+        print(f"--validate  : {1000 * wall_time(['--validate', '--input', str(args.research)]):8.1f} ms")
+
+    if args.models:
+        proc = subprocess.run([sys.executable, "-c", MODEL_PROBE], capture_output=True, text=True)
+        if proc.returncode != 0:
+            print(proc.stderr.strip().splitlines()[-1])
+        for line in proc.stdout.splitlines():
+            name, seconds = line.split("|")
+            print(f"first use {name:<11}: {1000 * float(seconds):8.1f} ms")
+
+if __name__ == "__main__":
+    main()
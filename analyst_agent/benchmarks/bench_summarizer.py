@@ -0,0 +1,88 @@
+# bench_summarizer.py
+"""
+Summary latency by article length: sumy's LexRankSummarizer (the old path)
+vs the bounded sparse LexRank in summarizer.py.
+
+Articles of each length are assembled from random sentences of a research
+bundle. For every length bucket the median and p95 latency of both
+summarizers are printed, with the share of summary sentences they agree on.
+sumy is skipped above --sumy-max sentences, where a single call takes seconds.
+
+Usage (from the repo root):
+    python -m analyst_agent.benchmarks.bench_summarizer path/to/research.json [--per-bucket 20]
+"""
+import argparse
+import random
+import time
+from pathlib import Path
+
+import numpy as np
+from sumy.models.dom import ObjectDocumentModel, Paragraph, Sentence
+from sumy.summarizers.lex_rank import LexRankSummarizer
+
+from analyst_agent.src.corpus import ParsedText
+from analyst_agent.src.engine import get_engine
+from analyst_agent.src.loader import load_research
+from analyst_agent.src.normalizer import normalize_text
+from analyst_agent.src.summarizer import lexrank_summary
+
+LENGTHS = (10, 25, 50, 100, 200, 400, 800)
+
+class _Words:
+    """sumy tokenizer stand-in answering `to_words` from the parse."""
+    def __init__(self, parsed: ParsedText):
+        self._words = dict(zip(parsed.sentences, parsed.words))
+
+    def to_words(self, sentence: str):
+        return self._words[sentence]
+
+def _sumy(summarizer, parsed: ParsedText) -> tuple:
+    words = _Words(parsed)
+    document = ObjectDocumentModel([Paragraph([Sentence(s, words) for s in parsed.sentences])])
+    return tuple(str(s) for s in summarizer(document, 3))
+
+def _timed(fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return 1000 * (time.perf_counter() - t0), result
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark summary latency by article length")
+    parser.add_argument("research", type=Path, help="Researcher JSON/NDJSON bundle used as the sentence source")
+    parser.add_argument("--per-bucket", type=int, default=20, help="Articles per length bucket (default: 20)")
+    parser.add_argument("--sumy-max", type=int, default=400, help="Longest article also run through sumy (default: 400)")
+    args = parser.parse_args()
+
+    engine = get_engine()
+    _, articles = load_research(args.research)
+    sentences = {}
+    for art in articles:
+        parsed = engine.parse(normalize_text(art.get("text", "")))
+        sentences.update(zip(parsed.sentences, parsed.words))
+    if not sentences:
+        print("No article text in the bundle.")
+        return
+    pool = list(sentences.items())
+    rng = random.Random(42)
+    summarizer = LexRankSummarizer()
+
+    print(f"{'sentences':>10}{'sumy p50':>11}{'sumy p95':>11}{'new p50':>10}{'new p95':>10}{'agree':>8}   (ms)")
+    for n in LENGTHS:
+        old_ms, new_ms, agree = [], [], []
+        for _ in range(args.per_bucket):
+            picked = rng.sample(pool, min(n, len(pool))) if n <= len(pool) else rng.choices(pool, k=n)
+            parsed = ParsedText(" ".join(s for s, _ in picked), tuple(s for s, _ in picked),
+                                tuple(w for _, w in picked))
+            ms, summary = _timed(lexrank_summary, parsed)
+            new_ms.append(ms)
+            if n <= args.sumy_max:
+                ms, reference = _timed(_sumy, summarizer, parsed)
+                old_ms.append(ms)
+                agree.append(sum(s in summary for s in set(reference)) / max(1, len(set(reference))))
+        old = (f"{np.percentile(old_ms, 50):>11.1f}{np.percentile(old_ms, 95):>11.1f}" if old_ms
+               else f"{'-':>11}{'-':>11}")
+        share = f"{100 * np.mean(agree):>7.0f}%" if agree else f"{'-':>8}"
+        print(f"{n:>10}{old}{np.percentile(new_ms, 50):>10.1f}{np.percentile(new_ms, 95):>10.1f}{share}")
+
+if __name__ == "__main__":
+    main()
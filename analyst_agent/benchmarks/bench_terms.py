@@ -0,0 +1,116 @@
+# bench_terms.py
+"""
+Keyword cleaning, term normalization and ORG/PRODUCT promotion: the previous
+per-call regexes and list scans vs the compiled, memoized normalizer.
+
+The synthetic corpus mimics extractor output: keywords and entity names drawn
+from Zipf-distributed vocabularies (so popular terms repeat across articles),
+some with `(+75%)` markers, brackets, odd spacing or non-ASCII characters.
+Both paths are checked to give identical keyword lists.
+
+Usage (from the repo root):
+    python -m analyst_agent.benchmarks.bench_terms [--articles 10000] [--keywords 10] [--entities 15]
+"""
+import argparse
+import random
+import re
+import time
+import unicodedata
+
+from analyst_agent.src.normalizer import (
+    clean_keyword, clean_keyword_list, normalize_list, normalize_term,
+)
+
+DECORATIONS = ("{} (+{}%)", "({})", "{}  growth", " {} ", "{}%", "[{}]", "{} ‑ outlook")
+
+def _old_normalize_text(text):
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKC", text)
+    text = re.sub(r"\s+", " ", text)
+    return text.strip()
+
+def _old_normalize_list(items):
+    seen, output = set(), []
+    for item in items:
+        norm = _old_normalize_text(item)
+        low = norm.lower()
+        if norm and low not in seen:
+            seen.add(low)
+            output.append(norm)
+    return output
+
+def _old_clean_keywords(keywords):
+    cleaned = []
+    for kw in keywords:
+        if not kw:
+            continue
+        k = kw.strip().lower()
+        k = re.sub(r"\(\+?\d+[%]?\)", "", k)
+        k = re.sub(r"[\(\)\[\]\{\}%]", "", k)
+        k = re.sub(r"\s{2,}", " ", k)
+        k = k.strip(" ,.;:-_")
+        if k and k not in cleaned:
+            cleaned.append(k)
+    return cleaned
+
+def _old_features(raw, orgs):
+    keywords = _old_clean_keywords(_old_normalize_list(raw))
+    for ent in orgs:
+        term = _old_normalize_text(ent)
+        if term and term.lower() not in keywords:
+            keywords.append(term.lower())
+    return keywords
+
+def _new_features(raw, orgs):
+    keywords = clean_keyword_list(normalize_list(raw))
+    seen = set(keywords)
+    for ent in orgs:
+        term = normalize_term(ent).lower()
+        if term and term not in seen:
+            seen.add(term)
+            keywords.append(term)
+    return keywords
+
+def _corpus(n_articles: int, n_keywords: int, n_entities: int, seed: int = 3):
+    rng = random.Random(seed)
+    vocab = [f"electric mobility {i}" if i % 7 else f"café scooter {i}" for i in range(20000)]
+    names = [f"Company {i} Ltd" if i % 5 else f"Société {i}" for i in range(5000)]
+    zipf = lambda pool: pool[min(int(rng.paretovariate(1.1)) - 1, len(pool) - 1)]
+    corpus = []
+    for _ in range(n_articles):
+        raw = [rng.choice(DECORATIONS).format(zipf(vocab), rng.randrange(100)) if rng.random() < 0.3
+               else zipf(vocab) for _ in range(n_keywords)]
+        corpus.append((raw, [zipf(names) for _ in range(n_entities)]))
+    return corpus
+
+def _timed(fn) -> tuple:
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark keyword cleaning and term normalization")
+    parser.add_argument("--articles", type=int, default=10000, help="Articles (default: 10000)")
+    parser.add_argument("--keywords", type=int, default=10, help="Raw keywords per article (default: 10)")
+    parser.add_argument("--entities", type=int, default=15, help="ORG/PRODUCT entities per article (default: 15)")
+    args = parser.parse_args()
+
+    corpus = _corpus(args.articles, args.keywords, args.entities)
+    old, old_s = _timed(lambda: [_old_features(raw, orgs) for raw, orgs in corpus])
+    for fn in (normalize_term, clean_keyword):
+        fn.cache_clear()
+    new, new_s = _timed(lambda: [_new_features(raw, orgs) for raw, orgs in corpus])
+    assert old == new, "keyword lists differ"
+    warm, warm_s = _timed(lambda: [_new_features(raw, orgs) for raw, orgs in corpus])
+
+    terms = args.articles * (args.keywords + args.entities)
+    print(f"{args.articles} articles, {terms} raw terms")
+    print(f"  previous            {old_s:7.3f}s  {terms / old_s:12.0f} terms/s")
+    print(f"  compiled + memo     {new_s:7.3f}s  {terms / new_s:12.0f} terms/s   ({old_s / new_s:.1f}x)")
+    print(f"  warm memo           {warm_s:7.3f}s  {terms / warm_s:12.0f} terms/s   ({old_s / warm_s:.1f}x)")
+    info = normalize_term.cache_info()
+    print(f"  normalize_term memo: {info.hits} hits, {info.misses} misses")
+
+if __name__ == "__main__":
+    main()
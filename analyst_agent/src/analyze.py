@@ -1,25 +1,22 @@
 import json
+import sys
 from pathlib import Path
 import logging
-from collections import Counter
-import re
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 
-from .schema import AnalysisBundle, ArticleAnalysis
-from .summarizer import summarize_text
-from .entities import extract_entities
-from .normalizer import normalize_text, normalize_list
+from .schema import AnalysisBundle, ArticleAnalysis, ArticleColumns
+from .loader import load_research, read_json_fields
+from .cache import AnalysisCache, ANALYSIS_CACHE_MAX_ENTRIES
+from .engine import get_engine
+from .entities import extract_entities_batch, get_nlp
+from .normalizer import clean_keyword_list, normalize_term, normalize_text
 from .validators import validate_article
-from .sentiment import get_sentiment
-from .topics import assign_topics
-from .patterns import detect_co_occurrences, analyze_temporal_trends, find_divergent_entities, calculate_historical_trend
+from .sentiment import entity_sentiment, get_analyzer, get_sentiment_batch
+from .topics import TopicAssigner
+from .patterns import PatternAccumulator, compute_patterns
 from .synthesizer import synthesize_insights
-
-from rake_nltk import Rake
-try:
-    import yake
-    YAKE_AVAILABLE = True
-except ImportError:
-    YAKE_AVAILABLE = False
+from .writer import BundleWriter
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -53,160 +50,471 @@ def classify_source_type(source: str) -> str:
 
 def clean_keywords(keywords):
     """Remove punctuation, percent markers & duplicates from keyword list."""
-    cleaned = []
-    for kw in keywords:
-        if not kw:
-            continue
-        k = kw.strip().lower()
-        k = re.sub(r"\(\+?\d+[%]?\)", "", k)              # remove (+75%) patterns
-        k = re.sub(r"[\(\)\[\]\{\}%]", "", k)             # remove leftover brackets/percents
-        k = re.sub(r"\s{2,}", " ", k)                     # collapse spaces
-        k = k.strip(" ,.;:-_")
-        if k and k not in cleaned:
-            cleaned.append(k)
-    return cleaned
+    return clean_keyword_list(keywords)
 
 # ---------------- Keyword extraction ---------------- #
 
 def extract_keywords_rake(text: str, top_k: int = 10):
-    if not text or not text.strip():
-        return []
-    text = normalize_text(text)
-    r = Rake()
-    r.extract_keywords_from_text(text)
-    ranked_phrases = r.get_ranked_phrases_with_scores()
-    phrases = [p for _, p in ranked_phrases[:top_k]]
-    return normalize_list(phrases)
+    return get_engine().keywords_rake(text, top_k)
 
 def extract_keywords_yake(text: str, top_k: int = 10):
-    if not YAKE_AVAILABLE:
-        logger.warning("YAKE not installed; falling back to RAKE.")
-        return extract_keywords_rake(text, top_k)
-    kw_extractor = yake.KeywordExtractor(lan="en", top=top_k)
-    keywords = [kw for kw, _ in kw_extractor.extract_keywords(text)]
-    return normalize_list(keywords)
+    return get_engine().keywords_yake(text, top_k)
 
 # ---------------- Main analysis ---------------- #
 
-def analyze_research_file(file_path: Path, keyword_method: str = "rake"):
-    raw_data = json.loads(file_path.read_text(encoding="utf-8"))
-    query = raw_data.get("query", "")
-    articles_data = raw_data.get("articles", [])
+SOURCE_WEIGHTS = {"government": 1.0, "news": 0.8, "academic": 0.8, "market_research": 0.7, "blog": 0.6}
+
+# Articles are read and NER'd in chunks of this size (one nlp.pipe call each)
+ANALYSIS_CHUNK_SIZE = 256
+# Smaller batches per worker task keep a process pool evenly loaded
+WORKER_BATCH_SIZE = 8
+
+# Input fields an analysis needs besides the text (kept instead of the full record)
+ARTICLE_FIELDS = ("title", "url", "published", "source", "extra")
+
+def _chunks(iterable, size: int):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _text_features(parsed, entities: dict, summary: str, raw_keywords: list, sentiment) -> dict:
+    """Everything derived from the article text alone (NER, summary, keywords and sentiment are batched by the caller)."""
+    keywords = clean_keywords(raw_keywords)
+    seen = set(keywords)
 
-    analyzed_articles = []
-    total_entities = Counter()
-    keyword_counts = Counter()
+    # Promote frequent ORG/PRODUCT entities to keyword list
+    for label in ("ORG", "PRODUCT"):
+        for ent in entities.get(label, []):
+            term = normalize_term(ent).lower()
+            if term and term not in seen:
+                seen.add(term)
+                keywords.append(term)
 
-    # Precompute topic clusters and names
-    topic_labels, topic_map = assign_topics(
-        [normalize_text(a.get("text", "")) for a in articles_data],
-        num_clusters=5
+    return {
+        "summary": summary,
+        "entities": _json_safe(entities),
+        "keywords": keywords,
+        "sentiment_score": sentiment.score,
+        "sentiment_label": sentiment.label,
+        # Entity sentiment from the sentences that mention each entity
+        "entity_sentiment": entity_sentiment(parsed, sentiment.sentences, entities),
+    }
+
+def _build_analysis(art: dict, features: dict) -> ArticleAnalysis:
+    # Source type & weighting
+    stype = classify_source_type(art.get("source"))
+    sw = SOURCE_WEIGHTS.get(stype, 0.5)
+
+    # Topic is filled in once the corpus is complete
+    return ArticleAnalysis(
+        title=normalize_text(art.get("title")),
+        url=art.get("url"),
+        published=art.get("published"),
+        source=art.get("source"),
+        source_type=stype,
+        summary=features["summary"],
+        entities=features["entities"],
+        keywords=list(features["keywords"]),
+        sentiment_score=features["sentiment_score"],
+        sentiment_label=features["sentiment_label"],
+        topic_cluster=None,
+        source_weight=sw,
+        extra=_json_safe(art.get("extra")),
+        entity_sentiment=features.get("entity_sentiment")
     )
 
-    for idx, art in enumerate(articles_data, start=1):
-        if not validate_article(art):
-            logger.warning(f"Skipping invalid article at index {idx}: {art.get('url')}")
-            continue
+def _analyze_batch(texts, keyword_method: str):
+    """Normalized texts → text feature dicts; runs in a worker or in-process."""
+    engine = get_engine()
+    entities_list = extract_entities_batch(texts)
+    # Sentence and word split shared by the summarizer, keyword extractor and sentiment
+    parsed = engine.parse_batch(texts)
+    summaries = engine.summarize_batch(parsed)
+    keyword_lists = engine.keywords_batch(parsed, method=keyword_method, top_k=10)
+    sentiments = get_sentiment_batch(parsed)
+    return [
+        _text_features(*fields)
+        for fields in zip(parsed, entities_list, summaries, keyword_lists, sentiments)
+    ]
+
+def preload_models(keyword_method: str = "rake"):
+    """
+    Load spaCy, VADER and the keyword/summary extractors now. Every model is
+    otherwise loaded on first use, so importing the analyst, `--help` and
+    `--validate` runs stay fast.
+    """
+    get_nlp()
+    get_analyzer()
+    get_engine().preload(keyword_method)
 
-        text = normalize_text(art.get("text", ""))
-        summary = summarize_text(text)
-        entities = extract_entities(text)
+def _init_worker(keyword_method: str = "rake"):
+    """Warm every model once per worker process so the first real article pays no load cost."""
+    logging.basicConfig(level=logging.WARNING)
+    preload_models(keyword_method)
 
-        # Keyword extraction
-        keyword_extractor = extract_keywords_yake if keyword_method == "yake" else extract_keywords_rake
-        keywords = clean_keywords(keyword_extractor(text, top_k=10))
-        
-        # Promote frequent ORG/PRODUCT entities to keyword list
-        for label in ("ORG", "PRODUCT"):
-            for ent in entities.get(label, []):
-                term = normalize_text(ent)
-                if term and term.lower() not in keywords:
-                    keywords.append(term.lower())
+class _InlinePool:
+    """Executor stand-in that computes on submit, for the single-process path."""
+    class _Done:
+        def __init__(self, value):
+            self._value = value
 
-        # Sentiment
-        sentiment_score, sentiment_label = get_sentiment(text)
+        def result(self):
+            return self._value
 
-        # Source type & weighting
-        stype = classify_source_type(art.get("source"))
-        sw = {"government": 1.0, "news": 0.8, "academic": 0.8, "market_research": 0.7, "blog": 0.6}.get(stype, 0.5)
+    def submit(self, fn, *args):
+        return self._Done(fn(*args))
 
+def _ordered_results(pool, batches, keyword_method: str, max_pending: int, cache: AnalysisCache = None):
+    """
+    Yield (arts, texts, features) per batch in input order. Cached texts
+    are answered from `cache`; the rest are submitted to `pool` with bounded
+    look-ahead and stored back once computed.
+    """
+    pending = deque()
+
+    def finish(entry):
+        arts, texts, features, misses, fut = entry
+        if fut is not None:
+            for i, computed in zip(misses, fut.result()):
+                features[i] = computed
+                if cache is not None:
+                    cache.put(texts[i], computed)
+        return arts, texts, features
+
+    for arts, texts in batches:
+        features = [cache.get(t) if cache is not None else None for t in texts]
+        misses = [i for i, f in enumerate(features) if f is None]
+        fut = pool.submit(_analyze_batch, [texts[i] for i in misses], keyword_method) if misses else None
+        pending.append((arts, texts, features, misses, fut))
+        if len(pending) >= max_pending:
+            yield finish(pending.popleft())
+    while pending:
+        yield finish(pending.popleft())
+
+def _analysed_batches(articles_iter, keyword_method: str, workers: int, cache: AnalysisCache):
+    """Yield (analyses, texts) per batch in input order; invalid articles are skipped."""
+    def batches(size: int):
+        for chunk in _chunks(enumerate(articles_iter, start=1), size):
+            arts, texts = [], []
+            for idx, art in chunk:
+                if not validate_article(art):
+                    logger.warning(f"Skipping invalid article at index {idx}: {art.get('url')}")
+                    continue
+                arts.append({k: art.get(k) for k in ARTICLE_FIELDS})
+                texts.append(normalize_text(art.get("text", "")))
+            if texts:
+                yield arts, texts
+
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(keyword_method,))
+        results = _ordered_results(pool, batches(WORKER_BATCH_SIZE), keyword_method,
+                                   max_pending=2 * workers, cache=cache)
+    else:
+        pool = None
+        results = _ordered_results(_InlinePool(), batches(ANALYSIS_CHUNK_SIZE), keyword_method,
+                                   max_pending=1, cache=cache)
+    try:
+        for arts, texts, features_list in results:
+            yield [_build_analysis(art, features) for art, features in zip(arts, features_list)], texts
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+class _BundleStats:
+    """Corpus-level counters and pattern columns, fed one finished ArticleAnalysis at a time."""
+
+    def __init__(self, patterns: bool = True):
+        self.total_entities = Counter()
+        self.keyword_counts = Counter()
+        self.source_types = Counter()
+        self.sentiment_sum = 0.0
+        self.n_articles = 0
+        self.pattern_acc = PatternAccumulator() if patterns else None
+
+    def add(self, analysis: ArticleAnalysis):
         # Aggregate entity stats
-        for vals in entities.values():
+        for vals in analysis.entities.values():
             if isinstance(vals, list):
-                total_entities.update([str(x) for x in vals if isinstance(x, str)])
-
-        keyword_counts.update(keywords)
-
-        # Build analysis object
-        analyzed_articles.append(ArticleAnalysis(
-            title=normalize_text(art.get("title")),
-            url=art.get("url"),
-            published=art.get("published"),
-            source=art.get("source"),
-            source_type=stype,
-            summary=summary,
-            entities=_json_safe(entities),
-            keywords=keywords,
-            sentiment_score=sentiment_score,
-            sentiment_label=sentiment_label,
-            topic_cluster=int(topic_labels[idx - 1]),
-            source_weight=sw,
-            extra=_json_safe(art.get("extra"))
-        ))
+                self.total_entities.update([str(x) for x in vals if isinstance(x, str)])
+        self.keyword_counts.update(analysis.keywords)
+        self.source_types[analysis.source_type] += 1
+        self.sentiment_sum += analysis.sentiment_score
+        self.n_articles += 1
+        if self.pattern_acc is not None:
+            self.pattern_acc.add(analysis)
+
+    def summary_meta(self) -> dict:
+        return {
+            "total_articles": int(self.n_articles),
+            "avg_sentiment": float(self.sentiment_sum / max(1, self.n_articles)),
+            "top_keywords": [[str(k), int(c)] for k, c in self.keyword_counts.most_common(10)],
+            "top_entities": [[str(k), int(c)] for k, c in self.total_entities.most_common(10)],
+            "articles_by_source_type": {str(k): int(v) for k, v in self.source_types.items()}
+        }
+
+def _analyze_stream(articles_iter, emit, keyword_method: str = "rake", workers: int = 1,
+                    cache_path: Path = None, cache_max_entries: int = ANALYSIS_CACHE_MAX_ENTRIES,
+                    num_topics: int = None, topic_model_path: Path = None,
+                    stats: _BundleStats = None, topic_offset: int = 0):
+    """
+    Analyse articles as they are read and pass each finished ArticleAnalysis
+    to `emit`, in input order. Only small aggregates (counters and the compact
+    pattern columns) are kept; texts are held just until their topic is known.
+    `emit` may be an ArticleColumns store, which then also serves the patterns.
+    `stats` continues aggregates that already hold earlier articles, and
+    `topic_offset` shifts the labels of a freshly fitted topic model.
+    Returns (summary_meta, patterns, topic_map).
+    """
+    columns = None
+    if isinstance(emit, ArticleColumns):
+        columns, emit = emit, emit.append
+    if stats is None:
+        stats = _BundleStats(patterns=columns is None)
+    topics = TopicAssigner(num_clusters=num_topics, model_path=topic_model_path, label_offset=topic_offset)
+
+    def finish(ready):
+        for analysis, label in ready:
+            analysis.topic_cluster = int(label)
+            stats.add(analysis)
+            emit(analysis)
+
+    cache = AnalysisCache(cache_path, keyword_method, max_entries=cache_max_entries) if cache_path else None
+    try:
+        for analyses, texts in _analysed_batches(articles_iter, keyword_method, workers, cache):
+            finish(topics.add(analyses, texts))
+        finish(topics.finish())
+    finally:
+        cache_stats = cache.close() if cache is not None else None
 
     # Pattern Analysis
-    patterns = {
-        "co_occurrences": detect_co_occurrences(analyzed_articles),
-        "temporal_trends": analyze_temporal_trends(analyzed_articles),
-        "divergent_entities": find_divergent_entities(analyzed_articles),
-        "historical_trend": calculate_historical_trend(analyzed_articles)
-    }
+    patterns = compute_patterns(columns if columns is not None else stats.pattern_acc)
 
-    summary_meta = {
-        "total_articles": int(len(analyzed_articles)),
-        "avg_sentiment": float(sum(a.sentiment_score for a in analyzed_articles) / max(1, len(analyzed_articles))),
-        "top_keywords": [[str(k), int(c)] for k, c in keyword_counts.most_common(10)],
-        "top_entities": [[str(k), int(c)] for k, c in total_entities.most_common(10)],
-        "articles_by_source_type": {
-            str(k): int(v) for k, v in Counter(a.source_type for a in analyzed_articles).items()
-        }
-    }
+    summary_meta = stats.summary_meta()
+    if cache_stats:
+        summary_meta["analysis_cache"] = cache_stats
+    return _json_safe(summary_meta), patterns, topics.names
+
+def analyze_research_file(file_path: Path, keyword_method: str = "rake", workers: int = 1,
+                          cache_path: Path = None, cache_max_entries: int = ANALYSIS_CACHE_MAX_ENTRIES,
+                          num_topics: int = None, topic_model_path: Path = None):
+    """
+    Analyse a researcher bundle. With `workers` > 1, per-article work (NER,
+    summary, keywords, sentiment) runs on a process pool in small batches;
+    results keep input order and aggregates are merged here. With
+    `cache_path`, text features are reused from an on-disk SQLite cache.
+    `num_topics=None` picks the number of topic clusters automatically; with
+    `topic_model_path`, an existing topic model is updated instead of refitted.
+    Articles are kept in a compact ArticleColumns store. For bundles too large
+    to hold in memory use `analyze_research_to_file`.
+    """
+    query, articles_iter = load_research(file_path)
+    analyzed_articles = ArticleColumns()
+    summary_meta, patterns, topic_map = _analyze_stream(
+        articles_iter, analyzed_articles, keyword_method, workers,
+        cache_path, cache_max_entries, num_topics, topic_model_path
+    )
 
     # Generate Narrative Insights
     bundle = AnalysisBundle(
         query=query, 
         articles=analyzed_articles, 
-        summary_meta=_json_safe(summary_meta),
+        summary_meta=summary_meta,
         patterns=patterns,
         topic_map=topic_map
     )
-    bundle.insights = synthesize_insights(bundle.to_dict(), patterns)
+    bundle.insights = synthesize_insights({"query": query, "summary_meta": summary_meta}, patterns)
 
     logger.info(f"✅ Processed {len(analyzed_articles)} articles with enhanced patterns.")
     return bundle
 
+def analyze_research_to_file(file_path: Path, out_path: Path, query: str = None, ensure_ascii: bool = True,
+                             **options) -> AnalysisBundle:
+    """
+    Streaming variant of `analyze_research_file`: articles are read lazily and
+    each ArticleAnalysis is written to `out_path` as soon as it is finished,
+    so peak memory does not grow with the bundle. `query` overrides the
+    research query. Returns the bundle without its articles (they are on disk).
+    """
+    research_query, articles_iter = load_research(file_path)
+    query = query or research_query
+    with BundleWriter(out_path, ensure_ascii=ensure_ascii) as writer:
+        writer.begin(query)
+        summary_meta, patterns, topic_map = _analyze_stream(articles_iter, writer.write_article, **options)
+        insights = synthesize_insights({"query": query, "summary_meta": summary_meta}, patterns)
+        writer.finish(summary_meta, insights, patterns, topic_map)
+
+    logger.info(f"✅ Processed {writer.articles} articles with enhanced patterns.")
+    return AnalysisBundle(query=query, articles=[], summary_meta=summary_meta, insights=insights,
+                          patterns=patterns, topic_map=topic_map)
+
+
+def update_analysis_file(previous_path: Path, file_path: Path, out_path: Path, query: str = None,
+                         ensure_ascii: bool = True, **options) -> AnalysisBundle:
+    """
+    Incremental run for refreshed research. Articles of the previous analysis
+    bundle are carried over unchanged and only research articles whose URL it
+    does not already contain are analysed; NLP cost follows the new articles
+    alone. Counters, co-occurrence and temporal statistics are aggregated over
+    old and new articles together, and insights are regenerated.
+
+    With `topic_model_path` pointing at the model the previous bundle was
+    clustered with, new articles are assigned to its centroids (which are
+    updated). Without one, new articles are clustered among themselves and
+    numbered after the previous clusters; a model saved to `topic_model_path`
+    keeps that numbering for later updates. The topic map keeps the names of
+    earlier clusters. `out_path` may equal `previous_path`.
+
+    The previous bundle is streamed like research input: its articles one at
+    a time, and its topic map (written after them) in a first pass that skips
+    them. Reading and rewriting the history is still O(history) in time and
+    disk I/O; only memory is bounded.
+    """
+    previous_query, previous_iter = load_research(previous_path)
+    previous_map = read_json_fields(previous_path, "topic_map").get("topic_map") or {}
+    topic_map = {int(k): v for k, v in previous_map.items()}
+    research_query, articles_iter = load_research(file_path)
+    query = query or previous_query or research_query
+    stats = _BundleStats()
+    known = set()
+    skipped = 0
+
+    def unseen(articles):
+        nonlocal skipped
+        for art in articles:
+            url = art.get("url")
+            if url is not None and url in known:
+                skipped += 1
+                continue
+            known.add(url)
+            yield art
+
+    with BundleWriter(out_path, ensure_ascii=ensure_ascii) as writer:
+        writer.begin(query)
+        last_label = max(topic_map, default=-1)
+        for record in previous_iter:
+            analysis = ArticleAnalysis.from_dict(record)
+            known.add(analysis.url)
+            if analysis.topic_cluster is not None:
+                last_label = max(last_label, analysis.topic_cluster)
+            stats.add(analysis)
+            writer.write_article(analysis)
+        previous_articles = stats.n_articles
+
+        model_path = options.get("topic_model_path")
+        new_model = model_path is None or not Path(model_path).exists()
+        if new_model and previous_articles:
+            logger.warning("⚠️ No topic model to update; new articles get their own clusters after the previous ones.")
+        summary_meta, patterns, new_topics = _analyze_stream(
+            unseen(articles_iter), writer.write_article, stats=stats,
+            topic_offset=last_label + 1 if new_model else 0, **options
+        )
+        new_articles = stats.n_articles - previous_articles
+        if new_articles:
+            # The model's names cover only its own labels; earlier clusters keep theirs
+            topic_map.update(new_topics)
+        summary_meta["incremental"] = {"previous_articles": previous_articles, "new_articles": new_articles,
+                                       "known_urls_skipped": skipped}
+        insights = synthesize_insights({"query": query, "summary_meta": summary_meta}, patterns)
+        writer.finish(summary_meta, insights, patterns, _json_safe(topic_map))
+
+    logger.info(f"✅ Added {new_articles} new articles to {previous_articles} previously analysed.")
+    return AnalysisBundle(query=query, articles=[], summary_meta=summary_meta, insights=insights,
+                          patterns=patterns, topic_map=topic_map)
+
+
+def validate_research_file(file_path: Path) -> dict:
+    """Count valid and invalid articles in a research bundle without loading any model."""
+    query, articles_iter = load_research(file_path)
+    counts = Counter(validate_article(art) for art in articles_iter)
+    return {"query": query, "valid": counts[True], "invalid": counts[False]}
+
+# Job fields understood by `serve`, mapped to analyze_research_to_file options
+_SERVE_OPTIONS = {"keywords": "keyword_method", "workers": "workers", "cache": "cache_path",
+                  "topics": "num_topics", "topic_model": "topic_model_path"}
+
+def serve(keyword_method: str = "rake", stdin=None, stdout=None):
+    """
+    Resident warm-worker mode. Models are loaded once; then each input line is
+    a JSON job ({"input", "output", optional "id", "topic", "keywords",
+    "workers", "cache", "topics", "topic_model", "previous"}) and is answered
+    with one JSON line of type "result" carrying the job's "id". A job with
+    "previous" updates that analysis with the new articles of "input" (see
+    `update_analysis_file`). Log output goes to the same stream as plain text.
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    preload_models(keyword_method)
+    print(json.dumps({"type": "ready"}), file=stdout, flush=True)
+    for line in stdin:
+        if not line.strip():
+            continue
+        job = {}
+        try:
+            job = json.loads(line)
+            options = {opt: job[key] for key, opt in _SERVE_OPTIONS.items() if job.get(key) is not None}
+            for key in ("cache_path", "topic_model_path"):
+                if key in options:
+                    options[key] = Path(options[key])
+            if job.get("previous"):
+                bundle = update_analysis_file(Path(job["previous"]), Path(job["input"]), Path(job["output"]),
+                                              query=job.get("topic") or None, **options)
+            else:
+                bundle = analyze_research_to_file(Path(job["input"]), Path(job["output"]),
+                                                  query=job.get("topic") or None, **options)
+            reply = {"type": "result", "id": job.get("id"), "ok": True, "output": job["output"],
+                     "articles": bundle.summary_meta["total_articles"]}
+        except Exception as e:
+            logger.exception(f"❌ Analysis job failed: {e}")
+            reply = {"type": "result", "id": job.get("id") if isinstance(job, dict) else None,
+                     "ok": False, "error": str(e)}
+        print(json.dumps(reply), file=stdout, flush=True)
 
 def main():
     import argparse
     parser = argparse.ArgumentParser(description="Analyst Agent: Enhanced Topic Labeling & Pattern Analysis")
-    parser.add_argument("--input", type=str, required=True, help="Path to researcher JSON output")
-    parser.add_argument("--output", type=str, required=True, help="Path to save analysis JSON")
+    parser.add_argument("--input", type=str, help="Path to researcher JSON or NDJSON output")
+    parser.add_argument("--output", type=str, help="Path to save analysis JSON")
     parser.add_argument("--topic", type=str, default="", help="Optional topic name override")
     parser.add_argument("--yake", action="store_true", help="Use YAKE for keywords (requires yake package)")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for per-article analysis (default: 1)")
+    parser.add_argument("--cache", type=str, default=None, help="SQLite file caching per-article analysis across runs")
+    parser.add_argument("--topics", type=int, default=None, help="Number of topic clusters (default: chosen automatically)")
+    parser.add_argument("--topic-model", type=str, default=None, help="Topic model file: updated incrementally if it exists, saved otherwise")
+    parser.add_argument("--validate", action="store_true", help="Only count valid/invalid articles in --input (no models are loaded)")
+    parser.add_argument("--update", type=str, default=None, help="Previous analysis JSON: keep its articles and analyse only new URLs from --input")
+    parser.add_argument("--serve", action="store_true", help="Resident mode: load models once, then run JSON jobs read from stdin")
     parser.add_argument("--force-cpu", action="store_true", help="Force CPU for NLTK/Spacy (not used but for CLI compatibility)")
     
     args = parser.parse_args()
     
+    if args.serve:
+        logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+        serve(keyword_method="yake" if args.yake else "rake")
+        return
+    if not args.input or (not args.output and not args.validate):
+        parser.error("--input and --output are required (only --input with --validate)")
+    if args.validate:
+        print(json.dumps(validate_research_file(Path(args.input))))
+        return
+
     logging.basicConfig(level=logging.INFO)
-    bundle = analyze_research_file(
-        Path(args.input), 
-        keyword_method="yake" if args.yake else "rake"
+    options = dict(
+        query=args.topic or None,
+        keyword_method="yake" if args.yake else "rake",
+        workers=args.workers,
+        cache_path=Path(args.cache) if args.cache else None,
+        num_topics=args.topics,
+        topic_model_path=Path(args.topic_model) if args.topic_model else None
     )
-    
-    if args.topic:
-        bundle.query = args.topic
-        
-    Path(args.output).write_text(json.dumps(bundle.to_dict(), indent=2), encoding="utf-8")
+    if args.update:
+        update_analysis_file(Path(args.update), Path(args.input), Path(args.output), **options)
+    else:
+        analyze_research_to_file(Path(args.input), Path(args.output), **options)
     print(f"Analysis saved to: {args.output}")
 
 
@@ -0,0 +1,106 @@
+# cache.py
+import hashlib
+import json
+import sqlite3
+import time
+from importlib import metadata
+from pathlib import Path
+
+# Bump when the analysis logic changes in a way that invalidates stored results
+ANALYZER_VERSION = "3"
+ANALYSIS_CACHE_MAX_ENTRIES = 50_000
+
+_LIBRARIES = ("spacy", "nltk", "sumy", "rake-nltk", "yake")
+
+
+def _lib_version(name: str) -> str:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return "none"
+
+
+def analyzer_config() -> str:
+    """Fingerprint of the code, model and libraries behind a per-article result."""
+    from .entities import model_meta
+    meta = model_meta()
+    parts = [
+        f"analyzer={ANALYZER_VERSION}",
+        f"model={meta.get('name')}-{meta.get('version')}",
+    ] + [f"{lib}={_lib_version(lib)}" for lib in _LIBRARIES]
+    return ";".join(parts)
+
+
+class AnalysisCache:
+    """
+    SQLite cache of per-article text features (summary, entities, keywords,
+    sentiment) keyed by sha256(analyzer config + keyword method + normalized text).
+
+    Rows written under a different analyzer config (new model, library or
+    analyzer version) are dropped on open; rows for other keyword methods are
+    kept, so switching methods back and forth reuses both. Beyond
+    `max_entries`, the least recently used rows are evicted on close.
+    """
+
+    def __init__(self, path, keyword_method: str, max_entries: int = ANALYSIS_CACHE_MAX_ENTRIES):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.config = analyzer_config()
+        self.keyword_method = keyword_method
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._db = sqlite3.connect(str(self.path))
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS analysis ("
+            " key TEXT PRIMARY KEY, config TEXT NOT NULL, payload TEXT NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS analysis_last_used ON analysis(last_used)")
+        self._db.execute("DELETE FROM analysis WHERE config != ?", (self.config,))
+        self._db.commit()
+
+    def _key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.config}\0keywords={self.keyword_method}\0{text}".encode("utf-8")).hexdigest()
+
+    def get(self, text: str):
+        key = self._key(text)
+        row = self._db.execute("SELECT payload FROM analysis WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._db.execute("UPDATE analysis SET last_used = ? WHERE key = ?", (time.time(), key))
+        return json.loads(row[0])
+
+    def put(self, text: str, features: dict) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO analysis (key, config, payload, last_used) VALUES (?, ?, ?, ?)",
+            (self._key(text), self.config, json.dumps(features), time.time()),
+        )
+
+    def _evict(self) -> None:
+        (count,) = self._db.execute("SELECT COUNT(*) FROM analysis").fetchone()
+        if count > self.max_entries:
+            self._db.execute(
+                "DELETE FROM analysis WHERE key IN ("
+                " SELECT key FROM analysis ORDER BY last_used ASC LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        (entries,) = self._db.execute("SELECT COUNT(*) FROM analysis").fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": int(entries),
+        }
+
+    def close(self) -> dict:
+        """Evict, commit and close; returns the final stats."""
+        self._evict()
+        self._db.commit()
+        stats = self.stats()
+        self._db.close()
+        return stats
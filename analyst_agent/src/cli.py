@@ -1,12 +1,10 @@
 # cli.py
 import argparse
-import json
 import logging
-from .analyze import _json_safe 
 from pathlib import Path
 from datetime import datetime
 
-from .analyze import analyze_research_file
+from .analyze import analyze_research_to_file, update_analysis_file, validate_research_file
 
 # Set up logging
 logging.basicConfig(format="%(levelname)s: %(message)s", level=logging.INFO)
@@ -16,7 +14,7 @@ def main():
     parser.add_argument(
         "input",
         type=Path,
-        help="Path to research JSON file from Researcher Agent"
+        help="Path to research JSON or NDJSON file from Researcher Agent"
     )
     parser.add_argument(
         "--out",
@@ -30,6 +28,39 @@ def main():
         help="Keyword extraction method to use (default: rake)"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for per-article analysis (default: 1)"
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        help="SQLite file caching per-article analysis across runs (default: disabled)"
+    )
+
+    parser.add_argument(
+        "--topics",
+        type=int,
+        help="Number of topic clusters (default: chosen automatically)"
+    )
+    parser.add_argument(
+        "--topic-model",
+        type=Path,
+        help="Topic model file: new bundles update it incrementally if it exists, otherwise it is saved there"
+    )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Only count valid and invalid articles; no models are loaded"
+    )
+    parser.add_argument(
+        "--update",
+        type=Path,
+        help="Previous analysis JSON: keep its articles and analyse only articles with new URLs"
+    )
+
     args = parser.parse_args()
     logging.info("📂 Loading research file...")
 
@@ -37,6 +68,11 @@ def main():
         logging.error(f"❌ Input file not found or not a file: {args.input}")
         return
 
+    if args.validate:
+        counts = validate_research_file(args.input)
+        logging.info(f"🔎 {counts['valid']} valid, {counts['invalid']} invalid articles for '{counts['query']}'")
+        return
+
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 
     # Determine output path
@@ -54,23 +90,23 @@ def main():
         stem, suffix = args.out.stem, args.out.suffix
         out_path = args.out.with_name(f"{stem}_{timestamp}{suffix}")
 
-    logging.info(f"🧠 Analyzing with '{args.keywords}' keyword method...")
-    try:
-        bundle = analyze_research_file(args.input, keyword_method=args.keywords)
-    except Exception as e:
-        logging.exception(f"❌ Analysis failed: {e}")
+    if args.update is not None and not args.update.is_file():
+        logging.error(f"❌ Previous analysis not found: {args.update}")
         return
 
-    logging.info("💾 Saving analysis...")
+    logging.info(f"🧠 Analyzing with '{args.keywords}' keyword method...")
+    options = dict(
+        ensure_ascii=False, keyword_method=args.keywords, workers=args.workers, cache_path=args.cache,
+        num_topics=args.topics, topic_model_path=args.topic_model
+    )
     try:
-        
-        safe_bundle = _json_safe(bundle.to_dict())
-        out_path.write_text(
-            json.dumps(bundle.to_dict(), ensure_ascii=False, indent=2),
-            encoding="utf-8"
-        )
+        # Articles are written to out_path as they are analysed
+        if args.update is not None:
+            update_analysis_file(args.update, args.input, out_path, **options)
+        else:
+            analyze_research_to_file(args.input, out_path, **options)
     except Exception as e:
-        logging.exception(f"❌ Failed to save analysis to {out_path}: {e}")
+        logging.exception(f"❌ Analysis failed: {e}")
         return
 
     logging.info(f"✅ Analysis saved: {out_path}")
@@ -0,0 +1,60 @@
+# corpus.py
+"""
+Shared corpus representation. Each article is split into sentences and words
+once (`parse_text`) for the keyword and summary extractors, and the corpus is
+vectorised once (`build_corpus_matrix`) for topic clustering and naming.
+
+The corpus matrix is deliberately not fed to keywords or summaries: those are
+computed per article in streamed worker batches and cached by text, before
+the corpus is complete, and must not change when other articles do. LexRank
+weights sentences by the article's own TF-IDF (see `summarizer`).
+"""
+from dataclasses import dataclass
+from typing import List, Tuple
+
+# Specialized noise words for scraping-derived clusters
+SEARCH_NOISE = {
+    "com", "bikedekho", "lakh", "crore", "indian", "india", "sales", "electric",
+    "scooter", "scooters", "market", "units", "year", "news", "updates", "times",
+    "india", "daily", " Jagran", "Jagran", "bikewale", "hindustan", "hindustantimes"
+}
+TFIDF_MAX_DF = 0.8
+TFIDF_MAX_FEATURES = 1000
+
+
+@dataclass
+class ParsedText:
+    """An article's text with its sentence split and the word tokens of each sentence."""
+    text: str
+    sentences: Tuple[str, ...]
+    words: Tuple[Tuple[str, ...], ...]
+
+
+def parse_text(text: str, tokenizer) -> ParsedText:
+    """Split once with a sumy-style tokenizer (`to_sentences` / `to_words`)."""
+    if not text or not text.strip():
+        return ParsedText(text or "", (), ())
+    sentences = tuple(s for s in tokenizer.to_sentences(text) if s)
+    return ParsedText(text, sentences, tuple(tokenizer.to_words(s) for s in sentences))
+
+
+@dataclass
+class CorpusMatrix:
+    """TF-IDF of the whole corpus, one row per text, kept for every stage that needs it."""
+    matrix: object              # scipy.sparse CSR, rows follow the input texts
+    vocabulary: object          # numpy array: the term of each column
+    vectorizer: object          # the fitted sklearn TfidfVectorizer
+
+
+def build_corpus_matrix(texts: List[str]) -> CorpusMatrix:
+    # sklearn is imported here so that importing the analyst stays cheap
+    from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS, TfidfVectorizer
+    vectorizer = TfidfVectorizer(
+        # a single document would otherwise exceed max_df and leave no vocabulary
+        max_df=TFIDF_MAX_DF if len(texts) > 1 else 1.0,
+        min_df=1,
+        stop_words=sorted(ENGLISH_STOP_WORDS | SEARCH_NOISE),
+        max_features=TFIDF_MAX_FEATURES
+    )
+    matrix = vectorizer.fit_transform(texts)
+    return CorpusMatrix(matrix=matrix, vocabulary=vectorizer.get_feature_names_out(), vectorizer=vectorizer)
@@ -0,0 +1,125 @@
+# engine.py
+import importlib.util
+import logging
+from typing import Iterable, List, Union
+
+from .corpus import ParsedText, parse_text
+from .normalizer import normalize_text, normalize_list
+
+# rake_nltk, sumy and yake are imported when their extractor is first built
+YAKE_AVAILABLE = importlib.util.find_spec("yake") is not None
+
+logger = logging.getLogger(__name__)
+
+TextOrParsed = Union[str, ParsedText]
+
+
+class TextEngine:
+    """
+    Keyword and summary extractors, built on first use and reused for every
+    article. RAKE loads NLTK stopwords and sumy's Tokenizer loads punkt on
+    construction, so building them per article dominated the cost on short texts.
+    One engine per process (see `get_engine`); not meant to be shared across threads.
+
+    Every method accepts either raw text or a `ParsedText` from `parse`, so a
+    batch is split into sentences and words once and both RAKE and LexRank
+    reuse that split. LexRank itself lives in `summarizer` and needs no
+    extractor object.
+    """
+
+    def __init__(self, language: str = "english"):
+        self.language = language
+        self._rake = None
+        self._yake = {}
+        self._tokenizer = None
+
+    def preload(self, keyword_method: str = "rake"):
+        """Build every extractor now rather than on the first article."""
+        _ = self.tokenizer
+        if keyword_method == "yake" and YAKE_AVAILABLE:
+            self.yake_extractor(10)
+        else:
+            _ = self.rake
+        return self
+
+    # ---------------- Extractor objects ---------------- #
+
+    @property
+    def rake(self):
+        if self._rake is None:
+            from rake_nltk import Rake
+            self._rake = Rake(language=self.language)
+        return self._rake
+
+    def yake_extractor(self, top_k: int):
+        # YAKE fixes `top` at construction, so keep one extractor per size
+        if top_k not in self._yake:
+            import yake
+            self._yake[top_k] = yake.KeywordExtractor(lan="en", top=top_k)
+        return self._yake[top_k]
+
+    @property
+    def tokenizer(self):
+        if self._tokenizer is None:
+            from sumy.nlp.tokenizers import Tokenizer
+            self._tokenizer = Tokenizer(self.language)
+        return self._tokenizer
+
+    # ---------------- Parsing ---------------- #
+
+    def parse(self, text: TextOrParsed) -> ParsedText:
+        if isinstance(text, ParsedText):
+            return text
+        return parse_text(normalize_text(text), self.tokenizer)
+
+    def parse_batch(self, texts: Iterable[TextOrParsed]) -> List[ParsedText]:
+        return [self.parse(t) for t in texts]
+
+    # ---------------- Keywords ---------------- #
+
+    def keywords_rake(self, text: TextOrParsed, top_k: int = 10) -> List[str]:
+        parsed = self.parse(text)
+        if not parsed.sentences:
+            return []
+        self.rake.extract_keywords_from_sentences(list(parsed.sentences))
+        ranked_phrases = self.rake.get_ranked_phrases_with_scores()
+        phrases = [p for _, p in ranked_phrases[:top_k]]
+        return normalize_list(phrases)
+
+    def keywords_yake(self, text: TextOrParsed, top_k: int = 10) -> List[str]:
+        if not YAKE_AVAILABLE:
+            logger.warning("YAKE not installed; falling back to RAKE.")
+            return self.keywords_rake(text, top_k)
+        # YAKE has no pre-tokenized entry point; it gets the text
+        text = text.text if isinstance(text, ParsedText) else text
+        keywords = [kw for kw, _ in self.yake_extractor(top_k).extract_keywords(text)]
+        return normalize_list(keywords)
+
+    def keywords(self, text: TextOrParsed, method: str = "rake", top_k: int = 10) -> List[str]:
+        if method == "yake":
+            return self.keywords_yake(text, top_k)
+        return self.keywords_rake(text, top_k)
+
+    def keywords_batch(self, texts: Iterable[TextOrParsed], method: str = "rake", top_k: int = 10) -> List[List[str]]:
+        return [self.keywords(t, method, top_k) for t in texts]
+
+    # ---------------- Summaries ---------------- #
+
+    def summarize(self, text: TextOrParsed, sentence_count: int = 3) -> str:
+        """Summarize text into a few sentences using LexRank (bounded on long articles)."""
+        from .summarizer import lexrank_summary
+        return lexrank_summary(self.parse(text), sentence_count)
+
+    def summarize_batch(self, texts: Iterable[TextOrParsed], sentence_count: int = 3) -> List[str]:
+        return [self.summarize(t, sentence_count) for t in texts]
+
+
+_engine = None
+
+
+def get_engine() -> TextEngine:
+    """The process-wide engine; worker processes each build their own on first use."""
+    global _engine
+    if _engine is None:
+        _engine = TextEngine()
+    return _engine
@@ -1,14 +1,45 @@
 # entities.py
-import spacy
+import importlib.util
+import json
 import re
 from collections import defaultdict
-from .normalizer import normalize_text
+from functools import lru_cache
+from pathlib import Path
+from .normalizer import TERM_CACHE_SIZE, normalize_text
 
-# Single shared spaCy model
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    raise RuntimeError("SpaCy English model not installed. Run: python -m spacy download en_core_web_sm")
+# Only doc.ents is used, so everything but NER and its shared tok2vec layer is excluded
+SPACY_MODEL = "en_core_web_sm"
+NER_EXCLUDE = ["tagger", "parser", "attribute_ruler", "lemmatizer", "senter", "morphologizer"]
+
+# nlp.pipe settings (n_process > 1 forks worker processes for large batches)
+NER_BATCH_SIZE = 32
+NER_N_PROCESS = 1
+
+# Single shared spaCy model, loaded on first use (see `get_nlp`)
+_nlp = None
+
+
+def get_nlp():
+    global _nlp
+    if _nlp is None:
+        import spacy
+        try:
+            _nlp = spacy.load(SPACY_MODEL, exclude=NER_EXCLUDE)
+        except OSError:
+            raise RuntimeError("SpaCy English model not installed. Run: python -m spacy download en_core_web_sm")
+    return _nlp
+
+
+def model_meta() -> dict:
+    """The NER model's meta.json, read from the installed package so the model needn't be loaded."""
+    if _nlp is not None:
+        return _nlp.meta
+    spec = importlib.util.find_spec(SPACY_MODEL)
+    if spec is not None and spec.submodule_search_locations:
+        meta = Path(list(spec.submodule_search_locations)[0]) / "meta.json"
+        if meta.exists():
+            return json.loads(meta.read_text(encoding="utf-8"))
+    return get_nlp().meta
 
 _ALLOWED_PATTERN = re.compile(r"^[\w\s\-\.'&/,]+$", re.UNICODE)
 
@@ -37,21 +68,44 @@ def _alias_map(text: str) -> str:
     return ALIASES.get(lower_t, text)
 
 
-def extract_entities(text: str):
-    """
-    Run spaCy NER, clean, dedup, normalize, alias-map, and sort.
-    """
-    if not text:
-        return {}
+@lru_cache(maxsize=TERM_CACHE_SIZE)
+def _clean_entity(text: str):
+    """Filtered, normalized and alias-mapped entity text (None if rejected); the same names recur across a corpus."""
+    if not _is_clean_entity(text):
+        return None
+    return _alias_map(normalize_text(text))
+
 
-    doc = nlp(text)
+def _collect(doc):
     entities = defaultdict(set)
 
     for ent in doc.ents:
-        if not _is_clean_entity(ent.text):
+        norm_text = _clean_entity(ent.text)
+        if norm_text is None:
             continue
-        norm_text = normalize_text(ent.text)
-        norm_text = _alias_map(norm_text)
         entities[ent.label_].add(norm_text)
 
     return {label: sorted(vals, key=lambda x: x.lower()) for label, vals in entities.items()}
+
+
+def extract_entities_batch(texts, batch_size: int = NER_BATCH_SIZE, n_process: int = NER_N_PROCESS):
+    """
+    Batch form of `extract_entities`: one nlp.pipe pass over all texts.
+    Returns one entity dict per input text, in order.
+    """
+    texts = list(texts)
+    results = [{} for _ in texts]
+    todo = [i for i, t in enumerate(texts) if t]
+    docs = get_nlp().pipe((texts[i] for i in todo), batch_size=batch_size, n_process=n_process)
+    for i, doc in zip(todo, docs):
+        results[i] = _collect(doc)
+    return results
+
+
+def extract_entities(text: str):
+    """
+    Run spaCy NER, clean, dedup, normalize, alias-map, and sort.
+    """
+    if not text:
+        return {}
+    return _collect(get_nlp()(text))
@@ -0,0 +1,170 @@
+# loader.py
+import json
+import re
+from pathlib import Path
+from typing import Iterator, Tuple
+
+NDJSON_SUFFIXES = {".ndjson", ".jsonl"}
+NDJSON_HEADER_MAX = 1 << 16    # a header line is short; a compact JSON bundle's first line is the whole file
+JSON_READ_SIZE = 1 << 16       # characters per refill when streaming a JSON bundle
+
+_NON_SPACE = re.compile(r"\S")
+
+def _is_ndjson(file_path: Path) -> bool:
+    if file_path.suffix.lower() in NDJSON_SUFFIXES:
+        return True
+    with open(file_path, "r", encoding="utf-8") as f:
+        first = f.readline(NDJSON_HEADER_MAX).strip()
+    try:
+        record = json.loads(first)
+    except ValueError:
+        return False   # first line of an indented JSON document
+    return isinstance(record, dict) and record.get("type") == "header"
+
+def _iter_ndjson_articles(file_path: Path) -> Iterator[dict]:
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if record.get("type") == "article":
+                yield record
+
+def _read_ndjson_query(file_path: Path) -> str:
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                return json.loads(line).get("query", "")
+    return ""
+
+class _JsonStream:
+    """
+    Pull parser for one JSON document read from a text file. Structural
+    characters are consumed one at a time and each value is decoded with
+    `JSONDecoder.raw_decode` from a buffer that is refilled as needed, so only
+    the value being decoded (and one read chunk) is in memory.
+    """
+
+    def __init__(self, f):
+        self._f = f
+        self._buf = ""
+        self._pos = 0
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, size: int = JSON_READ_SIZE) -> bool:
+        chunk = self._f.read(size)
+        if not chunk:
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """The next non-whitespace character without consuming it; "" at end of input."""
+        while True:
+            m = _NON_SPACE.search(self._buf, self._pos)
+            if m:
+                self._pos = m.start()
+                return self._buf[self._pos]
+            self._pos = len(self._buf)
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        c = self.peek()
+        if not c or c not in chars:
+            raise ValueError(f"Malformed JSON bundle: expected one of {chars!r}, got {c or 'end of file'!r}")
+        self._pos += 1
+        return c
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # Incomplete value: read at least as much again, so a large value costs O(size) overall
+                if not self._fill(max(JSON_READ_SIZE, len(self._buf) - self._pos)):
+                    raise
+                continue
+            # A number or literal ending at the buffer's end may continue in the next chunk
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+    def members(self) -> Iterator[str]:
+        """Keys of an object; the caller consumes each value before asking for the next key."""
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.expect(",}") == "}":
+                return
+
+    def items(self) -> Iterator:
+        """Elements of an array, decoded one at a time; null reads as empty."""
+        if self.peek() != "[":
+            yield from self.value() or []
+            return
+        self._pos += 1
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+def read_json_fields(file_path: Path, *keys: str) -> dict:
+    """
+    Top-level fields of a JSON bundle by name, read in one streaming pass that
+    stops once all are found. An `articles` array on the way is skipped one
+    element at a time, so fields written after it cost one article of memory.
+    """
+    wanted, fields = set(keys), {}
+    with open(file_path, "r", encoding="utf-8") as f:
+        stream = _JsonStream(f)
+        for key in stream.members():
+            if key in wanted:
+                fields[key] = stream.value()
+                if len(fields) == len(wanted):
+                    break
+            elif key == "articles":
+                for _ in stream.items():
+                    pass
+            else:
+                stream.value()
+    return fields
+
+def _read_json_query(file_path: Path) -> str:
+    """The bundle's query. The researcher writes it first; articles before it are skipped one by one."""
+    return read_json_fields(file_path, "query").get("query") or ""
+
+def _iter_json_articles(file_path: Path) -> Iterator[dict]:
+    with open(file_path, "r", encoding="utf-8") as f:
+        stream = _JsonStream(f)
+        for key in stream.members():
+            if key == "articles":
+                yield from stream.items()
+                return
+            stream.value()
+
+def load_research(file_path: Path) -> Tuple[str, Iterator[dict]]:
+    """
+    Open Researcher Agent output and return (query, articles).
+
+    Accepts the single-document JSON bundle or the streaming NDJSON format
+    (header / article / trailer records). Either way the articles are read
+    lazily, so only the current article is in memory: NDJSON one line at a
+    time, JSON by decoding the elements of the `articles` array one by one.
+    """
+    file_path = Path(file_path)
+    if _is_ndjson(file_path):
+        return _read_ndjson_query(file_path), _iter_ndjson_articles(file_path)
+    return _read_json_query(file_path), _iter_json_articles(file_path)
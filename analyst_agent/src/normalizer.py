@@ -1,26 +1,66 @@
 # normalizer.py
+"""
+Text and term normalization. Article texts are normalized once each; short
+terms (keywords, entity names) repeat heavily across a corpus, so their
+normalized and cleaned forms are memoized per process.
+"""
 import re
 import unicodedata
-from typing import List
+from functools import lru_cache
+from typing import Iterable, List
+
+TERM_CACHE_SIZE = 200_000   # distinct keywords / entity names memoized per process
+
+_WHITESPACE = re.compile(r"\s+")
+# `(+75%)`-style markers, then any leftover bracket or percent sign, in one pass
+_KEYWORD_NOISE = re.compile(r"\(\+?\d+%?\)|[()\[\]{}%]")
+_MULTI_SPACE = re.compile(r"\s{2,}")
+_KEYWORD_EDGES = " ,.;:-_"
 
 def normalize_text(text: str) -> str:
     """Clean whitespace, normalize Unicode, strip."""
     if not text:
         return ""
-    # Normalize unicode
-    text = unicodedata.normalize("NFKC", text)
+    # Normalize unicode (ASCII is already NFKC-normal)
+    if not text.isascii():
+        text = unicodedata.normalize("NFKC", text)
     # Normalize whitespace
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE.sub(" ", text)
     return text.strip()
 
+@lru_cache(maxsize=TERM_CACHE_SIZE)
+def normalize_term(term: str) -> str:
+    """`normalize_text` for short, repeated strings such as keywords and entity names."""
+    return normalize_text(term)
+
 def normalize_list(items: List[str]) -> List[str]:
     """Normalize, deduplicate while preserving order."""
     seen = set()
     output = []
     for item in items:
-        norm = normalize_text(item)
+        norm = normalize_term(item)
         low = norm.lower()
         if norm and low not in seen:
             seen.add(low)
             output.append(norm)
     return output
+
+@lru_cache(maxsize=TERM_CACHE_SIZE)
+def clean_keyword(keyword: str) -> str:
+    """Lowercase, drop percent markers and brackets, collapse spaces, trim punctuation."""
+    k = _KEYWORD_NOISE.sub("", keyword.strip().lower())
+    k = _MULTI_SPACE.sub(" ", k)
+    return k.strip(_KEYWORD_EDGES)
+
+def clean_keyword_list(keywords: Iterable[str]) -> List[str]:
+    """`clean_keyword` over a list; empties and duplicates dropped, order kept."""
+    seen = set()
+    cleaned = []
+    for kw in keywords:
+        if not kw:
+            continue
+        k = clean_keyword(kw)
+        if k and k not in seen:
+            seen.add(k)
+            cleaned.append(k)
+    return cleaned
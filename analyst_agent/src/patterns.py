@@ -1,92 +1,342 @@
 # patterns.py
-from collections import Counter, defaultdict
+from array import array
+from dataclasses import dataclass
 from datetime import datetime
+import re
 import numpy as np
 
-def detect_co_occurrences(articles, top_k=10):
-    """Identify pairs of entities/keywords that frequently appear in the same article."""
-    pair_counts = Counter()
-    for art in articles:
-        # Combine entities and keywords for a broader view
-        terms = set(art.keywords)
-        for label, entities in art.entities.items():
-            terms.update([e.lower() for e in entities])
-        
-        # Sort terms to ensure (A, B) is same as (B, A)
-        sorted_terms = sorted(list(terms))
-        for i in range(len(sorted_terms)):
-            for j in range(i + 1, len(sorted_terms)):
-                pair_counts[(sorted_terms[i], sorted_terms[j])] += 1
-                
-    return [{"pair": list(pair), "count": count} for pair, count in pair_counts.most_common(top_k)]
+from .schema import ArticleColumns
+
+_ISO_DAY = re.compile(r"\d{4}-\d{2}-\d{2}(?:$|[T ])")
+
+CO_OCCURRENCE_WEIGHTINGS = ("count", "source_weight", "tfidf")
+CO_OCCURRENCE_BLOCK = 2048   # term columns per XᵀX block; bounds peak memory
+
+def _top_rows(rows, cols, counts, scores, top_k):
+    """Best top_k entries by score, then count, then alphabetical pair."""
+    order = np.lexsort((cols, rows, -counts, -scores))[:top_k]
+    return rows[order], cols[order], counts[order], scores[order]
+
+def detect_co_occurrences(articles, top_k=10, weighting="count", min_support=1, block_size=CO_OCCURRENCE_BLOCK):
+    """
+    Identify pairs of entities/keywords that frequently appear in the same article.
+    Accepts the articles or a PatternAccumulator they were streamed into.
+
+    Co-occurrence is XᵀX over a sparse article×term incidence matrix, computed a
+    block of term columns at a time and reduced to the running top_k, so the full
+    pair table is never held in memory. Pairs shared by fewer than min_support
+    articles are dropped. weighting ranks pairs by plain article count, by the
+    summed source_weight of the articles they share, or by TF-IDF (count scaled
+    by both terms' inverse document frequency).
+    """
+    from scipy import sparse
+    if weighting not in CO_OCCURRENCE_WEIGHTINGS:
+        raise ValueError(f"weighting must be one of {CO_OCCURRENCE_WEIGHTINGS}, got {weighting!r}")
+    X, vocab, row_w = _as_accumulator(articles).incidence()
+    if X.shape[1] < 2:
+        return []
+
+    # A pair can't be shared by more articles than either of its terms appears in
+    df = np.asarray(X.sum(axis=0)).ravel()
+    keep = np.flatnonzero(df >= max(1, min_support))
+    if len(keep) < 2:
+        return []
+    X = X[:, keep].tocsc()
+    df = df[keep]
+    vocab = [vocab[i] for i in keep]
+
+    XT = X.T.tocsr()
+    if weighting == "source_weight":
+        WT = XT.multiply(row_w.astype(np.float32)[np.newaxis, :]).tocsr()
+    elif weighting == "tfidf":
+        idf = (np.log((1 + X.shape[0]) / (1 + df)) + 1).astype(np.float32)
+        WT = XT.multiply(idf[:, np.newaxis]).tocsr()
+    else:
+        WT = None
+
+    best = (np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0, np.float64), np.empty(0, np.float64))
+    n_terms = X.shape[1]
+    for start in range(0, n_terms, block_size):
+        block = X[:, start:start + block_size]
+        counts = sparse.triu(XT @ block, k=1 - start).tocoo()   # i < j only
+        mask = counts.data >= min_support
+        rows, cols = counts.row[mask].astype(np.int64), counts.col[mask].astype(np.int64) + start
+        pair_counts = counts.data[mask].astype(np.float64)
+        if not len(rows):
+            continue
+        if WT is None:
+            pair_scores = pair_counts
+        else:
+            weighted = (WT @ block).tocsr()
+            if weighting == "tfidf":
+                weighted = weighted.multiply(idf[start:start + block_size][np.newaxis, :]).tocsr()
+            pair_scores = np.asarray(weighted[rows, cols - start]).ravel().astype(np.float64)
+        merged = [np.concatenate([b, n]) for b, n in zip(best, (rows, cols, pair_counts, pair_scores))]
+        best = _top_rows(*merged, top_k)
+
+    results = []
+    for i, j, count, score in zip(*best):
+        entry = {"pair": [vocab[i], vocab[j]], "count": int(count)}
+        if weighting != "count":
+            entry["score"] = float(score)
+        results.append(entry)
+    return results
+
+DIVERGENCE_MIN_VARIANCE = 0.1   # threshold for 'interesting' divergence
+DIVERGENCE_TOP_K = 5
+
+@dataclass
+class PatternTable:
+    """
+    Columnar view of an analysed bundle, built once and shared by every pattern statistic.
+
+    Strings are interned to integer codes while the table is built, so grouping is a
+    bincount rather than a sort. Codes follow first-seen order.
+    """
+    day_labels: list            # YYYY-MM-DD keys
+    day: np.ndarray             # day code per dated article
+    day_sentiment: np.ndarray
+    entity_labels: list         # lowercased entity names
+    entity: np.ndarray          # entity code per mention
+    entity_sentiment: np.ndarray
+
+def _day_key(date_str):
+    """Calendar day of an ISO timestamp, in the timestamp's own offset."""
+    try:
+        return datetime.fromisoformat(date_str.replace("Z", "+00:00")).strftime("%Y-%m-%d")
+    except (ValueError, TypeError):
+        # Fallback for other formats or if it's already just a date
+        return date_str[:10] if isinstance(date_str, str) else "Unknown"
+
+class PatternAccumulator:
+    """
+    Streams analysed articles into the compact columns the pattern statistics
+    need: interned day, entity and term codes with sentiments and source
+    weights. Nothing else of an article is kept, so patterns for an arbitrarily
+    large bundle cost a few numbers per article. With `terms=False` the
+    co-occurrence columns are skipped.
+    """
+
+    def __init__(self, terms: bool = True):
+        self._terms = terms
+        self._day_codes, self._entity_codes, self._term_codes = {}, {}, {}
+        self._day_labels, self._entity_labels, self._term_labels = [], [], []
+        self._lowered = {}          # entity as written -> code of its lowercased form
+        self._days, self._day_sent = array("q"), array("d")
+        self._ents, self._ent_sent = array("q"), array("d")
+        self._term_ids, self._term_ends, self._weights = array("q"), array("q"), array("d")
+
+    @staticmethod
+    def _intern(key, codes, labels):
+        code = codes.get(key)
+        if code is None:
+            code = codes[key] = len(labels)
+            labels.append(key)
+        return code
+
+    def add(self, art):
+        score = art.sentiment_score
+        date_str = art.published
+        if date_str:
+            # ISO dates (the common case) are keyed by their prefix without a datetime round trip
+            key = date_str[:10] if _ISO_DAY.match(date_str) else _day_key(date_str)
+            self._days.append(self._intern(key, self._day_codes, self._day_labels))
+            self._day_sent.append(score)
+        lowered = self._lowered
+        # Sentence-level sentiment of each entity where available, else the article's
+        by_entity = getattr(art, "entity_sentiment", None) or {}
+        for entities in art.entities.values():
+            for ent in entities:
+                code = lowered.get(ent)
+                if code is None:
+                    code = lowered[ent] = self._intern(ent.lower(), self._entity_codes, self._entity_labels)
+                self._ents.append(code)
+                self._ent_sent.append(by_entity.get(ent, score))
+        if self._terms:
+            # Keywords plus lowercased entities: the term set used for co-occurrence
+            terms = set(art.keywords)
+            for entities in art.entities.values():
+                terms.update([self._entity_labels[lowered[e]] for e in entities])
+            self._term_ids.extend(self._intern(t, self._term_codes, self._term_labels) for t in terms)
+            self._term_ends.append(len(self._term_ids))
+            self._weights.append(art.source_weight)
+
+    def extend(self, articles):
+        for art in articles:
+            self.add(art)
+        return self
+
+    @classmethod
+    def from_columns(cls, columns: ArticleColumns, terms: bool = True) -> "PatternAccumulator":
+        """
+        The same columns built from an ArticleColumns store. Its string codes are
+        remapped once per distinct string and the per-mention work is array indexing.
+        """
+        acc = cls(terms=terms)
+        strings = columns.strings
+        n = len(columns)
+        scores = np.array(columns.sentiment_score, dtype=np.float64)
+
+        # Lookup tables indexed by string code; the extra last slot answers code -1
+        def remap(codes, key):
+            table = np.full(len(strings) + 1, -1, dtype=np.int64)
+            for code in dict.fromkeys(codes.tolist()):     # first-seen order, as `add` interns
+                if code >= 0:
+                    table[code] = key(code)
+            return table[codes] if len(codes) else codes
+
+        def day_code(code):
+            date_str = strings[code]
+            if not date_str:
+                return -1
+            key = date_str[:10] if _ISO_DAY.match(date_str) else _day_key(date_str)
+            return acc._intern(key, acc._day_codes, acc._day_labels)
+
+        days = remap(np.array(columns.published, dtype=np.int64), day_code)
+        dated = days >= 0
+        acc._days = array("q", days[dated].tobytes())
+        acc._day_sent = array("d", scores[dated].tobytes())
+
+        def entity_code(code):
+            name = strings[code]
+            acc._lowered[name] = acc._intern(name.lower(), acc._entity_codes, acc._entity_labels)
+            return acc._lowered[name]
+
+        ents = remap(np.array(columns.entity, dtype=np.int64), entity_code)
+        mentions = np.diff(np.array(columns.entity_ends, dtype=np.int64), prepend=0)
+        ent_sent = np.array(columns.entity_sentiment, dtype=np.float64)
+        ent_sent = np.where(np.isnan(ent_sent), np.repeat(scores, mentions), ent_sent)
+        acc._ents = array("q", ents.tobytes())
+        acc._ent_sent = array("d", ent_sent.tobytes())
+
+        if terms:
+            def term_code(label):
+                return acc._intern(label, acc._term_codes, acc._term_labels)
+
+            kws = remap(np.array(columns.keyword, dtype=np.int64), lambda code: term_code(strings[code]))
+            ent_terms = np.array([term_code(label) for label in acc._entity_labels], dtype=np.int64)
+            per_article = np.diff(np.array(columns.keyword_ends, dtype=np.int64), prepend=0)
+            owner = np.concatenate([np.repeat(np.arange(n), per_article), np.repeat(np.arange(n), mentions)])
+            term = np.concatenate([kws, ent_terms[ents] if len(ents) else ents])
+            # One entry per distinct (article, term), like the set built in `add`
+            width = max(1, len(acc._term_labels))
+            pairs = np.unique(owner * width + term)
+            acc._term_ids = array("q", (pairs % width).tobytes())
+            acc._term_ends = array("q", np.cumsum(np.bincount(pairs // width, minlength=n)).tobytes())
+            acc._weights = array("d", np.array(columns.source_weight, dtype=np.float64).tobytes())
+        return acc
+
+    def table(self) -> PatternTable:
+        return PatternTable(
+            day_labels=self._day_labels,
+            day=np.array(self._days, dtype=np.int64),
+            day_sentiment=np.array(self._day_sent, dtype=np.float64),
+            entity_labels=self._entity_labels,
+            entity=np.array(self._ents, dtype=np.int64),
+            entity_sentiment=np.array(self._ent_sent, dtype=np.float64),
+        )
+
+    def incidence(self):
+        """
+        Binary article×term CSR matrix, its vocabulary and the article weights.
+        Columns are renumbered into sorted term order, so column i < j means term i < term j.
+        """
+        from scipy import sparse
+        vocab = sorted(self._term_labels)
+        rank = np.empty(len(vocab), dtype=np.int32)
+        rank[sorted(range(len(vocab)), key=self._term_labels.__getitem__)] = np.arange(len(vocab), dtype=np.int32)
+        indices = rank[np.array(self._term_ids, dtype=np.int64)] if len(self._term_ids) else np.empty(0, np.int32)
+        indptr = np.zeros(len(self._term_ends) + 1, dtype=np.int64)
+        indptr[1:] = np.array(self._term_ends, dtype=np.int64)
+        data = np.ones(len(indices), dtype=np.float32)
+        X = sparse.csr_matrix((data, indices, indptr), shape=(len(self._term_ends), len(vocab)))
+        return X, vocab, np.array(self._weights, dtype=np.float64)
+
+def build_pattern_table(articles):
+    """One pass over the articles; every date is parsed exactly once."""
+    if isinstance(articles, ArticleColumns):
+        return PatternAccumulator.from_columns(articles, terms=False).table()
+    return PatternAccumulator(terms=False).extend(articles).table()
+
+def _as_accumulator(articles_or_acc):
+    if isinstance(articles_or_acc, PatternAccumulator):
+        return articles_or_acc
+    if isinstance(articles_or_acc, ArticleColumns):
+        return PatternAccumulator.from_columns(articles_or_acc)
+    return PatternAccumulator().extend(articles_or_acc)
+
+def _as_table(articles_or_table):
+    if isinstance(articles_or_table, PatternTable):
+        return articles_or_table
+    return build_pattern_table(articles_or_table)
+
+def _grouped(codes, values, n_groups):
+    """Counts, means and population variances of values per integer code."""
+    counts = np.bincount(codes, minlength=n_groups)
+    safe = np.maximum(counts, 1)
+    means = np.bincount(codes, weights=values, minlength=n_groups) / safe
+    variances = np.bincount(codes, weights=(values - means[codes]) ** 2, minlength=n_groups) / safe
+    return counts, means, variances
 
 def analyze_temporal_trends(articles):
     """Analyze article volume and average sentiment over time."""
-    time_series = defaultdict(lambda: {"count": 0, "sentiment_sum": 0.0})
-    
-    for art in articles:
-        date_str = art.published
-        if not date_str:
-            continue
-            
-        try:
-            # Try parsing isoformat or just the date part
-            dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            key = dt.strftime("%Y-%m-%d")
-        except (ValueError, TypeError):
-            # Fallback for other formats or if it's already just a date
-            key = date_str[:10] if isinstance(date_str, str) else "Unknown"
-            
-        time_series[key]["count"] += 1
-        time_series[key]["sentiment_sum"] += art.sentiment_score
-        
-    sorted_keys = sorted(time_series.keys())
+    table = _as_table(articles)
+    counts, means, _ = _grouped(table.day, table.day_sentiment, len(table.day_labels))
+    order = sorted(range(len(table.day_labels)), key=table.day_labels.__getitem__)
     return [
-        {
-            "date": k,
-            "count": time_series[k]["count"],
-            "avg_sentiment": time_series[k]["sentiment_sum"] / time_series[k]["count"]
-        }
-        for k in sorted_keys
+        {"date": table.day_labels[i], "count": int(counts[i]), "avg_sentiment": float(means[i])}
+        for i in order
     ]
 
 def find_divergent_entities(articles, min_mentions=3):
     """Identify entities that have polarizing sentiment across different sources."""
-    entity_sentiments = defaultdict(list)
-    for art in articles:
-        for label, entities in art.entities.items():
-            for ent in entities:
-                entity_sentiments[ent.lower()].append(art.sentiment_score)
-                
-    divergence = []
-    for ent, scores in entity_sentiments.items():
-        if len(scores) >= min_mentions:
-            variance = np.var(scores)
-            if variance > 0.1: # Threshold for 'interesting' divergence
-                divergence.append({
-                    "entity": ent,
-                    "variance": float(variance),
-                    "mentions": len(scores),
-                    "avg_sentiment": float(np.mean(scores))
-                })
-    return sorted(divergence, key=lambda x: x["variance"], reverse=True)[:5]
+    table = _as_table(articles)
+    counts, means, variances = _grouped(table.entity, table.entity_sentiment, len(table.entity_labels))
+    keep = np.flatnonzero((counts >= min_mentions) & (variances > DIVERGENCE_MIN_VARIANCE))
+    # Highest variance first; equal variances keep first-mention order (the code order)
+    keep = keep[np.argsort(-variances[keep], kind="stable")][:DIVERGENCE_TOP_K]
+    return [
+        {
+            "entity": table.entity_labels[i],
+            "variance": float(variances[i]),
+            "mentions": int(counts[i]),
+            "avg_sentiment": float(means[i]),
+        }
+        for i in keep
+    ]
+
+def _trend_from_counts(counts):
+    if len(counts) < 2:
+        return {"direction": "stable", "growth_rate": 0.0, "data_points": len(counts)}
 
-def calculate_historical_trend(articles):
-    """Calculate a simple trend direction based on historical article dates."""
-    trends = analyze_temporal_trends(articles)
-    if len(trends) < 2:
-        return {"direction": "stable", "growth_rate": 0.0, "data_points": len(trends)}
-        
     # Simple linear slope logic
-    counts = [t["count"] for t in trends]
     x = np.arange(len(counts))
-    y = np.array(counts)
+    y = np.asarray(counts, dtype=np.float64)
     slope, _ = np.polyfit(x, y, 1)
-    
+
     direction = "upward" if slope > 0.1 else "downward" if slope < -0.1 else "stable"
     return {
         "direction": direction,
         "slope": float(slope),
-        "data_points": len(trends),
-        "recent_avg": float(np.mean(counts[-3:])) if len(counts) >=3 else float(np.mean(counts))
+        "data_points": len(counts),
+        "recent_avg": float(np.mean(y[-3:]))
+    }
+
+def calculate_historical_trend(articles):
+    """Calculate a simple trend direction based on historical article dates."""
+    return _trend_from_counts([t["count"] for t in analyze_temporal_trends(articles)])
+
+def compute_patterns(articles, top_k=10):
+    """
+    All bundle-level pattern statistics from one pass: takes the articles, an
+    ArticleColumns store or a PatternAccumulator they were streamed into.
+    """
+    acc = _as_accumulator(articles)
+    table = acc.table()
+    temporal = analyze_temporal_trends(table)
+    return {
+        "co_occurrences": detect_co_occurrences(acc, top_k=top_k),
+        "temporal_trends": temporal,
+        "divergent_entities": find_divergent_entities(table),
+        "historical_trend": _trend_from_counts([t["count"] for t in temporal]),
     }
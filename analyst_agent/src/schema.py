@@ -1,5 +1,6 @@
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional, Any
+from array import array
+from dataclasses import dataclass, fields
+from typing import List, Dict, Optional, Any, Union
 
 @dataclass
 class ArticleAnalysis:
@@ -16,15 +17,172 @@ class ArticleAnalysis:
     topic_cluster: Optional[int]
     source_weight: float
     extra: Optional[Dict[str, Any]]
+    entity_sentiment: Optional[Dict[str, float]] = None
+
+    def to_dict(self):
+        """Fields in declaration order; values are shared, not deep-copied as by `asdict`."""
+        return {name: getattr(self, name) for name in _ARTICLE_FIELDS}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ArticleAnalysis":
+        """An article as read back from a saved bundle; fields it lacks are None."""
+        return cls(**{name: data.get(name) for name in _ARTICLE_FIELDS})
+
+_ARTICLE_FIELDS = tuple(f.name for f in fields(ArticleAnalysis))
+_NAN = float("nan")
+
+class ArticleColumns:
+    """
+    Column store for an analysed corpus. Entity names, keywords, labels,
+    sources and dates are interned once into a shared string pool and kept as
+    integer codes; sentiment, weight and topic cluster live in typed arrays.
+    Per-article text (title, url, summary) and `extra` stay as plain lists.
+
+    Behaves as a read-only sequence of ArticleAnalysis (rebuilt on access);
+    `to_dicts` serializes straight from the columns, and pattern statistics
+    read the code arrays directly (see `PatternAccumulator.from_columns`).
+    """
+
+    __slots__ = (
+        "strings", "_codes",
+        "title", "url", "summary", "extra",
+        "published", "source", "source_type", "sentiment_label",
+        "sentiment_score", "source_weight", "topic_cluster",
+        "group_label", "group_size", "group_ends",
+        "entity", "entity_sentiment", "entity_ends", "has_entity_sentiment",
+        "keyword", "keyword_ends",
+    )
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._codes: Dict[str, int] = {}
+        self.title, self.url, self.summary, self.extra = [], [], [], []
+        # codes into `strings`; -1 stands for None
+        self.published, self.source = array("q"), array("q")
+        self.source_type, self.sentiment_label = array("q"), array("q")
+        self.sentiment_score, self.source_weight = array("d"), array("d")
+        self.topic_cluster = array("q")
+        # entities: per label group its label code and size; groups and mentions are flat
+        self.group_label, self.group_size, self.group_ends = array("q"), array("q"), array("q")
+        self.entity, self.entity_sentiment = array("q"), array("d")   # NaN: no sentence-level score
+        self.entity_ends = array("q")
+        self.has_entity_sentiment = array("b")
+        self.keyword, self.keyword_ends = array("q"), array("q")
+
+    def intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.strings)
+            self.strings.append(value)
+        return code
+
+    def _string(self, code: int) -> Optional[str]:
+        return self.strings[code] if code >= 0 else None
+
+    def append(self, analysis: ArticleAnalysis):
+        intern = self.intern
+        self.title.append(analysis.title)
+        self.url.append(analysis.url)
+        self.summary.append(analysis.summary)
+        self.extra.append(analysis.extra)
+        self.published.append(intern(analysis.published))
+        self.source.append(intern(analysis.source))
+        self.source_type.append(intern(analysis.source_type))
+        self.sentiment_label.append(intern(analysis.sentiment_label))
+        self.sentiment_score.append(analysis.sentiment_score)
+        self.source_weight.append(analysis.source_weight)
+        self.topic_cluster.append(-1 if analysis.topic_cluster is None else analysis.topic_cluster)
+
+        by_entity = analysis.entity_sentiment
+        self.has_entity_sentiment.append(by_entity is not None)
+        by_entity = by_entity or {}
+        for label, names in analysis.entities.items():
+            self.group_label.append(intern(label))
+            self.group_size.append(len(names))
+            self.entity.extend(intern(n) for n in names)
+            self.entity_sentiment.extend(by_entity.get(n, _NAN) for n in names)
+        self.group_ends.append(len(self.group_label))
+        self.entity_ends.append(len(self.entity))
+        self.keyword.extend(intern(k) for k in analysis.keywords)
+        self.keyword_ends.append(len(self.keyword))
+
+    def extend(self, analyses):
+        for analysis in analyses:
+            self.append(analysis)
+        return self
+
+    def __len__(self):
+        return len(self.title)
+
+    def _row(self, i: int) -> dict:
+        strings = self.strings
+        entities, by_entity = {}, {}
+        m = self.entity_ends[i - 1] if i else 0
+        for g in range(self.group_ends[i - 1] if i else 0, self.group_ends[i]):
+            size = self.group_size[g]
+            names = [strings[c] for c in self.entity[m:m + size]]
+            entities[strings[self.group_label[g]]] = names
+            for name, score in zip(names, self.entity_sentiment[m:m + size]):
+                if score == score and name not in by_entity:   # skip NaN
+                    by_entity[name] = score
+            m += size
+        k0 = self.keyword_ends[i - 1] if i else 0
+        topic = self.topic_cluster[i]
+        return {
+            "title": self.title[i],
+            "url": self.url[i],
+            "published": self._string(self.published[i]),
+            "source": self._string(self.source[i]),
+            "source_type": self._string(self.source_type[i]),
+            "summary": self.summary[i],
+            "entities": entities,
+            "keywords": [strings[c] for c in self.keyword[k0:self.keyword_ends[i]]],
+            "sentiment_score": self.sentiment_score[i],
+            "sentiment_label": self._string(self.sentiment_label[i]),
+            "topic_cluster": None if topic < 0 else topic,
+            "source_weight": self.source_weight[i],
+            "extra": self.extra[i],
+            "entity_sentiment": by_entity if self.has_entity_sentiment[i] else None,
+        }
+
+    def iter_dicts(self):
+        """Each article as the dict `ArticleAnalysis.to_dict` would give, read from the columns."""
+        return (self._row(i) for i in range(len(self)))
+
+    def to_dicts(self) -> List[dict]:
+        return list(self.iter_dicts())
+
+    def __getitem__(self, i: int) -> ArticleAnalysis:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("article index out of range")
+        return ArticleAnalysis(**self._row(i))
+
+    def __iter__(self):
+        return (ArticleAnalysis(**row) for row in self.iter_dicts())
 
 @dataclass
 class AnalysisBundle:
     query: str
-    articles: List[ArticleAnalysis]
+    articles: Union[List[ArticleAnalysis], ArticleColumns]
     summary_meta: Dict[str, Any]
     insights: Optional[str] = None
     patterns: Optional[Dict[str, Any]] = None
     topic_map: Optional[Dict[int, str]] = None
 
     def to_dict(self):
-        return asdict(self)
+        if isinstance(self.articles, ArticleColumns):
+            articles = self.articles.to_dicts()
+        else:
+            articles = [a.to_dict() for a in self.articles]
+        return {
+            "query": self.query,
+            "articles": articles,
+            "summary_meta": self.summary_meta,
+            "insights": self.insights,
+            "patterns": self.patterns,
+            "topic_map": self.topic_map,
+        }
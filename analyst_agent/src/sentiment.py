@@ -1,18 +1,124 @@
-from nltk.sentiment import SentimentIntensityAnalyzer
-import nltk
-nltk.download('vader_lexicon', quiet=True)
+# sentiment.py
+"""
+Sentence-level VADER sentiment with a batch API.
+
+Articles are scored sentence by sentence from the shared parse (see
+corpus.ParsedText): VADER's heuristics stay local to short strings, sentences
+without a lexicon word are settled by a set lookup, repeated sentences
+(navigation, cookie notices, syndicated paragraphs) are scored once through a
+memo, and article scores are word-weighted means computed for the
+whole batch with NumPy. Sentence scores also give per-entity sentiment from
+the sentences that mention each entity.
+"""
+import string
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List
+
+import numpy as np
+
+POSITIVE_THRESHOLD = 0.05
+NEGATIVE_THRESHOLD = -0.05
+SENTENCE_CACHE_SIZE = 100_000   # memoized sentence scores per process
+
+_sia = None
+
+
+def get_analyzer():
+    """VADER, built on first use; the lexicon is downloaded only if it is missing."""
+    global _sia
+    if _sia is None:
+        import nltk
+        from nltk.sentiment import SentimentIntensityAnalyzer
+        try:
+            nltk.data.find("sentiment/vader_lexicon.zip")
+        except LookupError:
+            nltk.download('vader_lexicon', quiet=True)
+        _sia = SentimentIntensityAnalyzer()
+    return _sia
+
+
+def sentiment_label(compound: float) -> str:
+    if compound >= POSITIVE_THRESHOLD:
+        return "positive"
+    if compound <= NEGATIVE_THRESHOLD:
+        return "negative"
+    return "neutral"
+
+
+@lru_cache(maxsize=SENTENCE_CACHE_SIZE)
+def sentence_score(sentence: str) -> float:
+    sia = get_analyzer()
+    # VADER only scores lexicon tokens (as written or punctuation-stripped);
+    # a sentence with none of them is 0.0, so skip the full pass
+    tokens = sentence.lower().split()
+    lexicon = sia.lexicon.keys()
+    if lexicon.isdisjoint(tokens) and lexicon.isdisjoint([t.strip(string.punctuation) for t in tokens]):
+        return 0.0
+    return sia.polarity_scores(sentence)["compound"]
+
+
+@dataclass
+class SentimentResult:
+    score: float
+    label: str
+    sentences: List[float]       # compound per sentence, aligned with the parse
+
+
+def get_sentiment_batch(parsed_texts) -> List[SentimentResult]:
+    """
+    Score a batch of ParsedText. The article score is the mean sentence
+    compound weighted by sentence length in words; articles without
+    sentences score 0.0 / neutral.
+    """
+    parsed_texts = list(parsed_texts)
+    owner, scores, weights = [], [], []
+    for i, parsed in enumerate(parsed_texts):
+        for sentence, words in zip(parsed.sentences, parsed.words):
+            owner.append(i)
+            scores.append(sentence_score(sentence))
+            weights.append(max(1, len(words)))
+
+    n = len(parsed_texts)
+    owner = np.asarray(owner, dtype=np.int64)
+    scores = np.asarray(scores, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    totals = np.bincount(owner, weights=weights, minlength=n)
+    article = np.bincount(owner, weights=scores * weights, minlength=n) / np.maximum(totals, 1)
+
+    bounds = np.concatenate([[0], np.cumsum(np.bincount(owner, minlength=n))])
+    return [
+        SentimentResult(score=float(article[i]), label=sentiment_label(float(article[i])),
+                        sentences=scores[bounds[i]:bounds[i + 1]].tolist())
+        for i in range(n)
+    ]
+
+
+def entity_sentiment(parsed, sentence_scores: List[float], entities: Dict[str, List[str]]) -> Dict[str, float]:
+    """
+    Mean compound of the sentences mentioning each entity (case-insensitive).
+    Entities not found verbatim in any sentence are left out.
+    """
+    if not parsed.sentences:
+        return {}
+    lowered = [s.lower() for s in parsed.sentences]
+    scores = np.asarray(sentence_scores, dtype=np.float64)
+    result = {}
+    for names in entities.values():
+        for name in names:
+            if name in result:
+                continue
+            needle = name.lower()
+            hits = [i for i, s in enumerate(lowered) if needle in s]
+            if hits:
+                result[name] = float(scores[hits].mean())
+    return result
 
-_sia = SentimentIntensityAnalyzer()
 
 def get_sentiment(text: str):
+    """Single-article form: (compound, label) of the sentence-level score."""
     if not text.strip():
         return 0.0, "neutral"
-    scores = _sia.polarity_scores(text)
-    compound = scores["compound"]
-    if compound >= 0.05:
-        label = "positive"
-    elif compound <= -0.05:
-        label = "negative"
-    else:
-        label = "neutral"
-    return compound, label
+    from .engine import get_engine
+    result = get_sentiment_batch([get_engine().parse(text)])[0]
+    return result.score, result.label
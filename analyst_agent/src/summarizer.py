@@ -1,12 +1,101 @@
-from sumy.parsers.plaintext import PlaintextParser
-from sumy.nlp.tokenizers import Tokenizer
-from sumy.summarizers.lex_rank import LexRankSummarizer
+# summarizer.py
+"""
+LexRank with bounded cost. sumy's LexRankSummarizer compares every pair of
+sentences in Python, so a 400-sentence scraped page costs ~100x a short news
+item. Here the sentences of an article share one sparse TF-IDF (sumy's
+weighting: max-normalised TF, IDF over the article's sentences); on long
+articles a cheap centroid score keeps the best `LEXRANK_MAX_CANDIDATES`, and
+the similarity graph over those is one sparse product. Articles of up to
+`LEXRANK_MAX_CANDIDATES` sentences are ranked exactly as sumy ranks them.
+"""
+from typing import Tuple
 
-def summarize_text(text: str, sentence_count: int = 3):
-    """Summarize text into a few sentences using LexRank."""
-    if not text.strip():
+import numpy as np
+
+from .corpus import ParsedText
+from .engine import get_engine
+
+LEXRANK_THRESHOLD = 0.1        # cosine above which two sentences are linked (sumy's default)
+LEXRANK_EPSILON = 0.1          # power-method convergence (sumy's default)
+LEXRANK_MAX_CANDIDATES = 64    # side of the similarity matrix on long articles
+
+
+def _sentence_tfidf(words: Tuple[Tuple[str, ...], ...]):
+    """Sentence × term TF-IDF (CSR), rows L2-normalised."""
+    from scipy import sparse
+    vocab, rows, cols = {}, [], []
+    for i, sentence in enumerate(words):
+        for w in sentence:
+            rows.append(i)
+            cols.append(vocab.setdefault(w.lower(), len(vocab)))
+    n = len(words)
+    counts = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(n, len(vocab)))
+    counts.sum_duplicates()
+    # TF normalised by the sentence's most frequent term, as in sumy
+    row_max = counts.max(axis=1).toarray().ravel()
+    tf = sparse.diags(1.0 / np.maximum(row_max, 1)) @ counts
+    df = np.bincount(counts.indices, minlength=len(vocab))
+    idf = np.log(n / (1.0 + df))
+    tfidf = (tf @ sparse.diags(idf)).tocsr()
+    norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return (sparse.diags(1.0 / norms) @ tfidf).tocsr()
+
+
+def _candidates(X, limit: int) -> np.ndarray:
+    """Rows closest to the article centroid, in document order."""
+    if X.shape[0] <= limit:
+        return np.arange(X.shape[0])
+    centroid = np.asarray(X.sum(axis=0)).ravel()
+    scores = X @ centroid
+    return np.sort(np.argsort(-scores, kind="stable")[:limit])
+
+
+def _lexrank_scores(X, threshold: float = LEXRANK_THRESHOLD, epsilon: float = LEXRANK_EPSILON) -> np.ndarray:
+    """Power-method centrality over the thresholded cosine graph of the rows of X."""
+    from scipy import sparse
+    similarity = (X @ X.T).tocsr()
+    similarity.data = (similarity.data > threshold).astype(np.float64)
+    similarity.eliminate_zeros()
+    degrees = np.asarray(similarity.sum(axis=1)).ravel()
+    degrees[degrees == 0] = 1.0
+    transition_t = (sparse.diags(1.0 / degrees) @ similarity).T.tocsr()
+
+    n = X.shape[0]
+    p = np.full(n, 1.0 / n)
+    while True:
+        nxt = transition_t @ p
+        norm = np.linalg.norm(nxt)
+        if norm == 0:
+            return p
+        nxt /= norm
+        delta = np.linalg.norm(nxt - p)
+        p = nxt
+        if delta <= epsilon:
+            return p
+
+
+def lexrank_summary(parsed: ParsedText, sentence_count: int = 3,
+                    max_candidates: int = LEXRANK_MAX_CANDIDATES) -> str:
+    """The `sentence_count` most central sentences, in document order; repeated sentences count once."""
+    if not parsed.sentences:
         return ""
-    parser = PlaintextParser.from_string(text, Tokenizer("english"))
-    summarizer = LexRankSummarizer()
-    summary = summarizer(parser.document, sentence_count)
-    return " ".join(str(sentence) for sentence in summary)
+    X = _sentence_tfidf(parsed.words)
+    rows = _candidates(X, max_candidates)
+    scores = _lexrank_scores(X[rows])
+
+    chosen, seen = [], set()
+    for i in np.argsort(-scores, kind="stable"):
+        sentence = parsed.sentences[rows[i]]
+        if sentence in seen:
+            continue
+        seen.add(sentence)
+        chosen.append(rows[i])
+        if len(chosen) == sentence_count:
+            break
+    return " ".join(parsed.sentences[i] for i in sorted(chosen))
+
+
+def summarize_text(text: str, sentence_count: int = 3):
+    """Summarize text into a few sentences using LexRank (shared engine objects)."""
+    return get_engine().summarize(text, sentence_count)
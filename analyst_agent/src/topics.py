@@ -1,52 +1,224 @@
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.cluster import KMeans
+# topics.py
+"""
+Topic clustering with MiniBatchKMeans over the shared corpus TF-IDF.
+
+k is chosen automatically by silhouette on a sample unless given. A fitted
+`TopicModel` (vocabulary, IDF, centroids, per-cluster counts) can be saved so
+later bundles on the same subject are assigned to the existing clusters and
+the centroids updated as running means, instead of re-clustering from scratch.
+`TopicAssigner` applies the same idea within one streamed run. A model's
+`label_offset` is saved with it, so clusters numbered after those of an
+earlier bundle keep their labels in every later run.
+
+scipy and sklearn are imported inside the functions that use them, so
+importing the analyst does not pay for them.
+"""
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
 import numpy as np
 
-def assign_topics(texts: list, num_clusters: int = 5):
+from .corpus import CorpusMatrix, build_corpus_matrix
+
+TOPIC_MIN_K = 2
+TOPIC_MAX_K = 12
+TOPIC_SAMPLE_SIZE = 2000     # rows scored when choosing k
+TOPIC_BATCH_SIZE = 1024
+TOPIC_MODEL_VERSION = 2       # 2: label_offset
+TOPIC_FIT_SIZE = 2000        # streamed runs fit on this many texts, then assign the rest
+
+
+@dataclass
+class TopicModel:
+    vocabulary: List[str]
+    idf: np.ndarray
+    centroids: np.ndarray        # k × len(vocabulary)
+    counts: np.ndarray           # articles behind each centroid
+    label_offset: int = 0        # label of centroid 0
+
+    @property
+    def names(self) -> Dict[int, str]:
+        """Cluster names from the three heaviest centroid terms, keyed by label."""
+        names = {}
+        for i, center in enumerate(self.centroids):
+            label = i + self.label_offset
+            if self.counts[i] == 0:
+                names[label] = "Miscellaneous"
+                continue
+            top = np.argsort(center)[::-1][:3]
+            terms = [self.vocabulary[j] for j in top if center[j] > 0]
+            names[label] = " & ".join(t.capitalize() for t in terms) if terms else f"Cluster {label+1}"
+        return names
+
+    def transform(self, texts: List[str]):
+        """TF-IDF rows in this model's feature space; terms outside the vocabulary are ignored."""
+        from sklearn.feature_extraction.text import CountVectorizer
+        from sklearn.preprocessing import normalize
+        counts = CountVectorizer(vocabulary=self.vocabulary).transform(texts)
+        return normalize(counts.multiply(self.idf[np.newaxis, :]).tocsr())
+
+    def assign(self, texts: List[str], update: bool = True) -> np.ndarray:
+        """Label of the nearest centroid per text; with `update`, fold the texts into the centroids."""
+        X = self.transform(texts)
+        # argmin ||x - c||² == argmin (||c||² - 2 x·c)
+        scores = np.asarray(X @ self.centroids.T) * 2 - (self.centroids ** 2).sum(axis=1)
+        labels = scores.argmax(axis=1)
+        if update and len(labels):
+            from scipy import sparse
+            k = len(self.centroids)
+            added = np.bincount(labels, minlength=k)
+            members = sparse.csr_matrix((np.ones(len(labels)), (labels, np.arange(len(labels)))),
+                                        shape=(k, len(labels)))
+            sums = (members @ X).toarray()
+            total = self.counts + added
+            grown = added > 0
+            self.centroids[grown] = (
+                self.centroids[grown] * self.counts[grown, np.newaxis] + sums[grown]
+            ) / total[grown, np.newaxis]
+            self.counts = total
+        return labels + self.label_offset
+
+    def save(self, path: Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({
+            "version": TOPIC_MODEL_VERSION,
+            "vocabulary": list(self.vocabulary),
+            "idf": self.idf.tolist(),
+            "centroids": self.centroids.tolist(),
+            "counts": self.counts.tolist(),
+            "label_offset": int(self.label_offset),
+        }), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path) -> "TopicModel":
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(
+            vocabulary=data["vocabulary"],
+            idf=np.asarray(data["idf"], dtype=np.float64),
+            centroids=np.asarray(data["centroids"], dtype=np.float64),
+            counts=np.asarray(data["counts"], dtype=np.int64),
+            label_offset=int(data.get("label_offset", 0)),
+        )
+
+
+def _kmeans(k: int, n_init: int = 3):
+    from sklearn.cluster import MiniBatchKMeans
+    return MiniBatchKMeans(n_clusters=k, random_state=42, n_init=n_init, batch_size=TOPIC_BATCH_SIZE)
+
+
+def choose_k(X, min_k: int = TOPIC_MIN_K, max_k: int = TOPIC_MAX_K, sample_size: int = TOPIC_SAMPLE_SIZE) -> int:
+    """Best silhouette (cosine) over a row sample, one cheap fit per candidate k."""
+    from sklearn.metrics import silhouette_score
+    n = X.shape[0]
+    if n <= min_k:
+        return max(1, n)
+    if n > sample_size:
+        rows = np.random.default_rng(42).choice(n, size=sample_size, replace=False)
+        X = X[rows]
+        n = sample_size
+    best_k, best_score = min_k, -1.0
+    for k in range(min_k, min(max_k, n - 1) + 1):
+        labels = _kmeans(k, n_init=1).fit_predict(X)
+        if len(np.unique(labels)) < 2:
+            continue
+        score = silhouette_score(X, labels, metric="cosine")
+        if score > best_score:
+            best_k, best_score = k, score
+    return best_k
+
+
+def fit_topic_model(corpus: CorpusMatrix, num_clusters: Optional[int] = None, label_offset: int = 0):
+    """Cluster the corpus; returns (labels, TopicModel). Labels start at `label_offset`."""
+    X = corpus.matrix
+    k = num_clusters or choose_k(X)
+    k = max(1, min(k, X.shape[0]))
+    km = _kmeans(k).fit(X)
+    model = TopicModel(
+        vocabulary=[str(t) for t in corpus.vocabulary],
+        idf=np.asarray(corpus.vectorizer.idf_, dtype=np.float64),
+        centroids=np.asarray(km.cluster_centers_, dtype=np.float64),
+        counts=np.bincount(km.labels_, minlength=k).astype(np.int64),
+        label_offset=label_offset,
+    )
+    return km.labels_ + label_offset, model
+
+
+def assign_topics(texts: list, num_clusters: Optional[int] = 5, corpus: CorpusMatrix = None,
+                  model_path: Path = None):
+    """
+    Cluster texts into topics and name each cluster by its top centroid terms.
+    `num_clusters=None` picks k automatically. Pass `corpus` to reuse a matrix
+    already built for these texts. With `model_path`, an existing model there
+    is updated incrementally; otherwise the fitted model is saved to it.
+    """
     clean_texts = [t if t.strip() else "" for t in texts]
-    if len(clean_texts) < num_clusters:
-        num_clusters = max(1, len(clean_texts))
-    
     if not clean_texts or all(not t for t in clean_texts):
         return [0] * len(texts), {0: "General"}
 
-    # Specialized noise words for scraping-derived clusters
-    SEARCH_NOISE = {
-        "com", "bikedekho", "lakh", "crore", "indian", "india", "sales", "electric", 
-        "scooter", "scooters", "market", "units", "year", "news", "updates", "times",
-        "india", "daily", " Jagran", "Jagran", "bikewale", "hindustan", "hindustantimes"
-    }
-    
-    vectorizer = TfidfVectorizer(
-        max_df=0.8, 
-        min_df=1, 
-        stop_words=list(set(list(TfidfVectorizer(stop_words="english").get_stop_words()) + list(SEARCH_NOISE))),
-        max_features=1000
-    )
-    X = vectorizer.fit_transform(clean_texts)
-    
-    km = KMeans(n_clusters=num_clusters, random_state=42, n_init="auto")
-    labels = km.fit_predict(X)
-    
-    # Generate descriptive names for each cluster
-    cluster_names = {}
-    feature_names = vectorizer.get_feature_names_out()
-    
-    for i in range(num_clusters):
-        # Get indices of articles in this cluster
-        indices = np.where(labels == i)[0]
-        if len(indices) == 0:
-            cluster_names[i] = "Miscellaneous"
-            continue
-            
-        # Compute mean TF-IDF vector for this cluster
-        cluster_center = X[indices].mean(axis=0).A1
-        top_indices = cluster_center.argsort()[::-1][:3]
-        top_terms = [feature_names[idx] for idx in top_indices if cluster_center[idx] > 0]
-        
-        if top_terms:
-            cluster_names[i] = " & ".join(t.capitalize() for t in top_terms)
-        else:
-            cluster_names[i] = f"Cluster {i+1}"
-            
-    return labels, cluster_names
+    if model_path is not None and Path(model_path).exists():
+        model = TopicModel.load(model_path)
+        labels = model.assign(clean_texts, update=True)
+    else:
+        if corpus is None:
+            corpus = build_corpus_matrix(clean_texts)
+        labels, model = fit_topic_model(corpus, num_clusters)
+
+    if model_path is not None:
+        model.save(model_path)
+    return labels, model.names
+
+
+class TopicAssigner:
+    """
+    Topic labels for texts that arrive in batches, with bounded memory. The
+    first `fit_size` texts are held back to fit the model (unless one is
+    loaded from `model_path`); every later batch is assigned to the centroids
+    and folded into them. `add` and `finish` hand back (item, label) pairs in
+    arrival order. A newly fitted model numbers its clusters from
+    `label_offset`, so they can follow labels that are already taken; a
+    loaded model keeps the offset it was saved with.
+    """
+
+    def __init__(self, num_clusters: Optional[int] = None, model_path: Path = None,
+                 fit_size: int = TOPIC_FIT_SIZE, label_offset: int = 0):
+        self.num_clusters = num_clusters
+        self.model_path = Path(model_path) if model_path is not None else None
+        self.fit_size = fit_size
+        self.label_offset = label_offset
+        self.model = TopicModel.load(self.model_path) if self.model_path and self.model_path.exists() else None
+        self._fitted = self.model is not None
+        self._items, self._texts = [], []
+
+    @staticmethod
+    def _labelled(items: list, labels) -> list:
+        return [(item, int(label)) for item, label in zip(items, labels)]
+
+    def _fit(self):
+        items, texts = self._items, self._texts
+        self._items, self._texts, self._fitted = [], [], True
+        if not any(t.strip() for t in texts):
+            return self._labelled(items, [self.label_offset] * len(items))
+        labels, self.model = fit_topic_model(build_corpus_matrix(texts), self.num_clusters, self.label_offset)
+        return self._labelled(items, labels)
+
+    def add(self, items: list, texts: List[str]) -> list:
+        if not self._fitted:
+            self._items.extend(items)
+            self._texts.extend(texts)
+            return self._fit() if len(self._texts) >= self.fit_size else []
+        if self.model is None:
+            return self._labelled(items, [self.label_offset] * len(items))
+        return self._labelled(items, self.model.assign(texts, update=True))
+
+    def finish(self) -> list:
+        ready = self._fit() if not self._fitted else []
+        if self.model is not None and self.model_path is not None:
+            self.model.save(self.model_path)
+        return ready
+
+    @property
+    def names(self) -> Dict[int, str]:
+        return self.model.names if self.model is not None else {self.label_offset: "General"}
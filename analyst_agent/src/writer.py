@@ -0,0 +1,59 @@
+# writer.py
+"""
+Incremental writer for analysis bundles. Articles are written as they are
+analysed and the corpus-level fields once at the end, so a bundle of any size
+is saved without holding it in memory. The file matches
+`json.dumps(bundle.to_dict(), indent=2)` of the equivalent in-memory bundle.
+"""
+import json
+import os
+from pathlib import Path
+
+from .schema import ArticleAnalysis
+
+
+class BundleWriter:
+    """Writes to `<path>.part` and renames on `finish`, so readers never see a half-written bundle."""
+
+    def __init__(self, path: Path, ensure_ascii: bool = True):
+        self.path = Path(path)
+        self._part = self.path.with_name(self.path.name + ".part")
+        self._ensure_ascii = ensure_ascii
+        self._fh = None
+        self.articles = 0
+
+    def _dumps(self, value, depth: int) -> str:
+        text = json.dumps(value, indent=2, ensure_ascii=self._ensure_ascii)
+        return text.replace("\n", "\n" + "  " * depth)
+
+    def begin(self, query: str):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self._part, "w", encoding="utf-8")
+        self._fh.write('{\n  "query": ' + self._dumps(query, 1) + ',\n  "articles": [')
+
+    def write_article(self, analysis: ArticleAnalysis):
+        self._fh.write(("\n" if self.articles == 0 else ",\n") + "    " + self._dumps(analysis.to_dict(), 2))
+        self.articles += 1
+
+    def finish(self, summary_meta: dict, insights, patterns: dict, topic_map: dict):
+        self._fh.write("\n  ]" if self.articles else "]")
+        for key, value in (("summary_meta", summary_meta), ("insights", insights),
+                           ("patterns", patterns), ("topic_map", topic_map)):
+            self._fh.write(f',\n  "{key}": ' + self._dumps(value, 1))
+        self._fh.write("\n}")
+        self._fh.close()
+        self._fh = None
+        os.replace(self._part, self.path)
+
+    def close(self):
+        """Abandon an unfinished bundle (the `.part` file is removed)."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+            self._part.unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,63 @@
+import pytest
+
+from analyst_agent.src import cache as cache_module
+from analyst_agent.src import entities
+from analyst_agent.src.cache import AnalysisCache
+
+FEATURES = {"summary": "s", "entities": {}, "keywords": ["k"], "sentiment": 0.1}
+
+
+@pytest.fixture
+def model(monkeypatch):
+    """Stands in for the installed spaCy model's meta.json; set ["version"] to simulate an upgrade."""
+    meta = {"name": "core_web_sm", "version": "3.7.0"}
+    monkeypatch.setattr(entities, "model_meta", lambda: meta)
+    return meta
+
+
+def test_switching_keyword_method_keeps_other_rows(tmp_path, model):
+    path = tmp_path / "analysis.sqlite"
+    rake = AnalysisCache(path, "rake")
+    rake.put("text", dict(FEATURES, keywords=["from rake"]))
+    rake.close()
+
+    yake = AnalysisCache(path, "yake")
+    assert yake.get("text") is None
+    yake.put("text", dict(FEATURES, keywords=["from yake"]))
+    assert yake.close()["entries"] == 2
+
+    rake = AnalysisCache(path, "rake")
+    assert rake.get("text")["keywords"] == ["from rake"]
+    rake.close()
+
+
+def test_new_model_or_analyzer_version_drops_rows(tmp_path, model, monkeypatch):
+    path = tmp_path / "analysis.sqlite"
+    for method in ("rake", "yake"):
+        c = AnalysisCache(path, method)
+        c.put("text", FEATURES)
+        c.close()
+
+    model["version"] = "3.8.0"
+    assert AnalysisCache(path, "rake").close()["entries"] == 0
+
+    c = AnalysisCache(path, "rake")
+    c.put("text", FEATURES)
+    c.close()
+    monkeypatch.setattr(cache_module, "ANALYZER_VERSION", cache_module.ANALYZER_VERSION + "+next")
+    assert AnalysisCache(path, "rake").close()["entries"] == 0
+
+
+def test_lru_eviction_on_close(tmp_path, model, monkeypatch):
+    clock = iter(range(1, 100))
+    monkeypatch.setattr(cache_module.time, "time", lambda: next(clock))
+    c = AnalysisCache(tmp_path / "analysis.sqlite", "rake", max_entries=2)
+    for text in ("a", "b", "c"):
+        c.put(text, FEATURES)
+    c.get("a")
+    c.close()
+
+    c = AnalysisCache(tmp_path / "analysis.sqlite", "rake", max_entries=2)
+    assert c.get("a") is not None and c.get("c") is not None
+    assert c.get("b") is None
+    assert c.close()["hit_rate"] == round(2 / 3, 4)
@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+from analyst_agent.src import loader
+from analyst_agent.src.loader import load_research, read_json_fields
+
+ARTICLES = [
+    {"title": "Ola ⚡ scooter", "url": "http://a/1", "text": "Quote \"escaped\" \\ and\nnewline " * 40,
+     "score": 12345.678e-3, "flags": [True, False, None], "nested": {"a": [1, {"b": []}]}},
+    {"title": "", "url": "http://a/2", "text": "बजाज", "score": -7, "tags": []},
+    {"title": "x", "url": "http://a/3", "text": "{[,:]}", "score": 0},
+]
+
+
+@pytest.fixture(autouse=True)
+def tiny_reads(monkeypatch):
+    # Small chunks so values, keys and numbers straddle refills
+    monkeypatch.setattr(loader, "JSON_READ_SIZE", 7)
+
+
+def _load(path):
+    query, articles = load_research(path)
+    return query, list(articles)
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_json_bundle_matches_json_loads(tmp_path, indent):
+    path = tmp_path / "research.json"
+    bundle = {"query": "electric scooters", "meta": {"cache": {"hits": 3}}, "articles": ARTICLES}
+    path.write_text(json.dumps(bundle, indent=indent, ensure_ascii=indent is None), encoding="utf-8")
+    assert _load(path) == ("electric scooters", ARTICLES)
+
+
+def test_query_after_articles(tmp_path):
+    path = tmp_path / "research.json"
+    path.write_text(json.dumps({"articles": ARTICLES, "query": "late"}), encoding="utf-8")
+    assert _load(path) == ("late", ARTICLES)
+
+
+@pytest.mark.parametrize("document, expected", [
+    ("{}", ("", [])),
+    ('{"query": "q", "articles": []}', ("q", [])),
+    ('{"query": null, "articles": null}', ("", [])),
+    (' \n{ "articles" : [ 1 , 22 ,333 ] ,"query":"q" } \n', ("q", [1, 22, 333])),
+])
+def test_edge_documents(tmp_path, document, expected):
+    path = tmp_path / "research.json"
+    path.write_text(document, encoding="utf-8")
+    assert _load(path) == expected
+
+
+def test_articles_are_decoded_lazily(tmp_path):
+    # Everything after the first article is garbage: only iterating that far may fail
+    path = tmp_path / "research.json"
+    path.write_text('{"query": "q", "articles": [' + json.dumps(ARTICLES[0]) + ", oops", encoding="utf-8")
+    query, articles = load_research(path)
+    assert query == "q"
+    assert next(articles) == ARTICLES[0]
+    with pytest.raises(ValueError):
+        next(articles)
+
+
+def test_fields_after_the_articles(tmp_path):
+    path = tmp_path / "analysis.json"
+    bundle = {"query": "q", "articles": ARTICLES, "patterns": {"x": [1]}, "topic_map": {"0": "battery"}}
+    path.write_text(json.dumps(bundle, indent=2), encoding="utf-8")
+    assert read_json_fields(path, "topic_map", "query") == {"topic_map": {"0": "battery"}, "query": "q"}
+    assert read_json_fields(path, "missing") == {}
+
+
+def test_ndjson_bundle(tmp_path):
+    path = tmp_path / "research.ndjson"
+    records = [{"type": "header", "query": "q"}] + [dict(a, type="article") for a in ARTICLES] + [{"type": "trailer"}]
+    path.write_text("\n".join(json.dumps(r) for r in records) + "\n", encoding="utf-8")
+    query, articles = _load(path)
+    assert query == "q"
+    assert [a["url"] for a in articles] == [a["url"] for a in ARTICLES]
@@ -0,0 +1,98 @@
+import math
+import random
+from collections import Counter, defaultdict
+from itertools import combinations
+
+import pytest
+
+from analyst_agent.src.patterns import PatternAccumulator, detect_co_occurrences
+from analyst_agent.src.schema import ArticleAnalysis
+
+WEIGHTS = (0.5, 1.0, 2.0)   # exact in float32, so weighted sums compare exactly
+
+
+def _article(i, keywords, entities, weight=1.0):
+    return ArticleAnalysis(
+        title=f"a{i}", url=f"http://example.com/{i}", published="2024-05-01", source="s",
+        source_type="news", summary="", entities=entities, keywords=keywords,
+        sentiment_score=0.0, sentiment_label="neutral", topic_cluster=None,
+        source_weight=weight, extra=None,
+    )
+
+
+def _corpus(n=300, seed=7):
+    rng = random.Random(seed)
+    keywords = [f"kw{i:02d}" for i in range(40)]
+    orgs = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "ACME"]
+    return [
+        _article(
+            i,
+            rng.sample(keywords, rng.randint(0, 6)),
+            {"ORG": rng.sample(orgs, rng.randint(0, 3)), "GPE": ["Paris"] if i % 5 == 0 else []},
+            rng.choice(WEIGHTS),
+        )
+        for i in range(n)
+    ]
+
+
+def _reference(articles, weighting):
+    """Pair counting with plain dicts: every pair of every article's term set."""
+    counts, weight = Counter(), defaultdict(float)
+    term_sets = []
+    for art in articles:
+        terms = set(art.keywords)
+        for names in art.entities.values():
+            terms.update(name.lower() for name in names)
+        term_sets.append(terms)
+        for pair in combinations(sorted(terms), 2):
+            counts[pair] += 1
+            weight[pair] += art.source_weight
+    if weighting == "count":
+        return {pair: (c, float(c)) for pair, c in counts.items()}
+    if weighting == "source_weight":
+        return {pair: (c, weight[pair]) for pair, c in counts.items()}
+    df = Counter(t for terms in term_sets for t in terms)
+    idf = {t: math.log((1 + len(articles)) / (1 + d)) + 1 for t, d in df.items()}
+    return {(a, b): (c, c * idf[a] * idf[b]) for (a, b), c in counts.items()}
+
+
+@pytest.mark.parametrize("weighting", ["count", "source_weight", "tfidf"])
+def test_all_pairs_match_reference(weighting):
+    articles = _corpus()
+    expected = _reference(articles, weighting)
+    found = detect_co_occurrences(articles, top_k=len(expected) + 10, weighting=weighting, block_size=7)
+    assert len(found) == len(expected)
+    for entry in found:
+        count, score = expected[tuple(entry["pair"])]
+        assert entry["count"] == count
+        assert entry.get("score", float(count)) == pytest.approx(score, rel=1e-5)
+
+
+@pytest.mark.parametrize("weighting", ["count", "source_weight"])
+def test_top_k_order_matches_reference(weighting):
+    articles = _corpus()
+    expected = _reference(articles, weighting)
+    ranked = sorted(expected, key=lambda pair: (-expected[pair][1], -expected[pair][0], pair))[:15]
+    found = detect_co_occurrences(articles, top_k=15, weighting=weighting, block_size=5)
+    assert [tuple(e["pair"]) for e in found] == ranked
+
+
+def test_blocking_and_streaming_do_not_change_results():
+    articles = _corpus()
+    whole = detect_co_occurrences(articles, top_k=20, weighting="tfidf")
+    assert detect_co_occurrences(articles, top_k=20, weighting="tfidf", block_size=3) == whole
+    assert detect_co_occurrences(PatternAccumulator().extend(articles), top_k=20, weighting="tfidf") == whole
+
+
+def test_min_support_drops_rare_pairs():
+    articles = _corpus()
+    expected = {pair for pair, (count, _) in _reference(articles, "count").items() if count >= 4}
+    found = detect_co_occurrences(articles, top_k=10_000, min_support=4)
+    assert {tuple(e["pair"]) for e in found} == expected
+
+
+def test_degenerate_inputs():
+    assert detect_co_occurrences([]) == []
+    assert detect_co_occurrences([_article(0, ["solo"], {})]) == []
+    with pytest.raises(ValueError):
+        detect_co_occurrences(_corpus(5), weighting="bm25")
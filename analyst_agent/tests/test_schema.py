@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from analyst_agent.src.patterns import compute_patterns, detect_co_occurrences
+from analyst_agent.src.schema import AnalysisBundle, ArticleAnalysis, ArticleColumns
+
+
+def _corpus(n=200, seed=11):
+    rng = random.Random(seed)
+    names = ["Ola Electric", "Ather", "TVS", "Bajaj", "Hero", "Ather"]
+    articles = []
+    for i in range(n):
+        orgs = rng.sample(names, rng.randint(0, 3))
+        entities = {"ORG": orgs, "PERSON": ["Bhavish Aggarwal"]} if i % 3 else {"ORG": orgs}
+        if i % 7 == 0:
+            entities = {}
+        by_entity = None
+        if i % 2:
+            # some mentions without a sentence-level score
+            by_entity = {name: round(rng.uniform(-1, 1), 3) for name in entities.get("ORG", [])[:1]}
+        articles.append(ArticleAnalysis(
+            title=f"Article {i}",
+            url=f"http://example.com/{i}",
+            published=None if i % 5 == 0 else f"2024-0{1 + i % 9}-1{i % 10}T08:00:00",
+            source=rng.choice(["livemint", "autocar", None]),
+            source_type="news",
+            summary=f"Summary {i}.",
+            entities=entities,
+            keywords=rng.sample(["range", "battery", "price", "subsidy", "launch"], rng.randint(0, 4)),
+            sentiment_score=round(rng.uniform(-1, 1), 4),
+            sentiment_label=rng.choice(["positive", "negative", "neutral"]),
+            topic_cluster=None if i % 4 == 0 else i % 3,
+            source_weight=rng.choice([0.5, 1.0, 1.5]),
+            extra={"position": i} if i % 6 == 0 else None,
+            entity_sentiment=by_entity,
+        ))
+    return articles
+
+
+def test_round_trip_preserves_every_field():
+    articles = _corpus()
+    columns = ArticleColumns().extend(articles)
+    assert len(columns) == len(articles)
+    assert list(columns) == articles
+    assert columns.to_dicts() == [a.to_dict() for a in articles]
+    assert columns[-1] == articles[-1]
+    with pytest.raises(IndexError):
+        columns[len(articles)]
+
+
+def test_strings_are_interned_once():
+    columns = ArticleColumns().extend(_corpus())
+    assert len(columns.strings) == len(set(columns.strings))
+    assert columns.strings.count("Ather") == 1
+
+
+def test_bundle_serializes_the_same_from_columns():
+    articles = _corpus()
+    as_list = AnalysisBundle(query="q", articles=articles, summary_meta={})
+    as_columns = AnalysisBundle(query="q", articles=ArticleColumns().extend(articles), summary_meta={})
+    assert as_columns.to_dict() == as_list.to_dict()
+
+
+def test_patterns_from_columns_match_patterns_from_articles():
+    articles = _corpus()
+    columns = ArticleColumns().extend(articles)
+    assert compute_patterns(columns) == compute_patterns(articles)
+    for weighting in ("count", "source_weight", "tfidf"):
+        assert detect_co_occurrences(columns, weighting=weighting) == detect_co_occurrences(articles, weighting=weighting)
+
+
+def test_empty_store():
+    columns = ArticleColumns()
+    assert len(columns) == 0 and list(columns) == [] and columns.to_dicts() == []
+    assert compute_patterns(columns) == compute_patterns([])
@@ -0,0 +1,124 @@
+"""
+`--update` (update_analysis_file) against full re-analysis. The NLP models
+are replaced by a cheap deterministic `_analyze_batch`; topic clustering,
+aggregation, patterns and the bundle writer are the real ones.
+"""
+import json
+import random
+
+import pytest
+
+from analyst_agent.src import analyze
+from analyst_agent.src.topics import TopicModel
+
+THEMES = [
+    "battery charging range lithium cells swapping station kilowatt",
+    "price subsidy tax scheme government incentive discount budget",
+    "racing motorsport track rider championship podium lap",
+    "software app connectivity bluetooth navigation screen firmware",
+]
+
+
+def _fake_analyze_batch(texts, keyword_method):
+    _fake_analyze_batch.calls += len(texts)
+    return [{
+        "summary": text[:40],
+        "entities": {"ORG": [text.split()[0].capitalize()]},
+        "keywords": text.split()[1:4],
+        "sentiment_score": (len(text) % 7 - 3) / 10,
+        "sentiment_label": "neutral",
+        "entity_sentiment": None,
+    } for text in texts]
+
+
+@pytest.fixture(autouse=True)
+def fake_nlp(monkeypatch):
+    _fake_analyze_batch.calls = 0
+    monkeypatch.setattr(analyze, "_analyze_batch", _fake_analyze_batch)
+    return _fake_analyze_batch
+
+
+def _articles(start, stop, themes=THEMES, seed=5):
+    rng = random.Random(seed + start)
+    articles = []
+    for i in range(start, stop):
+        words = themes[i % len(themes)].split()
+        text = " ".join(rng.choice(words) for _ in range(40)) + "."
+        articles.append({"title": f"Article {i}", "url": f"http://example.com/{i}", "text": text,
+                         "published": f"2024-03-{1 + i % 28:02d}", "source": "news.example.com"})
+    return articles
+
+
+def _write(path, articles):
+    path.write_text(json.dumps({"query": "scooters", "articles": articles}), encoding="utf-8")
+    return path
+
+
+def _read(path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_update_matches_full_analysis(tmp_path, fake_nlp):
+    day1 = _write(tmp_path / "day1.json", _articles(0, 30))
+    day2 = _write(tmp_path / "day2.json", _articles(0, 30) + _articles(30, 45))
+    model = tmp_path / "topics.model.json"
+
+    analyze.analyze_research_to_file(day1, tmp_path / "a1.json", topic_model_path=model, num_topics=3)
+    fake_nlp.calls = 0
+    analyze.update_analysis_file(tmp_path / "a1.json", day2, tmp_path / "a2.json", topic_model_path=model)
+    assert fake_nlp.calls == 15
+
+    analyze.analyze_research_to_file(day2, tmp_path / "full.json", num_topics=3)
+    updated, full = _read(tmp_path / "a2.json"), _read(tmp_path / "full.json")
+    assert updated["summary_meta"].pop("incremental") == {
+        "previous_articles": 30, "new_articles": 15, "known_urls_skipped": 30}
+    assert updated["summary_meta"] == full["summary_meta"]
+    assert updated["patterns"] == full["patterns"]
+
+    def without_topic(article):
+        return {k: v for k, v in article.items() if k != "topic_cluster"}
+    assert [without_topic(a) for a in updated["articles"]] == [without_topic(a) for a in full["articles"]]
+    assert {a["topic_cluster"] for a in updated["articles"]} <= {int(k) for k in updated["topic_map"]}
+
+
+def test_update_in_place_with_nothing_new(tmp_path, fake_nlp):
+    research = _write(tmp_path / "research.json", _articles(0, 12))
+    bundle = tmp_path / "analysis.json"
+    analyze.analyze_research_to_file(research, bundle, num_topics=2)
+    before = _read(bundle)
+
+    fake_nlp.calls = 0
+    analyze.update_analysis_file(bundle, research, bundle)
+    after = _read(bundle)
+    assert fake_nlp.calls == 0
+    assert after["summary_meta"].pop("incremental")["known_urls_skipped"] == 12
+    assert after["articles"] == before["articles"]
+    assert after["topic_map"] == before["topic_map"]
+
+
+def test_topic_labels_survive_repeated_updates(tmp_path):
+    # Run 1 has no topic model; update 1 fits one for its new articles and
+    # numbers it after run 1's clusters; update 2 assigns to that saved model.
+    model = tmp_path / "topics.model.json"
+    run1 = _write(tmp_path / "r1.json", _articles(0, 20, THEMES[:2]))
+    analyze.analyze_research_to_file(run1, tmp_path / "a1.json", num_topics=2)
+    first_map = _read(tmp_path / "a1.json")["topic_map"]
+    assert sorted(map(int, first_map)) == [0, 1]
+
+    run2 = _write(tmp_path / "r2.json", _articles(20, 46, THEMES[2:]))
+    analyze.update_analysis_file(tmp_path / "a1.json", run2, tmp_path / "a2.json",
+                                 topic_model_path=model, num_topics=2)
+    second = _read(tmp_path / "a2.json")
+    assert TopicModel.load(model).label_offset == 2
+    new_labels = {a["topic_cluster"] for a in second["articles"][20:]}
+    assert new_labels <= {2, 3}
+
+    run3 = _write(tmp_path / "r3.json", _articles(100, 110, THEMES[2:]))
+    analyze.update_analysis_file(tmp_path / "a2.json", run3, tmp_path / "a3.json", topic_model_path=model)
+    third = _read(tmp_path / "a3.json")
+    topic_map = {int(k): v for k, v in third["topic_map"].items()}
+    # Run 1's clusters keep their labels and names; the model's labels don't collide with them
+    assert {k: topic_map[k] for k in (0, 1)} == {int(k): v for k, v in first_map.items()}
+    assert {a["topic_cluster"] for a in third["articles"][-10:]} <= {2, 3}
+    assert {a["topic_cluster"] for a in third["articles"]} <= set(topic_map)
+    assert [a["topic_cluster"] for a in third["articles"][:46]] == [a["topic_cluster"] for a in second["articles"]]
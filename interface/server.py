@@ -24,6 +24,8 @@ BASE_DIR = Path(__file__).parent.parent
 STATIC_DIR = Path(__file__).parent / "static"
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 OUTPUT_DIR = BASE_DIR / "output"
+HTTP_CACHE_DIR = OUTPUT_DIR / ".http_cache"  # shared by every researcher run
+ANALYSIS_CACHE = OUTPUT_DIR / ".analysis_cache.sqlite"  # shared by every analyst run
 
 STATIC_DIR.mkdir(exist_ok=True)
 TEMPLATES_DIR.mkdir(exist_ok=True)
@@ -69,6 +71,110 @@ async def run_command_stream(command: list, step_name: str) -> AsyncGenerator[st
     else:
         yield f"data: {json.dumps({'type': 'error', 'step': step_name, 'message': f'❌ {step_name} failed with code {process.returncode}'})}\n\n"
 
+class ResidentAnalyst:
+    """
+    One long-lived `analyst_agent.src.analyze --serve` process, so spaCy, VADER
+    and the extractors are loaded once per server instead of once per request.
+    Jobs run one at a time; the process is restarted if it exits.
+    """
+
+    def __init__(self):
+        self.process = None
+        self.lock = asyncio.Lock()
+        self._next_id = 0
+        self._pending = None  # id of a job whose result line hasn't been read yet
+
+    async def _start(self):
+        self.process = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "analyst_agent.src.analyze", "--serve",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            cwd=str(BASE_DIR)
+        )
+        self._pending = None
+
+    async def _readline(self):
+        """Next non-empty output line, or None once the worker has exited (and been reaped)."""
+        while True:
+            line = await self.process.stdout.readline()
+            if not line:
+                await self.process.wait()
+                self.process = None
+                self._pending = None
+                return None
+            text = line.decode(errors='replace').strip()
+            if text:
+                return text
+
+    @staticmethod
+    def _control(text: str):
+        """The worker's "ready"/"result" records; anything else is a log line."""
+        try:
+            record = json.loads(text)
+        except ValueError:
+            return None
+        if isinstance(record, dict) and record.get("type") in ("ready", "result"):
+            return record
+        return None
+
+    async def _drain(self):
+        """
+        Discard the output of a job whose client disconnected mid-stream, up to
+        its result line, so its remaining log lines aren't relayed to the next request.
+        """
+        while self._pending is not None:
+            text = await self._readline()
+            if text is None:
+                return
+            record = self._control(text)
+            if record and record["type"] == "result" and record.get("id") == self._pending:
+                self._pending = None
+
+    async def run(self, job: dict, step_name: str) -> AsyncGenerator[str, None]:
+        """Send one job and stream its log lines for SSE, like `run_command_stream`."""
+        yield f"data: {json.dumps({'type': 'status', 'step': step_name, 'message': f'Starting {step_name}...'})}\n\n"
+        async with self.lock:
+            if self.process is not None:
+                await self._drain()
+            if self.process is None or self.process.returncode is not None:
+                await self._start()
+            self._next_id += 1
+            job = dict(job, id=self._next_id)
+            self._pending = job["id"]
+            self.process.stdin.write((json.dumps(job) + "\n").encode())
+            await self.process.stdin.drain()
+
+            while True:
+                text = await self._readline()
+                if text is None:
+                    yield f"data: {json.dumps({'type': 'error', 'step': step_name, 'message': f'❌ {step_name} worker exited'})}\n\n"
+                    return
+                record = self._control(text)
+                if record is None:
+                    yield f"data: {json.dumps({'type': 'log', 'step': step_name, 'message': text})}\n\n"
+                    continue
+                if record["type"] == "result" and record.get("id") == job["id"]:
+                    self._pending = None
+                    if record.get("ok"):
+                        yield f"data: {json.dumps({'type': 'status', 'step': step_name, 'message': f'✅ {step_name} completed.'})}\n\n"
+                    else:
+                        message = f"❌ {step_name} failed: {record.get('error')}"
+                        yield f"data: {json.dumps({'type': 'error', 'step': step_name, 'message': message})}\n\n"
+                    return
+
+    async def close(self):
+        if self.process is not None and self.process.returncode is None:
+            self.process.stdin.close()
+            await self.process.wait()
+
+
+analyst = ResidentAnalyst()
+
+@app.on_event("shutdown")
+async def stop_analyst():
+    await analyst.close()
+
 @app.get("/api/research")
 async def stream_research(topic: str, limit: int = 10, skip_charts: bool = False, mode: str = "brief"):
     async def event_generator():
@@ -76,7 +182,7 @@ async def stream_research(topic: str, limit: int = 10, skip_charts: bool = False
         safe_topic = "".join([c if c.isalnum() else "_" for c in topic.lower()])[:20]
         
         # Define file paths
-        research_file = OUTPUT_DIR / f"raw_{safe_topic}_{timestamp}.json"
+        research_file = OUTPUT_DIR / f"raw_{safe_topic}_{timestamp}.ndjson"
         analysis_file = OUTPUT_DIR / f"analysis_{safe_topic}_{timestamp}.json"
         forecast_file = OUTPUT_DIR / f"forecast_{safe_topic}_{timestamp}.json"
         report_file = OUTPUT_DIR / f"report_{safe_topic}_{timestamp}.md"
@@ -85,15 +191,17 @@ async def stream_research(topic: str, limit: int = 10, skip_charts: bool = False
 
         # 1. Research Agent
         async for msg in run_command_stream(
-            [python_exe, "-m", "researcher_agent.src.cli", topic, "--limit", str(limit), "--out", str(research_file)],
+            [python_exe, "-m", "researcher_agent.src.cli", topic, "--limit", str(limit), "--out", str(research_file),
+             "--format", "ndjson", "--profile", "fast", "--cache-dir", str(HTTP_CACHE_DIR)],
             "Researcher"
         ): yield msg
 
         if not research_file.exists(): return
 
         # 2. Analyst Agent
-        async for msg in run_command_stream(
-            [python_exe, "-m", "analyst_agent.src.analyze", "--input", str(research_file), "--output", str(analysis_file), "--topic", topic],
+        async for msg in analyst.run(
+            {"input": str(research_file), "output": str(analysis_file), "topic": topic,
+             "cache": str(ANALYSIS_CACHE)},
             "Analyst"
         ): yield msg
 
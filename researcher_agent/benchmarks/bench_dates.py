@@ -0,0 +1,120 @@
+# bench_dates.py
+"""
+Throughput of publish-date detection over synthetic URLs and page texts.
+
+Compares `researcher_agent.src.dates` (precompiled, single scan, bounded text
+prefix) with the previous per-call implementation that rebuilt a regex for
+every MONTH_MAP entry and ran three full scans over the page text.
+
+Usage (from the repo root):
+    python -m researcher_agent.benchmarks.bench_dates [--docs 5000]
+"""
+import argparse
+import random
+import re
+import time
+from datetime import datetime
+
+from researcher_agent.src.dates import MONTH_MAP, date_from_text, date_from_url, best_dates
+
+_MONTHS = ["Jan", "February", "mar", "April", "May", "june", "Jul", "August", "Sept", "oct", "Nov", "December"]
+_FILLER = ("Lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+           "incididunt ut labore et dolore magna aliqua ").split()
+
+def _legacy_text(text: str):
+    m1 = re.search(r"\b(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*[,\s]+(\d{4})", text, re.I)
+    if m1:
+        day, mon, year = m1.groups()
+        try:
+            return str(datetime(int(year), MONTH_MAP[mon.lower()[:3]], int(day)).date())
+        except Exception:
+            pass
+    m2 = re.search(r"\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*\s+(\d{1,2})[,\s]+(\d{4})", text, re.I)
+    if m2:
+        mon, day, year = m2.groups()
+        try:
+            return str(datetime(int(year), MONTH_MAP[mon.lower()[:3]], int(day)).date())
+        except Exception:
+            pass
+    m3 = re.search(r"\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*[,\s]+(\d{4})", text, re.I)
+    if m3:
+        mon, year = m3.groups()
+        try:
+            return str(datetime(int(year), MONTH_MAP[mon.lower()[:3]], 1).date())
+        except Exception:
+            pass
+    return None
+
+def _legacy_url(url: str):
+    for pat in [r"(\d{4})[/-](\d{2})[/-](\d{2})", r"(\d{4})(\d{2})(\d{2})"]:
+        match = re.search(pat, url)
+        if match:
+            try:
+                y, m, d = match.groups()
+                return str(datetime(int(y), int(m), int(d)).date())
+            except Exception:
+                continue
+    for mon_name, mon_num in MONTH_MAP.items():
+        m1 = re.search(rf"{mon_name}[-/](\d{{4}})", url, re.I)
+        if m1:
+            try:
+                return str(datetime(int(m1.group(1)), mon_num, 1).date())
+            except Exception:
+                pass
+        m2 = re.search(rf"(\d{{4}})[-/]{mon_name}", url, re.I)
+        if m2:
+            try:
+                return str(datetime(int(m2.group(1)), mon_num, 1).date())
+            except Exception:
+                pass
+    return None
+
+def _corpus(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    urls, texts = [], []
+    for i in range(n):
+        y, m, d = rng.randint(2015, 2025), rng.randint(1, 12), rng.randint(1, 28)
+        style = i % 4
+        if style == 0:
+            urls.append(f"https://news{i % 50}.example.com/{y}/{m:02d}/{d:02d}/story-{i}")
+        elif style == 1:
+            urls.append(f"https://blog{i % 50}.example.com/{_MONTHS[m - 1].lower()}-{y}/post-{i}")
+        elif style == 2:
+            urls.append(f"https://site{i % 50}.example.com/articles/{i}?ref=home")
+        else:
+            urls.append(f"https://cdn{i % 50}.example.com/{y}{m:02d}{d:02d}/item")
+        words = [rng.choice(_FILLER) for _ in range(rng.randint(2000, 8000))]
+        if i % 3:
+            words.insert(rng.randint(0, 300), f"{d} {_MONTHS[m - 1]} {y}")
+        texts.append(" ".join(words))
+    return urls, texts
+
+def _time(fn, items):
+    t0 = time.perf_counter()
+    for x in items:
+        fn(x)
+    return time.perf_counter() - t0
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark publish-date detection")
+    parser.add_argument("--docs", type=int, default=5000, help="Number of synthetic URLs/pages (default: 5000)")
+    args = parser.parse_args()
+
+    urls, texts = _corpus(args.docs)
+    print(f"{args.docs} URLs, {args.docs} pages (avg {sum(map(len, texts)) // len(texts)} chars)")
+    rows = [
+        ("url  legacy", _time(_legacy_url, urls)),
+        ("url  compiled", _time(date_from_url, urls)),
+        ("text legacy", _time(_legacy_text, texts)),
+        ("text compiled", _time(date_from_text, texts)),
+    ]
+    t0 = time.perf_counter()
+    best_dates((None, t, u) for t, u in zip(texts, urls))
+    rows.append(("batch best_dates", time.perf_counter() - t0))
+
+    print(f"{'case':<18}{'total s':>10}{'us/doc':>10}")
+    for name, secs in rows:
+        print(f"{name:<18}{secs:>10.3f}{1e6 * secs / args.docs:>10.1f}")
+
+if __name__ == "__main__":
+    main()
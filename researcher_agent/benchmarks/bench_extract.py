@@ -0,0 +1,82 @@
+# bench_extract.py
+"""
+Per-article CPU time and peak memory of the fallback extractor.
+
+Compares the single-parse lxml path (`extract_with_lxml`) against the old
+approach that built three BeautifulSoup trees per page (body, date, meta
+keywords). Any directory of saved pages works as a corpus, including the
+researcher's HTTP cache (`--cache-dir`).
+
+Usage (from the repo root):
+    python -m researcher_agent.benchmarks.bench_extract path/to/html_dir [--repeat 3]
+"""
+import argparse
+import time
+import tracemalloc
+from pathlib import Path
+
+from researcher_agent.src.extract import extract_with_lxml
+
+try:
+    from bs4 import BeautifulSoup
+    BS4_AVAILABLE = True
+except ImportError:
+    BS4_AVAILABLE = False
+
+def _legacy_three_parse(html: str, url: str):
+    """The pre-single-parse extractor: one soup for text, one for the date, one for keywords."""
+    soup = BeautifulSoup(html, "lxml")
+    for tag in soup(["script", "style", "noscript"]):
+        tag.decompose()
+    title = soup.title.string.strip() if soup.title and soup.title.string else None
+    paragraphs = [p.get_text(" ", strip=True) for p in soup.find_all("p")]
+    date_soup = BeautifulSoup(html, "lxml")
+    date_soup.find("meta", {"property": "article:published_time"})
+    date_soup.get_text(separator=" ")
+    kw_soup = BeautifulSoup(html, "lxml")
+    kw_soup.find("meta", attrs={"name": "keywords"})
+    return title, paragraphs
+
+def _measure(fn, pages, repeat: int):
+    cpu = []
+    peak = 0
+    for _ in range(repeat):
+        for url, html in pages:
+            tracemalloc.start()
+            t0 = time.process_time()
+            fn(html, url)
+            cpu.append(time.process_time() - t0)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+    cpu.sort()
+    return {
+        "mean_ms": 1000 * sum(cpu) / max(1, len(cpu)),
+        "p95_ms": 1000 * cpu[int(0.95 * (len(cpu) - 1))] if cpu else 0.0,
+        "peak_kb": peak / 1024,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark single-parse HTML extraction")
+    parser.add_argument("corpus", type=Path, help="Directory of saved .html pages")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over the corpus (default: 3)")
+    args = parser.parse_args()
+
+    pages = [(f"https://fixture.local/{p.stem}", p.read_text(encoding="utf-8", errors="replace"))
+             for p in sorted(args.corpus.glob("*.html"))]
+    if not pages:
+        print(f"No .html files found in {args.corpus}")
+        return
+    print(f"{len(pages)} pages x {args.repeat} passes")
+
+    rows = [("single-parse lxml", _measure(extract_with_lxml, pages, args.repeat))]
+    if BS4_AVAILABLE:
+        rows.insert(0, ("3x BeautifulSoup", _measure(_legacy_three_parse, pages, args.repeat)))
+    else:
+        print("beautifulsoup4 not installed; skipping the legacy baseline.")
+
+    print(f"{'extractor':<20}{'mean ms':>10}{'p95 ms':>10}{'peak KiB':>12}")
+    for name, r in rows:
+        print(f"{name:<20}{r['mean_ms']:>10.2f}{r['p95_ms']:>10.2f}{r['peak_kb']:>12.0f}")
+
+if __name__ == "__main__":
+    main()
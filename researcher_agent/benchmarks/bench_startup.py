@@ -0,0 +1,70 @@
+# bench_startup.py
+"""
+CLI import cost and per-article extraction time by profile.
+
+1. Runs `python -X importtime -c "import researcher_agent.src.cli"` in a
+   fresh interpreter and reports the total plus the slowest top-level imports.
+2. If a corpus directory of saved .html pages is given (the HTTP cache works),
+   times `extract_with_newspaper` per article under the "fast" and "full"
+   extraction profiles.
+
+Usage (from the repo root):
+    python -m researcher_agent.benchmarks.bench_startup [path/to/html_dir] [--top 10]
+"""
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+def import_times(module: str):
+    """Return [(cumulative_us, name)] for top-level imports of `module`."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cum_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2   # nesting is indented two spaces per level
+        if depth <= 1:
+            rows.append((int(cum_us), name.strip()))
+    if proc.returncode != 0:
+        print(proc.stderr.strip().splitlines()[-1])
+    return rows
+
+def per_article(corpus: Path, profile: str):
+    from researcher_agent.src.extract import extract_with_newspaper
+    timings = []
+    for page in sorted(corpus.glob("*.html")):
+        html = page.read_text(encoding="utf-8", errors="replace")
+        t0 = time.perf_counter()
+        try:
+            extract_with_newspaper(f"https://fixture.local/{page.stem}", html, profile=profile)
+        except Exception:
+            continue
+        timings.append(time.perf_counter() - t0)
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark researcher startup and extraction profiles")
+    parser.add_argument("corpus", type=Path, nargs="?", help="Directory of saved .html pages")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list (default: 10)")
+    args = parser.parse_args()
+
+    rows = import_times("researcher_agent.src.cli")
+    total = max((us for us, _ in rows), default=0)
+    print(f"import researcher_agent.src.cli: {total / 1000:.1f} ms cumulative")
+    for us, name in sorted(rows, reverse=True)[1:args.top + 1]:
+        print(f"  {us / 1000:>8.1f} ms  {name}")
+
+    if args.corpus:
+        for profile in ("fast", "full"):
+            t = per_article(args.corpus, profile)
+            if t:
+                print(f"{profile:>5}: {len(t)} pages, mean {1000 * sum(t) / len(t):.1f} ms/article")
+
+if __name__ == "__main__":
+    main()
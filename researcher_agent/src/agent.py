@@ -1,12 +1,133 @@
-from .orchestrate import research
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Tuple
+
+from .orchestrate import research, research_stream, research_batch
 from .schema import ResearchBundle
+from .fetch import FetchClient
+from .cache import ResponseCache
+from .dedup import DedupIndex, topic_slug
+from .config import FETCH_WORKERS, EXTRACT_WORKERS, EXTRACT_PROFILE, HTTP_CACHE_DIR, HTTP_CACHE_TTL, DEDUP_DIR, SEARCH_WORKERS
+
+@contextmanager
+def _client(cache_dir, cache_ttl):
+    """A cache-backed FetchClient when `cache_dir` is set, else None (shared client)."""
+    if not cache_dir:
+        yield None
+        return
+    client = FetchClient(cache=ResponseCache(cache_dir, ttl=cache_ttl))
+    try:
+        yield client
+    finally:
+        client.close()
+
+def _dedup_index(dedup_dir, query: str):
+    return DedupIndex.for_topic(dedup_dir, query) if dedup_dir else None
+
+def _batch_dedup_indexes(dedup_dir, queries: List[str]):
+    """One index per topic file; queries with the same slug share it so neither save overwrites the other."""
+    if not dedup_dir:
+        return None
+    by_topic = {}
+    for query in queries:
+        if topic_slug(query) not in by_topic:
+            by_topic[topic_slug(query)] = DedupIndex.for_topic(dedup_dir, query)
+    return {query: by_topic[topic_slug(query)] for query in queries}
 
-def run_research(query: str, limit: int = 10, take: int = None) -> ResearchBundle:
+def run_research(
+    query: str,
+    limit: int = 10,
+    take: int = None,
+    fetch_workers: int = FETCH_WORKERS,
+    extract_workers: int = EXTRACT_WORKERS,
+    cache_dir: str = HTTP_CACHE_DIR,
+    cache_ttl: int = HTTP_CACHE_TTL,
+    profile: str = EXTRACT_PROFILE,
+    dedup_dir: str = DEDUP_DIR,
+) -> ResearchBundle:
     """
     Runs the full research workflow for the given query.
     limit = number of search results to fetch.
     take = number of articles to process (default: same as limit).
+    fetch_workers / extract_workers = concurrency of the fetch and extraction stages.
+    cache_dir = directory for the on-disk HTTP cache (None disables caching).
+    profile = extraction profile: "fast" skips Newspaper3k's NLP pass, "full" keeps it.
+    dedup_dir = directory of per-topic fingerprint indexes; articles seen in earlier
+                runs on the same query are marked as duplicates (None: this run only).
+    """
+    if take is None:
+        take = limit
+    with _client(cache_dir, cache_ttl) as client:
+        return research(
+            query,
+            limit=limit,
+            take_first_n=take,
+            fetch_workers=fetch_workers,
+            extract_workers=extract_workers,
+            client=client,
+            profile=profile,
+            dedup_index=_dedup_index(dedup_dir, query),
+        )
+
+def run_research_stream(
+    query: str,
+    limit: int = 10,
+    take: int = None,
+    fetch_workers: int = FETCH_WORKERS,
+    extract_workers: int = EXTRACT_WORKERS,
+    cache_dir: str = HTTP_CACHE_DIR,
+    cache_ttl: int = HTTP_CACHE_TTL,
+    profile: str = EXTRACT_PROFILE,
+    dedup_dir: str = DEDUP_DIR,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Same workflow as `run_research`, yielding header/article/trailer records
+    as they become available (see orchestrate.research_stream).
+    """
+    if take is None:
+        take = limit
+    with _client(cache_dir, cache_ttl) as client:
+        yield from research_stream(
+            query,
+            limit=limit,
+            take_first_n=take,
+            fetch_workers=fetch_workers,
+            extract_workers=extract_workers,
+            client=client,
+            profile=profile,
+            dedup_index=_dedup_index(dedup_dir, query),
+        )
+
+def run_research_batch(
+    queries: List[str],
+    limit: int = 10,
+    take: int = None,
+    fetch_workers: int = FETCH_WORKERS,
+    extract_workers: int = EXTRACT_WORKERS,
+    cache_dir: str = HTTP_CACHE_DIR,
+    cache_ttl: int = HTTP_CACHE_TTL,
+    profile: str = EXTRACT_PROFILE,
+    search_workers: int = SEARCH_WORKERS,
+    dedup_dir: str = DEDUP_DIR,
+) -> Tuple[List[ResearchBundle], Dict[str, Any]]:
+    """
+    Runs the research workflow for several queries, fetching each URL once
+    (see orchestrate.research_batch). Returns one bundle per query plus batch stats.
+    dedup_dir = as for `run_research`, one topic index per query.
     """
     if take is None:
         take = limit
-    return research(query, limit=limit, take_first_n=take)
+    with _client(cache_dir, cache_ttl) as client:
+        if client is None:
+            # A private client so the batch stats only count this run
+            client = FetchClient()
+        return research_batch(
+            queries,
+            limit=limit,
+            take_first_n=take,
+            fetch_workers=fetch_workers,
+            extract_workers=extract_workers,
+            client=client,
+            profile=profile,
+            search_workers=search_workers,
+            dedup_indexes=_batch_dedup_indexes(dedup_dir, queries),
+        )
@@ -0,0 +1,156 @@
+# cache.py
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from .config import HTTP_CACHE_TTL, HTTP_CACHE_MAX_BYTES
+
+# Response headers worth keeping alongside the body
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Date")
+
+def normalize_url(url: str) -> str:
+    """Canonical form used as the cache key: lowercase scheme/host, no fragment, sorted query."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = parts.netloc.lower()
+    if (scheme == "http" and host.endswith(":80")) or (scheme == "https" and host.endswith(":443")):
+        host = host.rsplit(":", 1)[0]
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+class ResponseCache:
+    """
+    Content-addressed on-disk cache of HTML responses.
+
+    Each entry is `<sha256(normalized url)>.html` plus a `.json` sidecar with
+    the URL, kept headers and timing. Entries older than `ttl` are stale and
+    should be revalidated with `conditional_headers()`. The least recently
+    used entries are evicted once the cache exceeds `max_bytes`.
+    """
+
+    def __init__(self, directory, ttl: int = HTTP_CACHE_TTL, max_bytes: int = HTTP_CACHE_MAX_BYTES):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "revalidated": 0, "stored": 0, "evicted": 0}
+        # key -> [size, last_used]; rebuilt from disk so several processes can share a directory
+        self._index = {}
+        for meta_path in self.directory.glob("*.json"):
+            body_path = meta_path.with_suffix(".html")
+            if body_path.exists():
+                st = body_path.stat()
+                self._index[meta_path.stem] = [st.st_size, st.st_mtime]
+        self._total = sum(size for size, _ in self._index.values())
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        return hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str):
+        return self.directory / f"{key}.html", self.directory / f"{key}.json"
+
+    def record(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def _touch(self, key: str):
+        now = time.time()
+        body_path, _ = self._paths(key)
+        try:
+            os.utime(body_path, (now, now))
+        except OSError:
+            pass
+        with self._lock:
+            if key in self._index:
+                self._index[key][1] = now
+
+    def get(self, url: str):
+        """Return the cached entry dict (`body`, `headers`, `stored_at`, `fresh`) or None."""
+        key = self.key_for(url)
+        body_path, meta_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_text(encoding="utf-8")
+        except (OSError, ValueError):
+            return None
+        self._touch(key)
+        meta["body"] = body
+        meta["fresh"] = time.time() - meta.get("stored_at", 0) < self.ttl
+        return meta
+
+    @staticmethod
+    def conditional_headers(entry: dict) -> dict:
+        headers = {}
+        if entry.get("headers", {}).get("ETag"):
+            headers["If-None-Match"] = entry["headers"]["ETag"]
+        if entry.get("headers", {}).get("Last-Modified"):
+            headers["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+        return headers
+
+    def put(self, url: str, body: str, headers) -> None:
+        key = self.key_for(url)
+        body_path, meta_path = self._paths(key)
+        meta = {
+            "url": url,
+            "headers": {h: headers[h] for h in _KEPT_HEADERS if h in headers},
+            "stored_at": time.time(),
+        }
+        data = body.encode("utf-8")
+        try:
+            tmp = body_path.with_suffix(".html.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, body_path)
+            tmp = meta_path.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(meta), encoding="utf-8")
+            os.replace(tmp, meta_path)
+        except OSError:
+            return
+        with self._lock:
+            old = self._index.get(key)
+            self._total += len(data) - (old[0] if old else 0)
+            self._index[key] = [len(data), time.time()]
+            self._stats["stored"] += 1
+        self._evict()
+
+    def refresh(self, url: str) -> None:
+        """Mark a stale entry fresh again after a 304 Not Modified."""
+        key = self.key_for(url)
+        _, meta_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            meta["stored_at"] = time.time()
+            tmp = meta_path.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(meta), encoding="utf-8")
+            os.replace(tmp, meta_path)
+        except (OSError, ValueError):
+            pass
+
+    def _evict(self):
+        with self._lock:
+            if self._total <= self.max_bytes:
+                return
+            victims = sorted(self._index.items(), key=lambda kv: kv[1][1])
+            removed = []
+            for key, (size, _) in victims:
+                if self._total <= self.max_bytes:
+                    break
+                self._total -= size
+                removed.append(key)
+                del self._index[key]
+            self._stats["evicted"] += len(removed)
+        for key in removed:
+            for path in self._paths(key):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats, entries=len(self._index), bytes=self._total)
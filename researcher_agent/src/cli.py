@@ -2,15 +2,71 @@ import argparse
 import json
 from pathlib import Path
 from datetime import datetime
-from .agent import run_research
+from .agent import run_research, run_research_stream, run_research_batch
+from .config import (
+    FETCH_WORKERS, EXTRACT_WORKERS, EXTRACT_PROFILE, HTTP_CACHE_DIR, HTTP_CACHE_TTL, DEDUP_DIR,
+    SEARCH_BACKEND, SEARCH_CACHE_DIR, SEARCH_CACHE_TTL,
+)
+from .extract import EXTRACT_PROFILES
+from .search import configure_search
+
+def _safe_name(query: str) -> str:
+    return "_".join(query.lower().split())[:50]
+
+def _run_batch(args, timestamp: str):
+    queries = [
+        ln.strip() for ln in args.queries.read_text(encoding="utf-8").splitlines()
+        if ln.strip() and not ln.strip().startswith("#")
+    ]
+    if not queries:
+        print(f"No queries found in {args.queries}")
+        return
+    output_dir = args.out or Path("output")
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    bundles, stats = run_research_batch(
+        queries,
+        limit=args.limit,
+        take=args.take,
+        fetch_workers=args.fetch_workers,
+        extract_workers=args.extract_workers,
+        cache_dir=args.cache_dir,
+        cache_ttl=args.cache_ttl,
+        profile=args.profile,
+        dedup_dir=args.dedup_dir,
+    )
+    for bundle in bundles:
+        out = output_dir / f"research_output_{_safe_name(bundle.query)}_{timestamp}.json"
+        out.write_text(
+            json.dumps(bundle.to_dict(), ensure_ascii=False, indent=2),
+            encoding="utf-8"
+        )
+        print(f"Saved: {out}")
+    print(
+        f"Batch done: {stats['queries']} queries, {stats['unique_urls']} unique URLs "
+        f"({stats['search_hits']} hits), {stats['fetches']} fetches, "
+        f"{stats['bytes_downloaded'] / 1_000_000:.1f} MB downloaded in {stats['wall_s']:.1f}s"
+    )
 
 def main():
     parser = argparse.ArgumentParser(description="Researcher Agent CLI")
-    parser.add_argument("query", help="Search query or topic")
+    parser.add_argument("query", nargs="?", help="Search query or topic")
+    parser.add_argument(
+        "--queries",
+        type=Path,
+        help="Batch mode: file with one query per line (blank lines and # comments ignored)"
+    )
     parser.add_argument(
         "--out",
         type=Path,
-        help="Output JSON file (default: auto-generated with timestamp)"
+        help="Output JSON/NDJSON file, or output folder in batch mode (default: auto-generated with timestamp)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["json", "ndjson"],
+        default="json",
+        help="json: one document written at the end; ndjson: one record per line, "
+             "each article written as soon as it is extracted (default: json)"
     )
     parser.add_argument(
         "--limit",
@@ -23,17 +79,108 @@ def main():
         type=int,
         help="Number of articles to process from fetched results (default: same as --limit)"
     )
+    parser.add_argument(
+        "--fetch-workers",
+        type=int,
+        default=FETCH_WORKERS,
+        help=f"Concurrent page downloads (default: {FETCH_WORKERS})"
+    )
+    parser.add_argument(
+        "--extract-workers",
+        type=int,
+        default=EXTRACT_WORKERS,
+        help=f"Parallel extraction processes, 0 to extract inline (default: {EXTRACT_WORKERS})"
+    )
+    parser.add_argument(
+        "--profile",
+        choices=EXTRACT_PROFILES,
+        default=EXTRACT_PROFILE,
+        help=(f"Extraction profile: 'fast' skips Newspaper3k's summary/NLP pass and image downloads; "
+              f"top_image is then the page's meta or first image URL, unchecked (default: {EXTRACT_PROFILE})")
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=HTTP_CACHE_DIR,
+        help="Directory for the on-disk HTTP response cache (default: disabled)"
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=HTTP_CACHE_TTL,
+        help=f"Seconds before a cached page is revalidated (default: {HTTP_CACHE_TTL})"
+    )
+    parser.add_argument(
+        "--dedup-dir",
+        type=Path,
+        default=DEDUP_DIR,
+        help="Directory of per-topic fingerprint indexes for dedup across runs (default: this run only)"
+    )
+    parser.add_argument(
+        "--search-backend",
+        choices=["ddgs", "file"],
+        default=SEARCH_BACKEND,
+        help=f"Search provider; 'file' reads canned results from --search-fixtures (default: {SEARCH_BACKEND})"
+    )
+    parser.add_argument(
+        "--search-fixtures",
+        type=Path,
+        help="JSON file (query -> results) or folder of <query>.json files for the 'file' backend"
+    )
+    parser.add_argument(
+        "--search-cache-dir",
+        type=Path,
+        default=SEARCH_CACHE_DIR,
+        help="Directory for cached search results (default: in-memory for this run)"
+    )
     args = parser.parse_args()
 
+    if bool(args.query) == bool(args.queries):
+        parser.error("give either a query or --queries FILE")
+    if args.queries and args.format != "json":
+        parser.error("batch mode (--queries) writes JSON bundles only")
+
+    if args.search_backend == "file" and not args.search_fixtures:
+        parser.error("--search-backend file needs --search-fixtures")
+    configure_search(
+        backend=args.search_backend,
+        fixtures=args.search_fixtures,
+        cache_dir=args.search_cache_dir,
+        cache_ttl=SEARCH_CACHE_TTL,
+    )
+
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
+    if args.queries:
+        _run_batch(args, timestamp)
+        return
+
     # Auto-generate filename if not provided
     if args.out is None:
         output_dir = Path("output")
         output_dir.mkdir(exist_ok=True)
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        safe_query = "_".join(args.query.lower().split())[:50]
-        args.out = output_dir / f"research_output_{safe_query}_{timestamp}.json"
+        args.out = output_dir / f"research_output_{_safe_name(args.query)}_{timestamp}.{args.format}"
+
+    run_kwargs = dict(
+        limit=args.limit,
+        take=args.take,
+        fetch_workers=args.fetch_workers,
+        extract_workers=args.extract_workers,
+        cache_dir=args.cache_dir,
+        cache_ttl=args.cache_ttl,
+        profile=args.profile,
+        dedup_dir=args.dedup_dir,
+    )
+
+    if args.format == "ndjson":
+        with args.out.open("w", encoding="utf-8") as fh:
+            for record in run_research_stream(args.query, **run_kwargs):
+                fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+                fh.flush()
+        print(f"Saved: {args.out}")
+        return
 
-    bundle = run_research(args.query, limit=args.limit, take=args.take)
+    bundle = run_research(args.query, **run_kwargs)
     args.out.write_text(
         json.dumps(bundle.to_dict(), ensure_ascii=False, indent=2),
         encoding="utf-8"
@@ -0,0 +1,31 @@
+# config.py
+
+# Pipeline concurrency
+FETCH_WORKERS = 8       # concurrent HTTP fetches (thread pool)
+EXTRACT_WORKERS = 4     # parallel extraction processes (0 runs extraction inline)
+SEARCH_WORKERS = 4      # concurrent searches in batch mode
+EXTRACT_PROFILE = "full"  # "fast" skips Newspaper3k's NLP summary and image downloads
+
+# HTTP client
+FETCH_TIMEOUT = 12              # seconds per request
+FETCH_MAX_CONNECTIONS = 16      # global cap on in-flight requests
+FETCH_PER_HOST = 2              # in-flight requests per host
+FETCH_HOST_DELAY = 0.5          # politeness delay between requests to the same host (seconds)
+FETCH_MAX_BYTES = 5_000_000     # responses larger than this are dropped
+
+# On-disk HTTP response cache (disabled unless a directory is given)
+HTTP_CACHE_DIR = None           # e.g. ".cache/http"; CLI: --cache-dir
+HTTP_CACHE_TTL = 6 * 3600       # seconds before an entry is revalidated
+HTTP_CACHE_MAX_BYTES = 500_000_000
+
+# Near-duplicate detection (SimHash over word shingles)
+DEDUP_SHINGLE_SIZE = 3          # words per shingle
+DEDUP_MAX_DISTANCE = 3          # max differing bits (of 64) to count as a duplicate
+DEDUP_MIN_WORDS = 30            # shorter texts are not fingerprinted
+DEDUP_DIR = None                # per-topic index files for cross-run dedup; CLI: --dedup-dir
+
+# Search
+SEARCH_REGION = "in-en"
+SEARCH_BACKEND = "ddgs"         # "ddgs" (live) or "file" (offline fixtures, see search.FileSearchProvider)
+SEARCH_CACHE_DIR = None         # on-disk search result cache; None keeps it in memory only
+SEARCH_CACHE_TTL = 24 * 3600    # seconds
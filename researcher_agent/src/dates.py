@@ -0,0 +1,139 @@
+# dates.py
+"""
+Publish-date detection with precompiled patterns.
+
+Candidates come from three sources, ranked meta > visible text > URL. The
+text and URL are each scanned once with a single alternation pattern; within
+a source, the pattern kind decides priority (full dates before month-only),
+then position.
+"""
+import re
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Month lookup for text/URL parsing
+MONTH_MAP = {
+    "jan": 1, "january": 1,
+    "feb": 2, "february": 2,
+    "mar": 3, "march": 3,
+    "apr": 4, "april": 4,
+    "may": 5,
+    "jun": 6, "june": 6,
+    "jul": 7, "july": 7,
+    "aug": 8, "august": 8,
+    "sep": 9, "sept": 9, "september": 9,
+    "oct": 10, "october": 10,
+    "nov": 11, "november": 11,
+    "dec": 12, "december": 12
+}
+
+# Meta tags that may carry the publish date, in priority order
+META_DATE_KEYS = [
+    ("property", "article:published_time"),
+    ("name", "pubdate"),
+    ("name", "publishdate"),
+    ("property", "og:pubdate"),
+    ("name", "date"),
+    ("itemprop", "datePublished"),
+]
+
+# Only the top of the page is scanned; bylines and datelines live there
+TEXT_SCAN_CHARS = 20000
+
+_MON = r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*"
+_MON_NAMES = "|".join(sorted(MONTH_MAP, key=len, reverse=True))
+
+# Kinds are listed in priority order; the lowest index wins
+_TEXT_RE = re.compile(
+    rf"\b(?P<dmy_d>\d{{1,2}})\s+(?P<dmy_m>{_MON})[,\s]+(?P<dmy_y>\d{{4}})"
+    rf"|\b(?P<mdy_m>{_MON})\s+(?P<mdy_d>\d{{1,2}})[,\s]+(?P<mdy_y>\d{{4}})"
+    rf"|\b(?P<my_m>{_MON})[,\s]+(?P<my_y>\d{{4}})",
+    re.I,
+)
+_TEXT_KINDS = ("dmy", "mdy", "my")
+
+_URL_RE = re.compile(
+    r"(?P<ymd_y>\d{4})[/-](?P<ymd_m>\d{2})[/-](?P<ymd_d>\d{2})"    # 2025-08-14 or 2025/08/14
+    r"|(?P<cmp_y>\d{4})(?P<cmp_m>\d{2})(?P<cmp_d>\d{2})"           # 20250814
+    rf"|(?P<my_m>{_MON_NAMES})[-/](?P<my_y>\d{{4}})"               # august-2025
+    rf"|(?P<ym_y>\d{{4}})[-/](?P<ym_m>{_MON_NAMES})",              # 2025/aug
+    re.I,
+)
+_URL_KINDS = ("ymd", "cmp", "my", "ym")
+
+def _month(name: str) -> int:
+    name = name.lower()
+    return MONTH_MAP.get(name) or MONTH_MAP[name[:3]]
+
+def _to_date(kind: str, g: Dict[str, str]) -> Optional[str]:
+    try:
+        if kind in ("ymd", "cmp"):
+            y, m, d = int(g[f"{kind}_y"]), int(g[f"{kind}_m"]), int(g[f"{kind}_d"])
+        elif kind in ("dmy", "mdy"):
+            y, m, d = int(g[f"{kind}_y"]), _month(g[f"{kind}_m"]), int(g[f"{kind}_d"])
+        else:
+            y, m, d = int(g[f"{kind}_y"]), _month(g[f"{kind}_m"]), 1
+        return str(datetime(y, m, d).date())
+    except (ValueError, KeyError):
+        return None
+
+def _scan(pattern: re.Pattern, kinds: Tuple[str, ...], s: str) -> Optional[str]:
+    """One pass over `s`; keep the first valid date of each kind, return the best-ranked."""
+    found: Dict[str, str] = {}
+    for m in pattern.finditer(s):
+        g = m.groupdict()
+        kind = next(k for k in kinds if g.get(f"{k}_y"))
+        if kind in found:
+            continue
+        date = _to_date(kind, g)
+        if date:
+            found[kind] = date
+            if kind == kinds[0]:
+                break
+    for kind in kinds:
+        if kind in found:
+            return found[kind]
+    return None
+
+def _parse_meta_date(content: str) -> Optional[str]:
+    """ISO-8601 fast path; pandas (imported on demand) for everything else."""
+    try:
+        return str(datetime.fromisoformat(content.strip().replace("Z", "+00:00")).date())
+    except ValueError:
+        pass
+    import pandas as pd
+    try:
+        return str(pd.to_datetime(content).date())
+    except Exception:
+        return None
+
+def date_from_meta(meta: Dict[Tuple[str, str], str]) -> Optional[str]:
+    """Publish date from collected meta tags ({(attr, lowercased value): content})."""
+    for attr, name in META_DATE_KEYS:
+        content = meta.get((attr, name.lower()))
+        if content:
+            date = _parse_meta_date(content)
+            if date:
+                return date
+    return None
+
+def date_from_text(text: str) -> Optional[str]:
+    """Date-like patterns in the first TEXT_SCAN_CHARS of visible page text."""
+    if not text:
+        return None
+    return _scan(_TEXT_RE, _TEXT_KINDS, text[:TEXT_SCAN_CHARS])
+
+def date_from_url(url: str) -> Optional[str]:
+    """Date patterns inside the URL."""
+    if not url:
+        return None
+    return _scan(_URL_RE, _URL_KINDS, url)
+
+def best_date(meta: Dict[Tuple[str, str], str] = None, text: str = "", url: str = "") -> Optional[str]:
+    """Highest-ranked candidate: meta, then text, then URL."""
+    return date_from_meta(meta or {}) or date_from_text(text) or date_from_url(url)
+
+def best_dates(docs: Iterable[Tuple[Optional[dict], str, str]]) -> List[Optional[str]]:
+    """Batch form of `best_date` over (meta, text, url) triples."""
+    return [best_date(meta, text, url) for meta, text, url in docs]
@@ -0,0 +1,103 @@
+# dedup.py
+"""
+Near-duplicate detection for extracted articles.
+
+Each text gets a 64-bit SimHash over word shingles. Two texts are near
+duplicates when their fingerprints differ in at most `max_distance` bits.
+Lookups use LSH banding: the fingerprint is split into max_distance + 1
+bands, and any pair within the distance must agree exactly on at least one
+band, so only articles sharing a band are compared.
+"""
+import hashlib
+import json
+import os
+import re
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .config import DEDUP_SHINGLE_SIZE, DEDUP_MAX_DISTANCE, DEDUP_MIN_WORDS
+
+_BITS = 64
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+def _hash64(s: str) -> int:
+    return int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+
+def fingerprint(text: str, shingle_size: int = DEDUP_SHINGLE_SIZE, min_words: int = DEDUP_MIN_WORDS) -> Optional[int]:
+    """64-bit SimHash of `text`, or None when the text is too short to fingerprint."""
+    words = _WORD_RE.findall((text or "").lower())
+    if len(words) < max(min_words, shingle_size):
+        return None
+    shingles = Counter(" ".join(words[i:i + shingle_size]) for i in range(len(words) - shingle_size + 1))
+    weights = [0] * _BITS
+    for shingle, count in shingles.items():
+        h = _hash64(shingle)
+        for bit in range(_BITS):
+            weights[bit] += count if (h >> bit) & 1 else -count
+    fp = 0
+    for bit, w in enumerate(weights):
+        if w > 0:
+            fp |= 1 << bit
+    return fp
+
+def topic_slug(query: str) -> str:
+    return "_".join(re.findall(r"\w+", query.lower()))[:80] or "untitled"
+
+class DedupIndex:
+    """
+    Incremental SimHash LSH index mapping fingerprints to canonical URLs.
+
+    With a `path`, entries are loaded from and saved to a JSON file so later
+    runs on the same topic see earlier articles.
+    """
+
+    def __init__(self, path: Path = None, max_distance: int = DEDUP_MAX_DISTANCE):
+        self.path = Path(path) if path else None
+        self.max_distance = max_distance
+        self._bands = max_distance + 1
+        self._band_bits = _BITS // self._bands
+        self._buckets: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        self._entries: Dict[int, str] = {}
+        if self.path and self.path.exists():
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            for fp_hex, url in data.get("entries", []):
+                self.add(int(fp_hex, 16), url)
+
+    @classmethod
+    def for_topic(cls, directory, query: str, **kwargs) -> "DedupIndex":
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        return cls(directory / f"{topic_slug(query)}.json", **kwargs)
+
+    def _band_keys(self, fp: int):
+        mask = (1 << self._band_bits) - 1
+        for b in range(self._bands):
+            yield b, (fp >> (b * self._band_bits)) & mask
+
+    def lookup(self, fp: int) -> Optional[str]:
+        """URL of an indexed near-duplicate of `fp`, or None."""
+        for key in self._band_keys(fp):
+            for other in self._buckets.get(key, ()):
+                if bin(fp ^ other).count("1") <= self.max_distance:
+                    return self._entries[other]
+        return None
+
+    def add(self, fp: int, url: str) -> None:
+        if fp in self._entries:
+            return
+        self._entries[fp] = url
+        for key in self._band_keys(fp):
+            self._buckets[key].append(fp)
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        entries = [[f"{fp:016x}", url] for fp, url in self._entries.items()]
+        # Replace in one step so an interrupted run keeps the previous index
+        tmp = self.path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps({"entries": entries}), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def __len__(self):
+        return len(self._entries)
@@ -1,170 +1,161 @@
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse
-from newspaper import Article as NPArticle
-import re
-import pandas as pd
+from lxml import etree, html as lxml_html
+from urllib.parse import urljoin, urlparse
 from datetime import datetime
+from .dates import date_from_meta, date_from_text, date_from_url, TEXT_SCAN_CHARS
+from .config import EXTRACT_PROFILE
 
-# Month lookup for text/URL parsing
-MONTH_MAP = {
-    "jan": 1, "january": 1,
-    "feb": 2, "february": 2,
-    "mar": 3, "march": 3,
-    "apr": 4, "april": 4,
-    "may": 5,
-    "jun": 6, "june": 6,
-    "jul": 7, "july": 7,
-    "aug": 8, "august": 8,
-    "sep": 9, "sept": 9, "september": 9,
-    "oct": 10, "october": 10,
-    "nov": 11, "november": 11,
-    "dec": 12, "december": 12
-}
+# "fast" skips Newspaper's NLP pass (the analyst summarizes again anyway) and
+# its image downloads: top_image is the page's meta image or first article
+# image URL, taken without fetching it to check its size. "full" keeps both.
+EXTRACT_PROFILES = ("fast", "full")
 
 def _clean_text(text: str) -> str:
     """Normalize whitespace in extracted article text."""
     lines = [ln.strip() for ln in text.splitlines()]
     return "\n".join(ln for ln in lines if ln)
 
-def _extract_date_from_meta(soup: BeautifulSoup):
-    """Try to get publish date from HTML meta tags."""
-    meta_props = [
-        {"attr": "property", "name": "article:published_time"},
-        {"attr": "name", "name": "pubdate"},
-        {"attr": "name", "name": "publishdate"},
-        {"attr": "property", "name": "og:pubdate"},
-        {"attr": "name", "name": "date"},
-        {"attr": "itemprop", "name": "datePublished"},
-    ]
-    for mp in meta_props:
-        tag = soup.find("meta", {mp["attr"]: mp["name"]})
-        if tag and tag.get("content"):
-            try:
-                return str(pd.to_datetime(tag["content"]).date())
-            except Exception:
-                pass
-    return None
-
-def _extract_date_from_text(soup: BeautifulSoup):
-    """Look for date-like patterns in visible HTML text."""
-    text = soup.get_text(separator=" ")
-
-    # DD Month YYYY or Month DD YYYY
-    m1 = re.search(r"\b(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*[,\s]+(\d{4})", text, re.I)
-    if m1:
-        day, mon, year = m1.groups()
-        try:
-            return str(datetime(int(year), MONTH_MAP[mon.lower()[:3]], int(day)).date())
-        except Exception:
-            pass
-
-    m2 = re.search(r"\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*\s+(\d{1,2})[,\s]+(\d{4})", text, re.I)
-    if m2:
-        mon, day, year = m2.groups()
-        try:
-            return str(datetime(int(year), MONTH_MAP[mon.lower()[:3]], int(day)).date())
-        except Exception:
-            pass
+# Elements whose text is never visible on the page
+_INVISIBLE_TAGS = {"script", "style", "noscript", "template"}
 
-    # Month YYYY only → default to first day of month
-    m3 = re.search(r"\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*[,\s]+(\d{4})", text, re.I)
-    if m3:
-        mon, year = m3.groups()
-        try:
-            return str(datetime(int(year), MONTH_MAP[mon.lower()[:3]], 1).date())
-        except Exception:
-            pass
-
-    return None
-
-def _extract_date_from_url(url: str):
-    """Check for date patterns inside the URL."""
-    date_patterns = [
-        r"(\d{4})[/-](\d{2})[/-](\d{2})",  # 2025-08-14 or 2025/08/14
-        r"(\d{4})(\d{2})(\d{2})",          # 20250814
-    ]
-    for pat in date_patterns:
-        match = re.search(pat, url)
-        if match:
-            try:
-                y, m, d = match.groups()
-                return str(datetime(int(y), int(m), int(d)).date())
-            except Exception:
-                continue
-
-    # YYYY-monthname or monthname-YYYY
-    for mon_name, mon_num in MONTH_MAP.items():
-        m1 = re.search(rf"{mon_name}[-/](\d{{4}})", url, re.I)
-        if m1:
-            try:
-                return str(datetime(int(m1.group(1)), mon_num, 1).date())
-            except Exception:
-                pass
-        m2 = re.search(rf"(\d{{4}})[-/]{mon_name}", url, re.I)
-        if m2:
-            try:
-                return str(datetime(int(m2.group(1)), mon_num, 1).date())
-            except Exception:
-                pass
-
-    return None
-
-def robust_published_date(html: str, url: str):
-    """Master function to try all date extraction fallbacks."""
-    soup = BeautifulSoup(html, "lxml")
+def parse_html(html: str):
+    """
+    Parse a page into a single lxml tree. Every helper below works off this
+    tree, so each document is parsed exactly once.
+    """
+    if not html:
+        return None
+    try:
+        return lxml_html.document_fromstring(html)
+    except ValueError:
+        # Unicode input carrying an XML encoding declaration
+        return lxml_html.document_fromstring(html.encode("utf-8"))
+    except etree.ParserError:
+        return None
+
+def _collect_meta(tree) -> dict:
+    """Single walk over <meta> tags → {(attr, value): content}."""
+    meta = {}
+    if tree is None:
+        return meta
+    for tag in tree.iter("meta"):
+        content = tag.get("content")
+        if not content:
+            continue
+        for attr in ("property", "name", "itemprop"):
+            val = tag.get(attr)
+            if val:
+                meta.setdefault((attr, val.lower()), content)
+    return meta
+
+def _visible_text(tree, max_chars: int = None) -> str:
+    """Page text excluding script/style bodies and comments, optionally stopping after `max_chars`."""
+    if tree is None:
+        return ""
+    parts = []
+    size = 0
+    for el in tree.iter():
+        for chunk in ((el.text if isinstance(el.tag, str) and el.tag not in _INVISIBLE_TAGS else None), el.tail):
+            if chunk:
+                parts.append(chunk)
+                size += len(chunk) + 1
+        if max_chars is not None and size >= max_chars:
+            break
+    return " ".join(parts)
+
+def _text_of(el) -> str:
+    """Equivalent of BeautifulSoup's get_text(" ", strip=True) for one element."""
+    return " ".join(s.strip() for s in el.itertext() if s.strip())
+
+def _top_image_no_download(art, meta: dict):
+    """Newspaper's top image choice (meta image, else first image of the article body), without downloads."""
+    try:
+        if art.clean_doc is not None:
+            image = art.extractor.get_meta_img_url(art.url, art.clean_doc)
+            if image:
+                return image
+        if art.clean_top_node is not None:
+            image = art.extractor.get_first_img_url(art.url, art.clean_top_node)
+            if image:
+                return image
+    except Exception:
+        pass
+    image = meta.get(("property", "og:image")) or meta.get(("name", "twitter:image"))
+    return urljoin(art.url, image) if image else None
+
+def robust_published_date(html: str, url: str, tree=None, meta: dict = None):
+    """Master function to try all date extraction fallbacks. Pass `tree`/`meta` to reuse a parse."""
+    if tree is None:
+        tree = parse_html(html)
+    if meta is None:
+        meta = _collect_meta(tree)
     return (
-        _extract_date_from_meta(soup)
-        or _extract_date_from_text(soup)
-        or _extract_date_from_url(url)
+        date_from_meta(meta)
+        or date_from_text(_visible_text(tree, max_chars=TEXT_SCAN_CHARS))
+        or date_from_url(url)
         or str(datetime.utcnow().date())  # Fallback: today's date
     )
 
-def extract_with_newspaper(url: str, html: str):
+def extract_with_newspaper(url: str, html: str, profile: str = EXTRACT_PROFILE):
     """Extract article with Newspaper3k + robust date fallback."""
-    art = NPArticle(url=url, language='en')
+    # Imported lazily: newspaper pulls in nltk and friends at import time
+    from newspaper import Article as NPArticle
+
+    full = profile == "full"
+    art = NPArticle(url=url, language='en', fetch_images=full)
     art.download(input_html=html)
     art.parse()
 
-    try:
-        art.nlp()
-        summary = art.summary
-    except Exception:
-        summary = None
+    summary = None
+    if full:
+        try:
+            art.nlp()
+            summary = art.summary
+        except Exception:
+            summary = None
+
+    # Reuse Newspaper's own untouched lxml tree instead of parsing the HTML again
+    tree = getattr(art, "clean_doc", None)
+    if tree is None:
+        tree = parse_html(html)
+    meta = _collect_meta(tree)
 
     # Try Newspaper3k's publish_date first
     published_date = None
     if art.publish_date:
         published_date = str(art.publish_date.date())
     else:
-        published_date = robust_published_date(html, url)
+        published_date = robust_published_date(html, url, tree=tree, meta=meta)
 
     return {
         "title": art.title or None,
         "authors": art.authors or [],
         "published": published_date,
-        "top_image": art.top_image or None,
+        "top_image": (art.top_image if full else _top_image_no_download(art, meta)) or None,
         "summary": summary,
         "text": _clean_text(art.text or ""),
         "extra": {
-            "meta_keywords": _extract_meta_keywords(html)
+            "meta_keywords": _extract_meta_keywords(meta)
         }
     }
 
-def _extract_meta_keywords(html: str):
-    soup = BeautifulSoup(html, "lxml")
-    tag = soup.find("meta", attrs={"name": "keywords"})
-    if tag and tag.get("content"):
-        return [kw.strip() for kw in tag["content"].split(",")]
+def _extract_meta_keywords(meta: dict):
+    content = meta.get(("name", "keywords"))
+    if content:
+        return [kw.strip() for kw in content.split(",")]
     return []
 
-def extract_with_bs4(html: str, url: str):
-    """Simpler BS4 extractor (fallback if Newspaper3k fails)."""
-    soup = BeautifulSoup(html, "lxml")
-    for tag in soup(["script", "style", "noscript"]):
-        tag.decompose()
-    title = soup.title.string.strip() if soup.title else None
-    paragraphs = [p.get_text(" ", strip=True) for p in soup.find_all("p")]
-    published_date = robust_published_date(html, url)
+def extract_with_lxml(html: str, url: str):
+    """Simpler single-parse extractor (fallback if Newspaper3k fails)."""
+    tree = parse_html(html)
+    meta = _collect_meta(tree)
+    title = None
+    paragraphs = []
+    if tree is not None:
+        title_el = tree.find(".//title")
+        if title_el is not None and title_el.text:
+            title = title_el.text.strip() or None
+        paragraphs = [_text_of(p) for p in tree.iter("p")]
+    published_date = robust_published_date(html, url, tree=tree, meta=meta)
     return {
         "title": title,
         "authors": [],
@@ -173,7 +164,7 @@ def extract_with_bs4(html: str, url: str):
         "summary": None,
         "text": _clean_text("\n".join(paragraphs)),
         "extra": {
-            "meta_keywords": _extract_meta_keywords(html)
+            "meta_keywords": _extract_meta_keywords(meta)
         }
     }
 
@@ -1,17 +1,165 @@
+import threading
+import time
+from urllib.parse import urlparse
+
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, Timeout
 
+from .cache import ResponseCache
+from .config import (
+    FETCH_TIMEOUT, FETCH_MAX_CONNECTIONS, FETCH_PER_HOST, FETCH_HOST_DELAY, FETCH_MAX_BYTES
+)
+
 HEADERS = {
-    "User-Agent": "Mozilla/5.0 (compatible; ResearcherAgent/1.0)"
+    "User-Agent": "Mozilla/5.0 (compatible; ResearcherAgent/1.0)",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
 }
 
-def fetch_url(url: str, timeout: int = 12):
+_CHUNK_SIZE = 64 * 1024
+
+def _decode(body: bytes, encoding) -> str:
+    """Decode with the declared charset, falling back to utf-8 if it is missing or unknown (as `requests` does)."""
     try:
-        r = requests.get(url, headers=HEADERS, timeout=timeout, allow_redirects=True)
-        if "text/html" not in r.headers.get("Content-Type", ""):
-            return None, "Non-HTML content"
-        if r.status_code != 200:
-            return None, f"HTTP {r.status_code}"
-        return r.text, None
-    except (RequestException, Timeout) as e:
-        return None, str(e)
+        return str(body, encoding or "utf-8", errors="replace")
+    except (LookupError, TypeError):
+        return str(body, "utf-8", errors="replace")
+
+class FetchClient:
+    """
+    Thread-safe HTTP client with one pooled keep-alive session per host.
+
+    Limits in-flight requests globally and per host, spaces out requests to
+    the same host by `host_delay` seconds, and streams bodies so responses
+    over `max_bytes` are abandoned without being held in memory. With a
+    `cache`, fresh entries skip the network and stale ones are revalidated
+    with If-None-Match / If-Modified-Since.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = FETCH_MAX_CONNECTIONS,
+        per_host: int = FETCH_PER_HOST,
+        host_delay: float = FETCH_HOST_DELAY,
+        max_bytes: int = FETCH_MAX_BYTES,
+        timeout: int = FETCH_TIMEOUT,
+        cache: ResponseCache = None,
+    ):
+        self.per_host = max(1, per_host)
+        self.host_delay = host_delay
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.cache = cache
+        self._global = threading.BoundedSemaphore(max(1, max_connections))
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._host_slots = {}
+        self._host_locks = {}
+        self._last_hit = {}
+        self._counters = {"requests": 0, "bytes": 0}
+
+    def _session(self, host: str) -> requests.Session:
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                session.headers.update(HEADERS)
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.per_host)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host] = session
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+                self._host_locks[host] = threading.Lock()
+            return session
+
+    def _wait_politely(self, host: str):
+        if self.host_delay <= 0:
+            return
+        with self._host_locks[host]:
+            wait = self._last_hit.get(host, 0.0) + self.host_delay - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_hit[host] = time.monotonic()
+
+    def _read_capped(self, r: requests.Response):
+        """(body, bytes read); body is None once the response is known to exceed `max_bytes`."""
+        declared = r.headers.get("Content-Length")
+        if declared and declared.isdigit() and int(declared) > self.max_bytes:
+            return None, 0
+        buf = bytearray()
+        for chunk in r.iter_content(chunk_size=_CHUNK_SIZE):
+            buf.extend(chunk)
+            if len(buf) > self.max_bytes:
+                return None, len(buf)
+        return bytes(buf), len(buf)
+
+    def _count(self, requests_made: int = 0, nbytes: int = 0):
+        with self._lock:
+            self._counters["requests"] += requests_made
+            self._counters["bytes"] += nbytes
+
+    def stats(self) -> dict:
+        """Network requests sent and body bytes downloaded so far."""
+        with self._lock:
+            return dict(self._counters)
+
+    def fetch(self, url: str, timeout: int = None):
+        """Return (html, None) on success or (None, reason) on failure."""
+        cached = self.cache.get(url) if self.cache else None
+        if cached and cached["fresh"]:
+            self.cache.record("hits")
+            return cached["body"], None
+
+        host = urlparse(url).netloc.lower()
+        session = self._session(host)
+        extra_headers = ResponseCache.conditional_headers(cached) if cached else {}
+        with self._global, self._host_slots[host]:
+            self._wait_politely(host)
+            try:
+                with session.get(url, timeout=timeout or self.timeout, headers=extra_headers,
+                                 allow_redirects=True, stream=True) as r:
+                    self._count(requests_made=1)
+                    if cached and r.status_code == 304:
+                        self.cache.refresh(url)
+                        self.cache.record("revalidated")
+                        return cached["body"], None
+                    if self.cache:
+                        self.cache.record("misses")
+                    if "text/html" not in r.headers.get("Content-Type", ""):
+                        return None, "Non-HTML content"
+                    if r.status_code != 200:
+                        return None, f"HTTP {r.status_code}"
+                    body, nbytes = self._read_capped(r)
+                    # abandoned bodies were still downloaded up to the cap
+                    self._count(nbytes=nbytes)
+                    if body is None:
+                        return None, f"Response exceeds {self.max_bytes} bytes"
+                    html = _decode(body, r.encoding)
+                    if self.cache:
+                        self.cache.put(url, html, r.headers)
+                    return html, None
+            except (RequestException, Timeout) as e:
+                if self.cache:
+                    self.cache.record("misses")
+                return None, str(e)
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+_default_client = None
+_default_lock = threading.Lock()
+
+def get_client() -> FetchClient:
+    """Shared process-wide client, created on first use."""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = FetchClient()
+        return _default_client
+
+def fetch_url(url: str, timeout: int = FETCH_TIMEOUT):
+    return get_client().fetch(url, timeout=timeout)
@@ -1,8 +1,16 @@
-from typing import List
+import multiprocessing
+import time
+from dataclasses import replace
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from .schema import Article, ResearchBundle
-from .search import web_search
-from .fetch import fetch_url
-from .extract import extract_with_newspaper, extract_with_bs4, domain_of
+from .search import web_search, search_cache_stats
+from .fetch import FetchClient, get_client
+from .dedup import DedupIndex, fingerprint
+from .cache import normalize_url
+from .extract import extract_with_newspaper, extract_with_lxml, domain_of
+from .config import FETCH_WORKERS, EXTRACT_WORKERS, EXTRACT_PROFILE, SEARCH_WORKERS
 
 def _infer_source_type(domain: str):
     if domain.endswith(".gov") or ".gov." in domain:
@@ -31,28 +39,336 @@ def _build_article(url: str, extracted: dict, status="ok", error=None) -> Articl
         extra=extracted.get("extra", {}) if extracted else None
     )
 
-def research(query: str, limit: int = 8, take_first_n: int = 6) -> ResearchBundle:
+def _extract(url: str, html: str, profile: str = EXTRACT_PROFILE) -> dict:
+    """Newspaper3k with lxml fallback. Module-level so it can run in a worker process."""
+    try:
+        extracted = extract_with_newspaper(url, html, profile=profile)
+        if not extracted.get("text"):
+            print(f" No text from Newspaper3k for {url}, falling back to lxml...")
+            extracted = extract_with_lxml(html, url)
+    except Exception as e:
+        print(f" Error in Newspaper3k for {url} ({e}), using lxml...")
+        extracted = extract_with_lxml(html, url)
+    return extracted
+
+def _extract_context():
+    """
+    Start method for extraction workers. The pool is started while fetch
+    threads are running, and forking a multi-threaded process can leave a
+    child holding a lock no thread will release; forkserver (or spawn where
+    it is unavailable) starts workers from a clean process.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+def _pipeline(
+    hits: List[dict],
+    fetch_workers: int,
+    extract_workers: int,
+    client: FetchClient,
+    profile: str = EXTRACT_PROFILE,
+) -> Iterator[Tuple[int, Article]]:
+    """
+    Fetch and extract `hits` as an overlapping pipeline, yielding (rank, Article)
+    in completion order.
+
+    Fetches run on a thread pool (network bound); each page is handed to a
+    process pool for extraction (CPU bound) as soon as it arrives.
+    """
+    total = len(hits)
+    fetch_pool = ThreadPoolExecutor(max_workers=max(1, fetch_workers))
+    extract_pool = (ProcessPoolExecutor(max_workers=extract_workers, mp_context=_extract_context())
+                    if extract_workers > 0 else None)
+    try:
+        # future -> (stage, rank, html)
+        pending = {fetch_pool.submit(client.fetch, hit["url"]): ("fetch", i, None) for i, hit in enumerate(hits)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                stage, i, html = pending.pop(fut)
+                url = hits[i]["url"]
+                if stage == "fetch":
+                    title = hits[i].get("title") or url
+                    html, err = fut.result()
+                    if err:
+                        print(f"[{i+1}/{total}] Skipped {title} ({err})")
+                        yield i, _build_article(url, None, status="skipped", error=err)
+                        continue
+                    print(f"[{i+1}/{total}] Fetched: {title}")
+                    if extract_pool is not None:
+                        pending[extract_pool.submit(_extract, url, html, profile)] = ("extract", i, html)
+                        continue
+                    extracted = _extract(url, html, profile)
+                else:
+                    try:
+                        extracted = fut.result()
+                    except Exception as e:
+                        # Broken worker (e.g. killed process); extract in-process instead
+                        print(f" Extraction worker failed for {url} ({e}), retrying inline...")
+                        extracted = _extract(url, html, profile)
+                print(f"[{i+1}/{total}] Done ({len(extracted.get('text', '').split())} words)")
+                yield i, _build_article(url, extracted)
+    finally:
+        fetch_pool.shutdown(cancel_futures=True)
+        if extract_pool is not None:
+            extract_pool.shutdown(cancel_futures=True)
+
+def _dedup(article: Article, index: DedupIndex, canonical: Dict[str, Article], stats: Dict[str, int]) -> Optional[int]:
+    """
+    Fingerprint `article`; if it nearly duplicates an indexed one, record it
+    on that canonical article and turn it into a text-less "duplicate" stub.
+    Returns the fingerprint (None when the article has none).
+    """
+    if article.status != "ok":
+        return None
+    fp = fingerprint(article.text)
+    if fp is None:
+        return None
+    match = index.lookup(fp)
+    if match is None:
+        index.add(fp, article.url)
+        canonical[article.url] = article
+        return fp
+    if match in canonical:
+        canonical[match].duplicates.append({"url": article.url, "source": article.source})
+        stats["in_run"] += 1
+    else:
+        stats["cross_run"] += 1
+    print(f" Near-duplicate of {match}: {article.url}")
+    article.status = "duplicate"
+    article.duplicate_of = match
+    article.text = ""
+    article.summary = None
+    article.word_count = 0
+    return fp
+
+def _against_history(article: Article, fp: Optional[int], history: DedupIndex, stats: Dict[str, int]) -> Article:
+    """
+    `article` as a bundle whose topic index is `history` should hold it: a
+    text-less "duplicate" copy when an earlier run saw a near-duplicate, else
+    the article itself. Batch articles are shared between queries, so the
+    article is copied rather than turned into a stub.
+    """
+    if article.status != "ok" or fp is None:
+        return article
+    match = history.lookup(fp)
+    if match is None:
+        return article
+    stats["cross_run"] += 1
+    print(f" Seen in an earlier run as {match}: {article.url}")
+    return replace(article, status="duplicate", duplicate_of=match, text="", summary=None,
+                   word_count=0, duplicates=[])
+
+def _search(query: str, limit: int, take_first_n: int) -> List[dict]:
     print(f"Searching for '{query}' (limit={limit})...")
-    hits = web_search(query, max_results=limit)
-    print(f"Found {len(hits)} results. Processing first {take_first_n}...")
-
-    articles: List[Article] = []
-    for i, hit in enumerate(hits[:take_first_n]):
-        title = hit.get("title") or hit.get("url")
-        print(f"[{i+1}/{take_first_n}] Processing: {title}")
-        html, err = fetch_url(hit["url"])
-        if err:
-            print(f" Skipped ({err})")
-            articles.append(_build_article(hit["url"], None, status="skipped", error=err))
-            continue
-        try:
-            extracted = extract_with_newspaper(hit["url"], html)
-            if not extracted.get("text"):
-                print(" No text from Newspaper3k, falling back to BeautifulSoup...")
-                extracted = extract_with_bs4(html, hit["url"])
-        except Exception as e:
-            print(f" Error in Newspaper3k ({e}), using BeautifulSoup...")
-            extracted = extract_with_bs4(html, hit["url"])
-        articles.append(_build_article(hit["url"], extracted))
-        print(f" Done ({len(extracted.get('text', '').split())} words)")
-    return ResearchBundle(query, articles)
+    hits = web_search(query, max_results=limit)[:take_first_n]
+    print(f"Found {len(hits)} results to process.")
+    return hits
+
+def _cache_meta(client: FetchClient) -> dict:
+    meta = {}
+    search_stats = search_cache_stats()
+    if search_stats:
+        meta["search_cache"] = search_stats
+    if client.cache is not None:
+        stats = client.cache.stats()
+        print(f"HTTP cache: {stats['hits']} hits, {stats['revalidated']} revalidated, {stats['misses']} misses")
+        meta["http_cache"] = stats
+    return meta
+
+def research(
+    query: str,
+    limit: int = 8,
+    take_first_n: int = 6,
+    fetch_workers: int = FETCH_WORKERS,
+    extract_workers: int = EXTRACT_WORKERS,
+    client: FetchClient = None,
+    profile: str = EXTRACT_PROFILE,
+    dedup_index: DedupIndex = None,
+) -> ResearchBundle:
+    """
+    Search, then fetch and extract the top hits concurrently.
+
+    Articles are returned in search-rank order regardless of completion order.
+    `client` defaults to the shared FetchClient; pass one with a cache to
+    reuse responses across runs. `profile` is the extraction profile
+    ("fast" or "full", see extract.EXTRACT_PROFILES).
+
+    Near-duplicates are collapsed into the highest-ranked copy, which lists
+    the others under `duplicates`. Matches against earlier runs (a persisted
+    `dedup_index`) stay in the bundle as "duplicate" stubs without text.
+    """
+    client = client or get_client()
+    index = dedup_index if dedup_index is not None else DedupIndex()
+    hits = _search(query, limit, take_first_n)
+    slots: List[Optional[Article]] = [None] * len(hits)
+    for i, article in _pipeline(hits, fetch_workers, extract_workers, client, profile):
+        slots[i] = article
+
+    canonical: Dict[str, Article] = {}
+    dedup_stats = {"in_run": 0, "cross_run": 0}
+    for article in slots:
+        if article is not None:
+            _dedup(article, index, canonical, dedup_stats)
+    index.save()
+
+    articles: List[Article] = [
+        a for a in slots
+        if a is not None and not (a.status == "duplicate" and a.duplicate_of in canonical)
+    ]
+    meta = _cache_meta(client)
+    meta["duplicates"] = dedup_stats
+    return ResearchBundle(query, articles, meta=meta)
+
+def research_stream(
+    query: str,
+    limit: int = 8,
+    take_first_n: int = 6,
+    fetch_workers: int = FETCH_WORKERS,
+    extract_workers: int = EXTRACT_WORKERS,
+    client: FetchClient = None,
+    profile: str = EXTRACT_PROFILE,
+    dedup_index: DedupIndex = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Streaming form of `research` yielding NDJSON-ready records:
+    one "header", then one "article" per result as soon as it is extracted
+    (completion order; `rank` gives the search position), then a "trailer"
+    with run stats. Nothing but fingerprints is retained between records.
+
+    Articles are deduplicated in completion order: a near-duplicate of an
+    already written article is emitted as a "duplicate" stub with
+    `duplicate_of`, and the trailer maps each canonical URL to its copies.
+    """
+    client = client or get_client()
+    index = dedup_index if dedup_index is not None else DedupIndex()
+    started = time.monotonic()
+    hits = _search(query, limit, take_first_n)
+    yield {
+        "type": "header",
+        "query": query,
+        "results": len(hits),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+    }
+    counts = {"ok": 0, "skipped": 0}
+    canonical: Dict[str, Article] = {}
+    dedup_stats = {"in_run": 0, "cross_run": 0}
+    for i, article in _pipeline(hits, fetch_workers, extract_workers, client, profile):
+        _dedup(article, index, canonical, dedup_stats)
+        counts[article.status] = counts.get(article.status, 0) + 1
+        yield {"type": "article", "rank": i, **article.to_dict()}
+        if article.status == "ok":
+            # Keep only what later duplicates need; the text has been written
+            article.text = ""
+    index.save()
+    meta = _cache_meta(client)
+    meta["duplicates"] = dedup_stats
+    yield {
+        "type": "trailer",
+        "query": query,
+        "articles": sum(counts.values()),
+        **counts,
+        "elapsed_s": round(time.monotonic() - started, 3),
+        "duplicates": {url: a.duplicates for url, a in canonical.items() if a.duplicates},
+        "meta": meta,
+    }
+
+def research_batch(
+    queries: List[str],
+    limit: int = 8,
+    take_first_n: int = 6,
+    fetch_workers: int = FETCH_WORKERS,
+    extract_workers: int = EXTRACT_WORKERS,
+    client: FetchClient = None,
+    profile: str = EXTRACT_PROFILE,
+    search_workers: int = SEARCH_WORKERS,
+    dedup_indexes: Dict[str, DedupIndex] = None,
+) -> Tuple[List[ResearchBundle], Dict[str, Any]]:
+    """
+    Research several queries with one shared fetch budget.
+
+    Searches run concurrently; the hit lists are merged on the normalized URL
+    so every page is fetched and extracted once, in a single pipeline. Each
+    query then gets its own ResearchBundle (in that query's rank order) whose
+    entries are the shared Article objects. Near-duplicates are collapsed
+    across the whole batch; a query whose copy was collapsed gets the
+    canonical article instead. `dedup_indexes` maps a query to its persisted
+    topic index: articles an earlier run on that topic already saw stay in
+    that query's bundle as "duplicate" stubs, and the index is saved with the
+    rest. Returns (bundles, batch stats).
+    """
+    client = client or get_client()
+    started = time.monotonic()
+    before = client.stats()
+
+    with ThreadPoolExecutor(max_workers=max(1, min(search_workers, len(queries)))) as pool:
+        hit_lists = list(pool.map(lambda q: _search(q, limit, take_first_n), queries))
+
+    # One entry per URL, ordered by its best rank across queries
+    best: Dict[str, Tuple[int, int, dict]] = {}
+    for hits in hit_lists:
+        for rank, hit in enumerate(hits):
+            key = normalize_url(hit["url"])
+            if key not in best or rank < best[key][0]:
+                best[key] = (rank, len(best), hit)
+    merged = sorted(best.items(), key=lambda kv: kv[1][:2])
+    keys = [key for key, _ in merged]
+    unique_hits = [hit for _, (_, _, hit) in merged]
+    print(f"Batch: {len(queries)} queries, {sum(map(len, hit_lists))} hits, {len(unique_hits)} unique URLs")
+
+    slots: List[Optional[Article]] = [None] * len(unique_hits)
+    for i, article in _pipeline(unique_hits, fetch_workers, extract_workers, client, profile):
+        slots[i] = article
+
+    index = DedupIndex()
+    canonical: Dict[str, Article] = {}
+    dedup_stats = {"in_run": 0, "cross_run": 0}
+    fingerprints: Dict[str, Optional[int]] = {}
+    for article in slots:
+        if article is not None:
+            fingerprints[article.url] = _dedup(article, index, canonical, dedup_stats)
+    by_key = dict(zip(keys, slots))
+    dedup_indexes = dedup_indexes or {}
+
+    after = client.stats()
+    stats = {
+        "queries": len(queries),
+        "search_hits": sum(map(len, hit_lists)),
+        "unique_urls": len(unique_hits),
+        "fetches": after["requests"] - before["requests"],
+        "bytes_downloaded": after["bytes"] - before["bytes"],
+        "wall_s": round(time.monotonic() - started, 3),
+        "duplicates": dedup_stats,
+        **_cache_meta(client),
+    }
+
+    bundles = []
+    seen_now: Dict[str, List[Article]] = {}
+    for query, hits in zip(queries, hit_lists):
+        history = dedup_indexes.get(query)
+        articles: List[Article] = []
+        included = set()
+        for hit in hits:
+            article = by_key.get(normalize_url(hit["url"]))
+            if article is None:
+                continue
+            if article.status == "duplicate" and article.duplicate_of in canonical:
+                article = canonical[article.duplicate_of]
+            if article.url in included:
+                continue
+            included.add(article.url)
+            if history is not None:
+                article = _against_history(article, fingerprints.get(article.url), history, dedup_stats)
+            articles.append(article)
+        if history is not None:
+            seen_now.setdefault(query, []).extend(a for a in articles if a.status == "ok")
+        bundles.append(ResearchBundle(query, articles, meta={"batch": stats}))
+
+    # Only now, so a query repeated in the batch is not matched against itself
+    for query, seen in seen_now.items():
+        history = dedup_indexes[query]
+        for article in seen:
+            if fingerprints.get(article.url) is not None:
+                history.add(fingerprints[article.url], article.url)
+        history.save()
+    return bundles, stats
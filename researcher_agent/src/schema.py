@@ -1,5 +1,5 @@
 from typing import List, Optional, Dict, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import datetime, timezone
 
 @dataclass
@@ -17,6 +17,8 @@ class Article:
     status: str
     error: Optional[str] = None
     extra: Optional[Dict[str, Any]] = None
+    duplicates: List[Dict[str, Optional[str]]] = field(default_factory=list)  # near-duplicate copies: {url, source}
+    duplicate_of: Optional[str] = None    # canonical URL when status == "duplicate"
 
     def to_dict(self):
         d = asdict(self)
@@ -27,9 +29,11 @@ class Article:
 class ResearchBundle:
     query: str
     articles: List[Article]
+    meta: Dict[str, Any] = field(default_factory=dict)   # run stats (cache counters, ...)
 
     def to_dict(self):
         return {
             "query": self.query,
+            "meta": self.meta,
             "articles": [a.to_dict() for a in self.articles]
         }
@@ -1,9 +1,166 @@
-from ddgs import DDGS
+import hashlib
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
-def web_search(query: str, max_results: int = 10):
-    with DDGS() as ddgs:
-        results = list(ddgs.text(query, region="in-en", safesearch="moderate", max_results=max_results))
+from .config import SEARCH_REGION, SEARCH_BACKEND, SEARCH_CACHE_DIR, SEARCH_CACHE_TTL
+
+class SearchProvider(ABC):
+    """Backend interface: return raw results as dicts with title, href and body."""
+    name = "base"
+
+    @abstractmethod
+    def search(self, query: str, region: str, max_results: int) -> List[dict]:
+        ...
+
+class DDGSProvider(SearchProvider):
+    """Live DuckDuckGo search."""
+    name = "ddgs"
+
+    def search(self, query: str, region: str, max_results: int) -> List[dict]:
+        from ddgs import DDGS  # imported on first search to keep CLI startup light
+        with DDGS() as ddgs:
+            return list(ddgs.text(query, region=region, safesearch="moderate", max_results=max_results))
+
+class FileSearchProvider(SearchProvider):
+    """
+    Offline provider reading canned results, for reproducible runs and benchmarks.
+
+    `path` is either a JSON file mapping query -> list of results, or a folder
+    of `<query slug>.json` files each holding a list of results. Queries are
+    matched case- and whitespace-insensitively.
+    """
+    name = "file"
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._table: Dict[str, List[dict]] = {}
+        if self.path.is_file():
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self._table = {_query_key(q): r for q, r in data.items()}
+
+    def search(self, query: str, region: str, max_results: int) -> List[dict]:
+        key = _query_key(query)
+        if self.path.is_dir():
+            fixture = self.path / f"{'_'.join(key.split())}.json"
+            results = json.loads(fixture.read_text(encoding="utf-8")) if fixture.exists() else []
+        else:
+            results = self._table.get(key, [])
+        if not results:
+            print(f"No fixture results for '{query}' in {self.path}")
+        return results[:max_results]
+
+def _query_key(query: str) -> str:
+    return " ".join(query.lower().split())
+
+class SearchCache:
+    """
+    TTL cache of raw provider results keyed by (query, region, max_results).
+
+    An entry fetched with a larger `max_results` also answers smaller
+    requests, as does one the provider could not fill (it has no more
+    results). Empty result lists are never stored: they are as likely to be a
+    rate-limited reply as a query with no results. With a `directory`
+    entries persist across runs.
+    """
+
+    def __init__(self, directory=None, ttl: int = SEARCH_CACHE_TTL):
+        self.directory = Path(directory) if directory else None
+        if self.directory:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._memory: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, provider: str, query: str, region: str) -> str:
+        raw = json.dumps([provider, _query_key(query), region])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _load(self, key: str) -> Optional[dict]:
+        entry = self._memory.get(key)
+        if entry is None and self.directory:
+            path = self.directory / f"{key}.json"
+            try:
+                entry = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return None
+            self._memory[key] = entry
+        return entry
+
+    def get(self, provider: str, query: str, region: str, max_results: int) -> Optional[List[dict]]:
+        key = self._key(provider, query, region)
+        with self._lock:
+            entry = self._load(key)
+            usable = (
+                entry is not None
+                and entry["results"]   # stored by earlier versions
+                and time.time() - entry["stored_at"] < self.ttl
+                and (entry["max_results"] >= max_results or len(entry["results"]) < entry["max_results"])
+            )
+            if usable:
+                self.hits += 1
+                return entry["results"][:max_results]
+            self.misses += 1
+            return None
+
+    def put(self, provider: str, query: str, region: str, max_results: int, results: List[dict]) -> None:
+        if not results:
+            return
+        key = self._key(provider, query, region)
+        entry = {"query": query, "region": region, "max_results": max_results,
+                 "results": results, "stored_at": time.time()}
+        with self._lock:
+            current = self._load(key)
+            if current and time.time() - current["stored_at"] < self.ttl and current["max_results"] > max_results:
+                return   # keep the fresher superset
+            self._memory[key] = entry
+            if self.directory:
+                (self.directory / f"{key}.json").write_text(json.dumps(entry), encoding="utf-8")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+_provider: SearchProvider = None
+_cache: SearchCache = None
+_configure_lock = threading.Lock()
+
+def configure_search(backend: str = SEARCH_BACKEND, fixtures=None, cache_dir=SEARCH_CACHE_DIR,
+                     cache_ttl: int = SEARCH_CACHE_TTL) -> None:
+    """Select the default provider and result cache used by `web_search`."""
+    global _provider, _cache
+    if backend == "file":
+        if not fixtures:
+            raise ValueError("The 'file' search backend needs a fixtures path.")
+        _provider = FileSearchProvider(fixtures)
+    elif backend == "ddgs":
+        _provider = DDGSProvider()
+    else:
+        raise ValueError(f"Unknown search backend: {backend}")
+    _cache = SearchCache(cache_dir, ttl=cache_ttl)
+
+def search_cache_stats() -> dict:
+    return _cache.stats() if _cache else {}
+
+def web_search(query: str, max_results: int = 10, region: str = SEARCH_REGION,
+               provider: SearchProvider = None, cache: SearchCache = None):
+    with _configure_lock:
+        if _provider is None:
+            configure_search()
+    provider = provider or _provider
+    cache = cache or _cache
+
+    results = cache.get(provider.name, query, region, max_results)
+    if results is None:
+        results = provider.search(query, region, max_results)
+        cache.put(provider.name, query, region, max_results, results)
+
     seen = set()
     unique = []
     for r in results:
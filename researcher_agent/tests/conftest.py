@@ -0,0 +1,154 @@
+"""
+Local stub HTTP server for the fetch and cache tests.
+
+The server listens on every loopback address, so 127.0.0.1, 127.0.0.2, ...
+count as different hosts for the per-host limits. It records the in-flight
+requests per Host header and overall, and the client sockets it served, and
+can delay the first request of every connection to stand in for TCP/TLS setup.
+
+Routes:
+    /page?delay=S     small HTML page, answered after S seconds
+    /article/N        article page whose 120-word text is distinct for every N
+    /big              Content-Length above the test byte cap
+    /stream-big       1 MB body, no Content-Length (read until close)
+    /charset          HTML declaring an unknown charset
+    /etag             HTML with an ETag; 304 when If-None-Match matches
+    /pdf              non-HTML content
+"""
+import socket
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+BYTE_CAP = 10_000
+PAGE = b"<html><head><title>Stub</title></head><body><p>" + b"word " * 50 + b"</p></body></html>"
+ETAG = '"v1"'
+
+
+def article_html(n: int) -> bytes:
+    words = " ".join(f"w{(n * 7919 + i * 104729) % 5000}" for i in range(120))
+    return f"<html><head><title>Article {n}</title></head><body><p>{words}</p></body></html>".encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        # headers and body go out as separate writes; without this a reused
+        # connection stalls on delayed ACKs
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, body: bytes = b"", content_type: str = "text/html; charset=utf-8", headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _respond(self):
+        parts = urlsplit(self.path)
+        if parts.path == "/page":
+            time.sleep(float(parse_qs(parts.query).get("delay", ["0"])[0]))
+            self._send(200, PAGE)
+        elif parts.path.startswith("/article/"):
+            self._send(200, article_html(int(parts.path.rsplit("/", 1)[1])))
+        elif parts.path == "/big":
+            self._send(200, b"x" * (BYTE_CAP * 2))
+        elif parts.path == "/stream-big":
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            for _ in range(100):
+                self.wfile.write(b"x" * BYTE_CAP)
+            self.close_connection = True
+        elif parts.path == "/charset":
+            self._send(200, "<html><body>café</body></html>".encode("utf-8"),
+                       content_type="text/html; charset=utf8mb4x")
+        elif parts.path == "/etag":
+            if self.headers.get("If-None-Match") == ETAG:
+                self._send(304, headers={"ETag": ETAG})
+            else:
+                self._send(200, PAGE, headers={"ETag": ETAG})
+        elif parts.path == "/pdf":
+            self._send(200, b"%PDF-1.4", content_type="application/pdf")
+        else:
+            self._send(404, b"not found")
+
+    def do_GET(self):
+        server = self.server
+        host = self.headers.get("Host", "").split(":")[0]
+        first = not getattr(self, "_served", False)
+        self._served = True
+        with server.lock:
+            server.requests += 1
+            server.paths[urlsplit(self.path).path] += 1
+            server.connections.add(self.client_address)
+            server.active[host] += 1
+            server.active_total += 1
+            server.max_per_host[host] = max(server.max_per_host[host], server.active[host])
+            server.max_total = max(server.max_total, server.active_total)
+        try:
+            if first and server.handshake_delay:
+                time.sleep(server.handshake_delay)
+            self._respond()
+        finally:
+            with server.lock:
+                server.active[host] -= 1
+                server.active_total -= 1
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("", 0), _Handler)
+        self.lock = threading.Lock()
+        self.handshake_delay = 0.0
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.requests = 0
+            self.paths = Counter()
+            self.connections = set()
+            self.active, self.max_per_host = Counter(), Counter()
+            self.active_total = self.max_total = 0
+
+    def handle_error(self, request, client_address):
+        # clients drop oversized bodies mid-stream; anything else is a real failure
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+    def url(self, path: str, host: str = "127.0.0.1") -> str:
+        return f"http://{host}:{self.server_address[1]}{path}"
+
+
+@pytest.fixture(scope="session")
+def _stub_server():
+    server = StubServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def http_server(_stub_server):
+    _stub_server.reset()
+    _stub_server.handshake_delay = 0.0
+    return _stub_server
@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from researcher_agent.src import search
+from researcher_agent.src.agent import _batch_dedup_indexes
+from researcher_agent.src.fetch import FetchClient
+from researcher_agent.src.orchestrate import research_batch
+
+BYTE_CAP = 10_000   # matches the stub server's oversized routes
+
+
+@pytest.fixture
+def fixtures(tmp_path, monkeypatch):
+    """Point web_search at canned results: write(query -> [paths]) and return the server."""
+    monkeypatch.setattr(search, "_provider", None)
+    monkeypatch.setattr(search, "_cache", None)
+
+    def write(server, table):
+        path = tmp_path / "search.json"
+        path.write_text(json.dumps({q: [{"title": p, "href": server.url(p)} for p in paths]
+                                    for q, paths in table.items()}), encoding="utf-8")
+        search.configure_search(backend="file", fixtures=path)
+    return write
+
+
+def _batch(server, queries, **kwargs):
+    client = FetchClient(host_delay=0.0, max_bytes=BYTE_CAP, timeout=5)
+    return research_batch(queries, limit=10, take_first_n=10, fetch_workers=4, extract_workers=0,
+                          client=client, **kwargs)
+
+
+def test_shared_urls_are_fetched_once(http_server, fixtures):
+    fixtures(http_server, {"a": ["/article/1", "/article/2"], "b": ["/article/2", "/article/3"]})
+    bundles, stats = _batch(http_server, ["a", "b"])
+    assert stats["unique_urls"] == 3 and stats["fetches"] == 3
+    assert [len(b.articles) for b in bundles] == [2, 2]
+    assert bundles[0].articles[1] is bundles[1].articles[0]
+
+
+def test_bytes_downloaded_include_bodies_abandoned_at_the_cap(http_server, fixtures):
+    fixtures(http_server, {"a": ["/article/1", "/stream-big"]})
+    bundles, stats = _batch(http_server, ["a"])
+    assert [a.status for a in bundles[0].articles] == ["ok", "skipped"]
+    # the article page is ~1 KB; the rest was read from the capped body before giving up
+    assert stats["bytes_downloaded"] > BYTE_CAP
+
+
+def test_dedup_dir_marks_articles_seen_in_earlier_runs(http_server, fixtures, tmp_path):
+    fixtures(http_server, {"a": ["/article/1", "/article/2"], "b": ["/article/2", "/article/3"]})
+    dedup_dir = tmp_path / "dedup"
+    first, _ = _batch(http_server, ["a", "b"], dedup_indexes=_batch_dedup_indexes(dedup_dir, ["a", "b"]))
+    assert all(a.status == "ok" for bundle in first for a in bundle.articles)
+
+    fixtures(http_server, {"a": ["/article/1", "/article/4"], "b": ["/article/1", "/article/3"]})
+    second, stats = _batch(http_server, ["a", "b"], dedup_indexes=_batch_dedup_indexes(dedup_dir, ["a", "b"]))
+    statuses = [[a.status for a in bundle.articles] for bundle in second]
+    # /article/1 is new to topic "b" but known to "a"; /article/3 is known to "b" only
+    assert statuses == [["duplicate", "ok"], ["ok", "duplicate"]]
+    assert second[1].articles[0].text and stats["duplicates"]["cross_run"] == 2
+    assert second[0].articles[0].duplicate_of == http_server.url("/article/1")
@@ -0,0 +1,40 @@
+import json
+
+from researcher_agent.src import dedup
+from researcher_agent.src.dedup import DedupIndex, fingerprint
+
+TEXT = " ".join(f"word{i % 37} token{i % 11}" for i in range(200))
+
+
+def test_near_duplicates_share_a_fingerprint_band():
+    index = DedupIndex()
+    index.add(fingerprint(TEXT), "http://a/1")
+    assert index.lookup(fingerprint(TEXT + " extra trailing words here")) == "http://a/1"
+    assert fingerprint("too short") is None
+
+
+def test_index_round_trips_through_its_file(tmp_path):
+    index = DedupIndex.for_topic(tmp_path, "Electric Scooters!")
+    index.add(fingerprint(TEXT), "http://a/1")
+    index.save()
+    reloaded = DedupIndex.for_topic(tmp_path, "electric scooters")
+    assert len(reloaded) == 1
+    assert reloaded.lookup(fingerprint(TEXT)) == "http://a/1"
+
+
+def test_interrupted_save_keeps_previous_index(tmp_path, monkeypatch):
+    index = DedupIndex(tmp_path / "topic.json")
+    index.add(fingerprint(TEXT), "http://a/1")
+    index.save()
+    before = (tmp_path / "topic.json").read_text(encoding="utf-8")
+
+    def crash(src, dst):
+        raise OSError("disk full")
+    monkeypatch.setattr(dedup.os, "replace", crash)
+    index.add(fingerprint(TEXT.replace("word", "other")), "http://a/2")
+    try:
+        index.save()
+    except OSError:
+        pass
+    assert (tmp_path / "topic.json").read_text(encoding="utf-8") == before
+    assert len(json.loads(before)["entries"]) == 1
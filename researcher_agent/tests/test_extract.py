@@ -0,0 +1,42 @@
+from types import SimpleNamespace
+
+from researcher_agent.src.extract import _collect_meta, _top_image_no_download, parse_html
+
+PAGE = """<html><head>
+<meta property="og:image" content="/img/cover.jpg">
+</head><body><article><p>Text</p><img src="/img/inline.jpg"></article></body></html>"""
+
+
+class _Extractor:
+    """The two newspaper3k ContentExtractor lookups the fast profile uses."""
+
+    def __init__(self, meta_img="", first_img=""):
+        self.meta_img, self.first_img = meta_img, first_img
+
+    def get_meta_img_url(self, url, doc):
+        return self.meta_img
+
+    def get_first_img_url(self, url, top_node):
+        return self.first_img
+
+
+def _article(extractor, doc=True, top_node=True):
+    return SimpleNamespace(url="https://example.com/news/a.html", extractor=extractor,
+                           clean_doc=object() if doc else None, clean_top_node=object() if top_node else None)
+
+
+def test_prefers_newspapers_meta_image():
+    art = _article(_Extractor(meta_img="https://cdn.example.com/m.jpg", first_img="https://example.com/f.jpg"))
+    assert _top_image_no_download(art, {}) == "https://cdn.example.com/m.jpg"
+
+
+def test_falls_back_to_first_article_image():
+    art = _article(_Extractor(first_img="https://example.com/f.jpg"))
+    assert _top_image_no_download(art, {}) == "https://example.com/f.jpg"
+
+
+def test_falls_back_to_page_meta_when_newspaper_finds_nothing():
+    meta = _collect_meta(parse_html(PAGE))
+    art = _article(_Extractor(), doc=False, top_node=False)
+    assert _top_image_no_download(art, meta) == "https://example.com/img/cover.jpg"
+    assert _top_image_no_download(art, {}) is None
@@ -0,0 +1,94 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from researcher_agent.src.fetch import _CHUNK_SIZE, FetchClient
+
+BYTE_CAP = 10_000   # matches the stub server's oversized routes
+
+HOSTS = ("127.0.0.1", "127.0.0.2", "127.0.0.3")
+
+
+def _client(**kwargs) -> FetchClient:
+    options = dict(max_connections=16, per_host=2, host_delay=0.0, max_bytes=BYTE_CAP, timeout=5)
+    options.update(kwargs)
+    return FetchClient(**options)
+
+
+def test_fetch_returns_html(http_server):
+    html, err = _client().fetch(http_server.url("/page"))
+    assert err is None
+    assert "<title>Stub</title>" in html
+
+
+def test_non_html_is_skipped(http_server):
+    html, err = _client().fetch(http_server.url("/pdf"))
+    assert html is None and err == "Non-HTML content"
+
+
+def test_byte_cap_on_declared_length(http_server):
+    client = _client()
+    html, err = client.fetch(http_server.url("/big"))
+    assert html is None
+    assert err == f"Response exceeds {BYTE_CAP} bytes"
+    # Refused from the header: no body bytes were read
+    assert client.stats()["bytes"] == 0
+
+
+def test_byte_cap_on_streamed_body(http_server):
+    client = _client()
+    html, err = client.fetch(http_server.url("/stream-big"))
+    assert html is None
+    assert err == f"Response exceeds {BYTE_CAP} bytes"
+    # Reading stops within a chunk of the cap instead of taking the whole 1 MB body
+    assert BYTE_CAP < client.stats()["bytes"] <= BYTE_CAP + _CHUNK_SIZE
+
+
+def test_unknown_charset_falls_back_to_utf8(http_server):
+    html, err = _client().fetch(http_server.url("/charset"))
+    assert err is None
+    assert "café" in html
+
+
+def test_per_host_and_global_limits(http_server):
+    client = _client(max_connections=3, per_host=2)
+    urls = [http_server.url("/page?delay=0.1", host) for host in HOSTS for _ in range(4)]
+    with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+        results = list(pool.map(client.fetch, urls))
+    assert all(err is None for _, err in results)
+    assert max(http_server.max_per_host.values()) <= 2
+    assert 2 <= http_server.max_total <= 3
+
+
+def test_keep_alive_reuses_one_connection_per_host(http_server):
+    client = _client()
+    for _ in range(5):
+        assert client.fetch(http_server.url("/page"))[1] is None
+    assert http_server.requests == 5
+    assert len(http_server.connections) == 1
+
+
+def test_throughput_against_plain_requests_get(http_server):
+    """Each new connection costs 20 ms (handshake stand-in); the client pays it once per host."""
+    http_server.handshake_delay = 0.02
+    urls = [http_server.url("/page")] * 20
+
+    t0 = time.perf_counter()
+    for url in urls:
+        assert requests.get(url, timeout=5).status_code == 200
+    baseline = time.perf_counter() - t0
+    baseline_connections = len(http_server.connections)
+
+    http_server.reset()
+    client = _client()
+    t0 = time.perf_counter()
+    for url in urls:
+        assert client.fetch(url)[1] is None
+    pooled = time.perf_counter() - t0
+
+    print(f"\nrequests.get {len(urls) / baseline:.0f} pages/s, FetchClient {len(urls) / pooled:.0f} pages/s "
+          f"({baseline / pooled:.1f}x)")
+    assert baseline_connections == len(urls)
+    assert len(http_server.connections) == 1
+    assert pooled < baseline / 2
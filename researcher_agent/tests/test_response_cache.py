@@ -0,0 +1,60 @@
+from researcher_agent.src import cache as cache_module
+from researcher_agent.src.cache import ResponseCache, normalize_url
+from researcher_agent.src.fetch import FetchClient
+
+
+def _client(cache: ResponseCache) -> FetchClient:
+    return FetchClient(max_connections=4, per_host=2, host_delay=0.0, timeout=5, cache=cache)
+
+
+def test_normalize_url_is_canonical():
+    assert normalize_url("HTTP://Example.com:80/a?b=2&a=1#frag") == "http://example.com/a?a=1&b=2"
+    assert normalize_url("https://example.com") == "https://example.com/"
+
+
+def test_fresh_entry_skips_the_network(http_server, tmp_path):
+    client = _client(ResponseCache(tmp_path, ttl=3600))
+    first, _ = client.fetch(http_server.url("/page"))
+    second, err = client.fetch(http_server.url("/page"))
+    assert err is None and second == first
+    assert http_server.requests == 1
+    assert client.cache.stats()["hits"] == 1
+
+
+def test_stale_entry_is_revalidated_with_etag(http_server, tmp_path):
+    cache = ResponseCache(tmp_path, ttl=0)
+    client = _client(cache)
+    first, _ = client.fetch(http_server.url("/etag"))
+    second, err = client.fetch(http_server.url("/etag"))
+
+    assert err is None and second == first
+    assert http_server.paths["/etag"] == 2
+    stats = cache.stats()
+    assert stats["revalidated"] == 1
+    assert stats["stored"] == 1
+    assert stats["misses"] == 1
+
+
+def test_lru_eviction_keeps_cache_under_budget(tmp_path):
+    cache = ResponseCache(tmp_path, ttl=3600, max_bytes=250)
+    for i in range(3):
+        cache.put(f"http://example.com/{i}", "x" * 100, {"Content-Type": "text/html"})
+    stats = cache.stats()
+    assert stats["evicted"] == 1
+    assert stats["bytes"] <= 250
+    assert cache.get("http://example.com/0") is None
+    assert cache.get("http://example.com/2")["body"] == "x" * 100
+
+
+def test_refresh_replaces_metadata_atomically(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path, ttl=0)
+    cache.put("http://example.com/a", "body", {"ETag": '"v1"'})
+    writes = []
+    real_replace = cache_module.os.replace
+    monkeypatch.setattr(cache_module.os, "replace", lambda src, dst: (writes.append(dst), real_replace(src, dst)))
+
+    cache.refresh("http://example.com/a")
+    entry = cache.get("http://example.com/a")
+    assert writes == [tmp_path / f"{ResponseCache.key_for('http://example.com/a')}.json"]
+    assert entry["body"] == "body" and entry["headers"] == {"ETag": '"v1"'}
+    assert not list(tmp_path.glob("*.tmp"))
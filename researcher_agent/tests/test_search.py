@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from researcher_agent.src import search
+from researcher_agent.src.search import SearchCache, SearchProvider, web_search
+
+
+class CountingProvider(SearchProvider):
+    name = "counting"
+
+    def __init__(self, available: int):
+        self.available = available
+        self.calls = []
+
+    def search(self, query, region, max_results):
+        self.calls.append(max_results)
+        return [{"title": f"r{i}", "href": f"http://example.com/{i}", "body": ""}
+                for i in range(min(max_results, self.available))]
+
+
+def _search(provider, cache, max_results):
+    return web_search("Electric  Scooters", max_results=max_results, provider=provider, cache=cache)
+
+
+def test_provider_without_search_fails_on_creation():
+    class Incomplete(SearchProvider):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_larger_entry_answers_smaller_requests():
+    provider, cache = CountingProvider(available=20), SearchCache()
+    assert len(_search(provider, cache, 10)) == 10
+    assert len(_search(provider, cache, 5)) == 5
+    assert len(_search(provider, cache, 20)) == 20
+    assert provider.calls == [10, 20]
+    assert cache.stats() == {"hits": 1, "misses": 2}
+
+
+def test_exhausted_entry_answers_larger_requests():
+    provider, cache = CountingProvider(available=3), SearchCache()
+    assert len(_search(provider, cache, 10)) == 3
+    assert len(_search(provider, cache, 25)) == 3
+    assert provider.calls == [10]
+
+
+def test_empty_results_are_not_cached(tmp_path):
+    provider, cache = CountingProvider(available=0), SearchCache(tmp_path)
+    assert _search(provider, cache, 10) == []
+    assert _search(provider, cache, 5) == []
+    assert provider.calls == [10, 5]
+    assert not list(tmp_path.iterdir())
+
+    provider.available = 8
+    assert len(_search(provider, cache, 10)) == 8
+
+
+def test_empty_entry_left_by_earlier_versions_is_ignored(tmp_path):
+    cache = SearchCache(tmp_path)
+    key = cache._key("counting", "electric scooters", "wt-wt")
+    (tmp_path / f"{key}.json").write_text(json.dumps(
+        {"query": "electric scooters", "region": "wt-wt", "max_results": 10, "results": [], "stored_at": 1e12}))
+    assert cache.get("counting", "electric scooters", "wt-wt", 5) is None
+
+
+def test_entries_expire_and_persist(tmp_path, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(search.time, "time", lambda: clock[0])
+    provider = CountingProvider(available=10)
+    _search(provider, SearchCache(tmp_path, ttl=60), 5)
+
+    # A new cache on the same directory (a later run) reuses the entry within the TTL
+    assert len(_search(provider, SearchCache(tmp_path, ttl=60), 5)) == 5
+    assert provider.calls == [5]
+
+    clock[0] += 61
+    _search(provider, SearchCache(tmp_path, ttl=60), 5)
+    assert provider.calls == [5, 5]